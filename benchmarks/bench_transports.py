@@ -0,0 +1,239 @@
+"""Compare Socket Mode and HTTP (gunicorn pre-fork) serving under synthetic /ping load.
+
+Usage: uv run python -m benchmarks.bench_transports [--requests 2000] [--concurrency 16] [--workers 1 4]
+
+Both modes run the real ``create_app`` (middleware, dedupe claims in SQLite, listeners)
+with only ``auth.test`` patched out. Socket Mode envelopes are fed straight into Bolt's
+socket-mode dispatch on the SDK's default 10 listener threads per worker, so the
+WebSocket hop to Slack is not measured; HTTP requests are signed and sent over
+keep-alive loopback connections, so the numbers cover parsing, signature checks and
+gunicorn's scheduling but not Slack's network latency either.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import hmac
+import http.client
+import json
+import multiprocessing
+import os
+import socket
+import statistics
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from multiprocessing.synchronize import Event
+from queue import Queue
+from typing import Any
+from unittest.mock import patch
+from urllib.parse import urlencode
+
+from slack_bolt import App
+from slack_bolt.adapter.socket_mode.internals import run_bolt_app
+from slack_sdk.socket_mode.request import SocketModeRequest
+from slack_sdk.web import SlackResponse
+
+from src.app import create_app
+from src.config import TRANSPORT_HTTP, TRANSPORT_SOCKET, Settings
+from src.http_app import SLACK_EVENTS_PATH, run_http_app
+
+SIGNING_SECRET = "bench-secret"
+# slack_sdk's SocketModeClient runs listeners on a pool of this size by default.
+SOCKET_MODE_CONCURRENCY = 10
+
+_AUTH_RESPONSE = SlackResponse(
+    client=None,
+    http_verb="POST",
+    api_url="https://slack.com/api/auth.test",
+    req_args={},
+    data={"ok": True, "user_id": "UBENCH", "bot_id": "BBENCH", "team_id": "TBENCH"},
+    headers={},
+    status_code=200,
+)
+
+
+@dataclass(frozen=True)
+class Result:
+    mode: str
+    workers: int
+    requests: int
+    elapsed: float
+    latencies: list[float]
+
+    def row(self) -> str:
+        ordered = sorted(self.latencies)
+        p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+        return (
+            f"{self.mode:<8} {self.workers:>7} {self.requests:>8} {self.requests / self.elapsed:>10.0f} "
+            f"{statistics.median(ordered) * 1000:>8.2f} {p99 * 1000:>8.2f}"
+        )
+
+
+def _settings(data_dir: str, workers: int, transport: str, port: int = 8080) -> Settings:
+    return Settings(
+        slack_bot_token="xoxb-bench",
+        slack_app_token="xapp-bench",
+        slack_signing_secret=SIGNING_SECRET,
+        log_level="WARNING",
+        data_dir=data_dir,
+        healthcheck_port=port,
+        workers=workers,
+        transport=transport,
+    )
+
+
+def _offline_app(settings: Settings) -> App:
+    with patch("slack_sdk.web.client.WebClient.auth_test", return_value=_AUTH_RESPONSE):
+        return create_app(settings)
+
+
+def _ping_fields(trigger_id: str) -> dict[str, str]:
+    return {
+        "command": "/ping",
+        "text": "",
+        "user_id": "UUSER",
+        "channel_id": "CBENCH",
+        "team_id": "TBENCH",
+        "trigger_id": trigger_id,
+        "response_url": "https://hooks.slack.com/commands/TBENCH/1/bench",
+    }
+
+
+# ---------- Socket Mode ----------
+
+
+def _socket_worker(
+    settings: Settings, index: int, count: int, ready: Queue[int], go: Event, results: Queue[list[float]]
+) -> None:
+    app = _offline_app(settings)
+    envelopes = [
+        SocketModeRequest(type="slash_commands", envelope_id=f"env-{index}-{n}", payload=_ping_fields(f"s{index}.{n}"))
+        for n in range(count)
+    ]
+    ready.put(index)
+    go.wait()
+
+    def handle(envelope: SocketModeRequest) -> float:
+        start = time.perf_counter()
+        run_bolt_app(app, envelope)
+        return time.perf_counter() - start
+
+    with ThreadPoolExecutor(SOCKET_MODE_CONCURRENCY) as pool:
+        results.put(list(pool.map(handle, envelopes)))
+
+
+def bench_socket(workers: int, requests: int) -> Result:
+    """Every worker drains its share of envelopes, as Slack spreads them over open connections."""
+    context = multiprocessing.get_context("spawn")
+    ready: Queue[int] = context.Queue()  # type: ignore[assignment]
+    results: Queue[list[float]] = context.Queue()  # type: ignore[assignment]
+    go = context.Event()
+    with tempfile.TemporaryDirectory() as data_dir:
+        settings = _settings(data_dir, workers, TRANSPORT_SOCKET)
+        share = requests // workers
+        processes = [
+            context.Process(target=_socket_worker, args=(settings, index, share, ready, go, results))
+            for index in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        for _ in processes:
+            ready.get()
+        started = time.perf_counter()
+        go.set()
+        latencies = [latency for _ in processes for latency in results.get()]
+        elapsed = time.perf_counter() - started
+        for process in processes:
+            process.join()
+    return Result("socket", workers, len(latencies), elapsed, latencies)
+
+
+# ---------- HTTP ----------
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+def _wait_for_workers(port: int, workers: int, timeout: float = 30.0) -> None:
+    """Poll ``/stats`` until every gunicorn worker has built its App and answered once."""
+    seen: set[int] = set()
+    deadline = time.monotonic() + timeout
+    while len(seen) < workers:
+        if time.monotonic() > deadline:
+            msg = f"only {len(seen)} of {workers} HTTP workers came up"
+            raise RuntimeError(msg)
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1.0)
+            conn.request("GET", "/stats")
+            stats: dict[str, Any] = json.loads(conn.getresponse().read())
+            conn.close()
+            if "http_worker" in stats:
+                seen.add(stats["http_worker"]["pid"])
+        except OSError:
+            time.sleep(0.1)
+
+
+def bench_http(workers: int, requests: int, concurrency: int) -> Result:
+    context = multiprocessing.get_context("spawn")
+    port = _free_port()
+    with tempfile.TemporaryDirectory() as data_dir:
+        server = context.Process(
+            target=run_http_app, args=(_settings(data_dir, workers, TRANSPORT_HTTP, port), _offline_app)
+        )
+        server.start()
+        try:
+            _wait_for_workers(port, workers)
+            local = threading.local()
+            bodies = [urlencode(_ping_fields(f"h{n}")) for n in range(requests)]
+
+            def send(body: str) -> float:
+                if not hasattr(local, "conn"):
+                    local.conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10.0)
+                timestamp = str(int(time.time()))
+                digest = hmac.new(SIGNING_SECRET.encode(), f"v0:{timestamp}:{body}".encode(), hashlib.sha256)
+                headers = {
+                    "Content-Type": "application/x-www-form-urlencoded",
+                    "X-Slack-Request-Timestamp": timestamp,
+                    "X-Slack-Signature": f"v0={digest.hexdigest()}",
+                }
+                start = time.perf_counter()
+                local.conn.request("POST", SLACK_EVENTS_PATH, body, headers)
+                response = local.conn.getresponse()
+                response.read()
+                if response.status != 200:
+                    msg = f"unexpected status {response.status}"
+                    raise RuntimeError(msg)
+                return time.perf_counter() - start
+
+            started = time.perf_counter()
+            with ThreadPoolExecutor(concurrency) as pool:
+                latencies = list(pool.map(send, bodies))
+            elapsed = time.perf_counter() - started
+        finally:
+            server.terminate()
+            server.join(30)
+    return Result("http", workers, len(latencies), elapsed, latencies)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16, help="concurrent HTTP clients")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count() or 1])
+    args = parser.parse_args()
+
+    print(f"{'mode':<8} {'workers':>7} {'requests':>8} {'req/s':>10} {'p50 ms':>8} {'p99 ms':>8}")
+    for workers in dict.fromkeys(args.workers):
+        print(bench_socket(workers, args.requests).row(), flush=True)
+        print(bench_http(workers, args.requests, args.concurrency).row(), flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,41 @@
 from __future__ import annotations
 
-from pathlib import Path
+import asyncio
+import signal
+import sys
 
 from slack_bolt import App
 from slack_bolt.adapter.socket_mode import SocketModeHandler
 from slack_bolt.context.ack import Ack
 from slack_bolt.context.say import Say
 
+from src.bootstrap import (
+    create_archiver,
+    create_member_cache,
+    create_reminder_worker,
+    open_dooray_store,
+    open_event_deduplicator,
+    open_notice_store,
+    open_shared_pool,
+    start_singleton_jobs,
+)
 from src.clients.dooray_client import DoorayClient
 from src.commands.dooray import register_dooray_commands
 from src.commands.notice import register_notice_commands
-from src.config import Settings
+from src.config import RUNTIME_ASYNC, TRANSPORT_HTTP, Settings
+from src.events.channels import register_channel_events
 from src.events.home import register_home_events
+from src.events.users import register_user_events
 from src.healthcheck import start_healthcheck_server
 from src.logging_config import setup_logging
-from src.middleware import RequestLoggingMiddleware
+from src.middleware import DedupeMiddleware, RequestLoggingMiddleware
 from src.sentry_config import setup_sentry
+from src.services.event_dedupe import EventDeduplicator
+from src.services.leader_election import BackgroundJob
+from src.services.user_directory import UserDirectory
 from src.store.dooray_store import DoorayStore
 from src.store.notice_store import NoticeStore
+from src.workers import run_workers
 
 
 def create_app(
@@ -27,6 +45,7 @@ def create_app(
     notice_store: NoticeStore | None = None,
     dooray_client: DoorayClient | None = None,
     dooray_store: DoorayStore | None = None,
+    event_deduplicator: EventDeduplicator | None = None,
 ) -> App:
     setup_logging(log_level=settings.log_level, json_output=settings.log_json)
     setup_sentry(
@@ -35,15 +54,22 @@ def create_app(
         traces_sample_rate=settings.sentry_traces_sample_rate,
     )
 
-    data_dir = Path(settings.data_dir)
-
     app = App(
         token=settings.slack_bot_token,
         signing_secret=settings.slack_signing_secret,
         request_verification_enabled=request_verification_enabled,
     )
 
+    shared_pool = (
+        open_shared_pool(settings)
+        if notice_store is None or dooray_store is None or event_deduplicator is None
+        else None
+    )
+    if event_deduplicator is None:
+        event_deduplicator = open_event_deduplicator(settings, shared_pool)
+
     app.use(RequestLoggingMiddleware())
+    app.use(DedupeMiddleware(event_deduplicator))
 
     @app.command("/ping")
     def handle_ping(ack: Ack) -> None:
@@ -55,30 +81,64 @@ def create_app(
         say(text=f"<@{user}> 안녕하세요! 무엇을 도와드릴까요?")
 
     if notice_store is None:
-        data_dir.mkdir(parents=True, exist_ok=True)
-        notice_store = NoticeStore(data_dir / "notices.db")
-
-    register_notice_commands(app, notice_store)
-    register_home_events(app, notice_store)
+        notice_store = open_notice_store(settings, shared_pool)
+
+    user_directory = UserDirectory()
+    member_cache = create_member_cache()
+    reminder_worker = create_reminder_worker(settings, notice_store, app.client)
+    archiver = create_archiver(settings, notice_store)
+    singleton_jobs: list[BackgroundJob] = [archiver] if archiver is not None else []
+    if settings.workers > 1:
+        singleton_jobs.append(reminder_worker)
+    elif notice_store.list_active_reminder_jobs():
+        # Resume reminder runs interrupted by a restart.
+        reminder_worker.start()
+    start_singleton_jobs(settings, shared_pool, singleton_jobs)
+    register_notice_commands(app, notice_store, user_directory, member_cache, reminder_worker)
+    register_home_events(app, notice_store, user_directory, member_cache)
+    register_user_events(app, user_directory)
+    register_channel_events(app, member_cache)
 
     if settings.dooray_api_token and settings.dooray_project_id:
         if dooray_client is None:
             dooray_client = DoorayClient(settings.dooray_api_token)
         if dooray_store is None:
-            data_dir.mkdir(parents=True, exist_ok=True)
-            dooray_store = DoorayStore(data_dir / "dooray.db")
+            dooray_store = open_dooray_store(settings, shared_pool)
         register_dooray_commands(app, dooray_client, dooray_store, settings.dooray_project_id)
 
     return app
 
 
-def main() -> None:
-    settings = Settings.from_env()
+def serve(settings: Settings) -> None:
+    """Hold a Socket Mode connection with the configured runtime until the process is stopped."""
+    if settings.runtime == RUNTIME_ASYNC:
+        # Imported here so the sync runtime does not need aiohttp installed.
+        from src.async_app import run_async_app
+
+        asyncio.run(run_async_app(settings))
+        return
+    # Exit through SystemExit on SIGTERM so atexit hooks (e.g. response flushing) run.
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
     app = create_app(settings)
-    start_healthcheck_server(port=settings.healthcheck_port)
     handler = SocketModeHandler(app, settings.slack_app_token)
     handler.start()  # type: ignore[no-untyped-call]
 
 
+def main() -> None:
+    settings = Settings.from_env()
+    if settings.transport == TRANSPORT_HTTP:
+        # gunicorn forks the workers itself and serves the healthcheck on the same port.
+        # Imported here so Socket Mode does not need gunicorn installed.
+        from src.http_app import run_http_app
+
+        run_http_app(settings, create_app)
+        return
+    if settings.workers > 1:
+        run_workers(settings, serve)
+        return
+    start_healthcheck_server(port=settings.healthcheck_port)
+    serve(settings)
+
+
 if __name__ == "__main__":
     main()
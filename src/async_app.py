@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import asyncio
+import signal
+
+import structlog
+from slack_bolt.adapter.socket_mode.async_handler import AsyncSocketModeHandler
+from slack_bolt.async_app import AsyncApp
+from slack_bolt.context.ack.async_ack import AsyncAck
+from slack_bolt.context.say.async_say import AsyncSay
+from slack_sdk.web import WebClient
+
+from src.bootstrap import (
+    create_archiver,
+    create_member_cache,
+    create_reminder_worker,
+    open_dooray_store,
+    open_event_deduplicator,
+    open_notice_store,
+    open_shared_pool,
+    start_singleton_jobs,
+)
+from src.clients.dooray_client import AsyncDoorayClient
+from src.commands.async_dooray import register_async_dooray_commands
+from src.commands.async_notice import register_async_notice_commands
+from src.config import Settings
+from src.events.async_home import register_async_home_events
+from src.events.channels import register_async_channel_events
+from src.events.users import register_async_user_events
+from src.logging_config import setup_logging
+from src.middleware.async_middleware import AsyncDedupeMiddleware, AsyncRequestLoggingMiddleware
+from src.sentry_config import setup_sentry
+from src.services.async_notice_service import AsyncNoticeService
+from src.services.dooray_service import AsyncDoorayService
+from src.services.event_dedupe import EventDeduplicator
+from src.services.leader_election import BackgroundJob
+from src.services.user_directory import UserDirectory
+from src.store.async_notice_store import AsyncNoticeStore
+from src.store.dooray_store import DoorayStore
+from src.store.notice_store import NoticeStore
+
+logger = structlog.get_logger()
+
+
+def create_async_app(
+    settings: Settings,
+    *,
+    request_verification_enabled: bool = True,
+    notice_store: NoticeStore | None = None,
+    dooray_client: AsyncDoorayClient | None = None,
+    dooray_store: DoorayStore | None = None,
+    event_deduplicator: EventDeduplicator | None = None,
+) -> AsyncApp:
+    """Build the asyncio counterpart of :func:`src.app.create_app`.
+
+    Handlers await ``AsyncWebClient``, :class:`AsyncDoorayClient` and :class:`AsyncNoticeStore`,
+    so one event loop serves every request. The reminder worker and archiver keep their
+    own threads; the reminder worker sends DMs with a sync ``WebClient``.
+    """
+    setup_logging(log_level=settings.log_level, json_output=settings.log_json)
+    setup_sentry(
+        dsn=settings.sentry_dsn,
+        environment=settings.sentry_environment,
+        traces_sample_rate=settings.sentry_traces_sample_rate,
+    )
+
+    app = AsyncApp(
+        token=settings.slack_bot_token,
+        signing_secret=settings.slack_signing_secret,
+        request_verification_enabled=request_verification_enabled,
+    )
+
+    shared_pool = (
+        open_shared_pool(settings)
+        if notice_store is None or dooray_store is None or event_deduplicator is None
+        else None
+    )
+    if event_deduplicator is None:
+        event_deduplicator = open_event_deduplicator(settings, shared_pool)
+
+    app.use(AsyncRequestLoggingMiddleware())
+    app.use(AsyncDedupeMiddleware(event_deduplicator))
+
+    @app.command("/ping")
+    async def handle_ping(ack: AsyncAck) -> None:
+        await ack(text="pong :table_tennis_paddle_and_ball:")
+
+    @app.event("app_mention")
+    async def handle_app_mention(event: dict[str, object], say: AsyncSay) -> None:
+        user = event.get("user", "")
+        await say(text=f"<@{user}> 안녕하세요! 무엇을 도와드릴까요?")
+
+    if notice_store is None:
+        notice_store = open_notice_store(settings, shared_pool)
+    store = AsyncNoticeStore(notice_store)
+
+    user_directory = UserDirectory()
+    member_cache = create_member_cache()
+    reminder_worker = create_reminder_worker(settings, notice_store, WebClient(token=settings.slack_bot_token))
+    archiver = create_archiver(settings, notice_store)
+    # The reminder worker starts up front so queueing a reminder never waits for its startup recovery.
+    singleton_jobs: list[BackgroundJob] = [reminder_worker]
+    if archiver is not None:
+        singleton_jobs.append(archiver)
+    start_singleton_jobs(settings, shared_pool, singleton_jobs)
+    service = AsyncNoticeService(
+        store,
+        app.client,
+        reminder_worker=reminder_worker,
+        user_directory=user_directory,
+        member_cache=member_cache,
+    )
+    register_async_notice_commands(app, store, service)
+    register_async_home_events(app, store, service)
+    register_async_user_events(app, user_directory)
+    register_async_channel_events(app, member_cache)
+
+    if settings.dooray_api_token and settings.dooray_project_id:
+        if dooray_client is None:
+            dooray_client = AsyncDoorayClient(settings.dooray_api_token)
+        if dooray_store is None:
+            dooray_store = open_dooray_store(settings, shared_pool)
+        dooray_service = AsyncDoorayService(
+            dooray_client=dooray_client,
+            store=dooray_store,
+            default_project_id=settings.dooray_project_id,
+        )
+        register_async_dooray_commands(app, dooray_service)
+
+    return app
+
+
+async def run_async_app(settings: Settings) -> None:
+    """Serve Socket Mode on the running event loop until SIGTERM or SIGINT."""
+    app = create_async_app(settings)
+    handler = AsyncSocketModeHandler(app, settings.slack_app_token)
+    stopping = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, stopping.set)
+    await handler.connect_async()  # type: ignore[no-untyped-call]
+    logger.info("async_runtime_started")
+    try:
+        await stopping.wait()
+    finally:
+        await handler.close_async()  # type: ignore[no-untyped-call]
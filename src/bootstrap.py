@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import atexit
+from collections.abc import Sequence
+from dataclasses import asdict
+from pathlib import Path
+
+from slack_sdk.web import WebClient
+
+from src.commands.notice import report_reminder_job
+from src.config import STORAGE_UNIFIED, Settings
+from src.healthcheck import register_stats
+from src.services.channel_members import ChannelMemberCache
+from src.services.event_dedupe import EventDeduplicator
+from src.services.leader_election import DEFAULT_RENEW_INTERVAL, BackgroundJob, LeaderElector
+from src.services.notice_archiver import NoticeArchiver
+from src.services.reminder_dispatcher import ReminderDispatcher
+from src.services.reminder_worker import DEFAULT_POLL_INTERVAL, ReminderWorker
+from src.store.connection import ConnectionPool
+from src.store.dooray_store import DoorayStore
+from src.store.event_store import ProcessedEventStore
+from src.store.lease_store import LeaseStore
+from src.store.notice_cache import DEFAULT_MAX_NOTICES
+from src.store.notice_store import ARCHIVE_SCHEMA, NoticeStore
+
+# How often the leader's reminder worker looks for jobs queued by the other workers.
+LEADER_REMINDER_POLL_INTERVAL = 2.0
+
+
+def archive_path(settings: Settings) -> Path | None:
+    return Path(settings.data_dir) / "archive.db" if settings.archive_after_days > 0 else None
+
+
+def open_shared_pool(settings: Settings) -> ConnectionPool | None:
+    """Open the pool shared by every store in ``unified`` storage mode, else return ``None``."""
+    if settings.storage_mode != STORAGE_UNIFIED:
+        return None
+    # One connection pool for every schema: notices.db as main, the others attached.
+    data_dir = Path(settings.data_dir)
+    data_dir.mkdir(parents=True, exist_ok=True)
+    attach = {"dooray": data_dir / "dooray.db", "events": data_dir / "events.db"}
+    archive = archive_path(settings)
+    if archive is not None:
+        attach[ARCHIVE_SCHEMA] = archive
+    if settings.workers > 1:
+        attach["leases"] = data_dir / "leases.db"
+    return ConnectionPool(data_dir / "notices.db", attach=attach)
+
+
+def open_notice_store(settings: Settings, shared_pool: ConnectionPool | None) -> NoticeStore:
+    """Open ``notices.db`` as configured and expose its notice cache counters on ``/stats``.
+
+    With several workers the notice cache is off: another process may change a cached
+    notice at any time.
+    """
+    data_dir = Path(settings.data_dir)
+    data_dir.mkdir(parents=True, exist_ok=True)
+    flush_interval = settings.response_flush_interval_ms / 1000 if settings.response_flush_interval_ms > 0 else None
+    archive = archive_path(settings)
+    store = NoticeStore(
+        data_dir / "notices.db",
+        response_flush_interval=flush_interval,
+        notice_cache_size=DEFAULT_MAX_NOTICES if settings.workers == 1 else 0,
+        compact_responses=settings.compact_responses,
+        pool=shared_pool,
+        archive_path=archive if shared_pool is None else None,
+    )
+    # Commit buffered read/attendance responses before the process exits.
+    atexit.register(store.flush_responses)
+    register_stats("notice_cache", lambda: asdict(store.cache_stats()))
+    return store
+
+
+def create_archiver(settings: Settings, store: NoticeStore) -> NoticeArchiver | None:
+    if settings.archive_after_days <= 0:
+        return None
+    return NoticeArchiver(store, max_age=settings.archive_after_days * 86400)
+
+
+def open_dooray_store(settings: Settings, shared_pool: ConnectionPool | None) -> DoorayStore:
+    if shared_pool is not None:
+        return DoorayStore(pool=shared_pool, schema="dooray")
+    data_dir = Path(settings.data_dir)
+    data_dir.mkdir(parents=True, exist_ok=True)
+    return DoorayStore(data_dir / "dooray.db")
+
+
+def open_event_deduplicator(settings: Settings, shared_pool: ConnectionPool | None) -> EventDeduplicator:
+    """Back the redelivery cache with ``events.db`` and expose its counters on ``/stats``."""
+    if shared_pool is not None:
+        store = ProcessedEventStore(pool=shared_pool, schema="events")
+    else:
+        data_dir = Path(settings.data_dir)
+        data_dir.mkdir(parents=True, exist_ok=True)
+        store = ProcessedEventStore(data_dir / "events.db")
+    deduplicator = EventDeduplicator(store=store)
+    register_stats("event_dedupe", lambda: asdict(deduplicator.stats()))
+    return deduplicator
+
+
+def create_member_cache() -> ChannelMemberCache:
+    """Create this process's channel member cache and expose its counters on ``/stats``."""
+    cache = ChannelMemberCache()
+    register_stats("channel_members", lambda: asdict(cache.stats()))
+    return cache
+
+
+def create_reminder_worker(settings: Settings, store: NoticeStore, client: WebClient) -> ReminderWorker:
+    dispatcher = ReminderDispatcher(
+        max_workers=settings.reminder_workers,
+        rate_per_second=settings.reminder_rate_per_second,
+    )
+    single = settings.workers == 1
+    return ReminderWorker(
+        store,
+        client,
+        dispatcher,
+        # With several workers only the leader runs it, polling for jobs the others queued.
+        poll_interval=DEFAULT_POLL_INTERVAL if single else LEADER_REMINDER_POLL_INTERVAL,
+        on_job_finished=lambda job: report_reminder_job(client, job),
+        start_on_notify=single,
+    )
+
+
+def open_lease_store(settings: Settings, shared_pool: ConnectionPool | None) -> LeaseStore:
+    if shared_pool is not None:
+        return LeaseStore(pool=shared_pool, schema="leases")
+    data_dir = Path(settings.data_dir)
+    data_dir.mkdir(parents=True, exist_ok=True)
+    return LeaseStore(data_dir / "leases.db")
+
+
+def start_singleton_jobs(
+    settings: Settings, shared_pool: ConnectionPool | None, jobs: Sequence[BackgroundJob]
+) -> LeaderElector | None:
+    """Start ``jobs`` here, or with several workers only in the one holding the leader lease."""
+    if settings.workers == 1:
+        for job in jobs:
+            job.start()
+        return None
+    elector = LeaderElector(open_lease_store(settings, shared_pool), jobs)
+    elector.start()
+    # Hand the lease over on shutdown instead of leaving the jobs idle until it expires.
+    atexit.register(elector.stop, DEFAULT_RENEW_INTERVAL)
+    return elector
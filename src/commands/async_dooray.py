@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import structlog
+from slack_bolt.async_app import AsyncApp
+from slack_bolt.context.ack.async_ack import AsyncAck
+from slack_sdk.web.async_client import AsyncWebClient
+
+from src.commands.dooray import _parse_csv_input
+from src.services.dooray_service import AsyncDoorayService, DoorayServiceError, UserNotLinkedError
+from src.views.dooray_views import (
+    build_dooray_create_task_modal,
+    build_dooray_error_modal,
+    build_dooray_not_linked_modal,
+    build_dooray_result_modal,
+    build_dooray_setup_modal,
+    build_dooray_setup_select_modal,
+    build_dooray_task_list_modal,
+)
+
+logger = structlog.get_logger()
+
+
+def register_async_dooray_commands(app: AsyncApp, service: AsyncDoorayService) -> None:
+    """Asyncio counterpart of :func:`src.commands.dooray.register_dooray_commands`."""
+
+    @app.command("/내업무")
+    async def handle_my_tasks_command(ack: AsyncAck, body: dict[str, object], client: AsyncWebClient) -> None:
+        await ack()
+        trigger_id = str(body.get("trigger_id", ""))
+        try:
+            tasks = await service.get_my_tasks(str(body.get("user_id", "")))
+        except UserNotLinkedError:
+            await client.views_open(trigger_id=trigger_id, view=build_dooray_not_linked_modal())
+            return
+        except DoorayServiceError as e:
+            await client.views_open(trigger_id=trigger_id, view=build_dooray_error_modal(str(e)))
+            return
+        await client.views_open(trigger_id=trigger_id, view=build_dooray_task_list_modal(tasks))
+
+    @app.command("/새업무")
+    async def handle_create_task_command(ack: AsyncAck, body: dict[str, object], client: AsyncWebClient) -> None:
+        await ack()
+        try:
+            tags = await service.list_project_tags()
+        except Exception:
+            tags = None
+        modal = build_dooray_create_task_modal(tags=tags)
+        await client.views_open(trigger_id=str(body.get("trigger_id", "")), view=modal)
+
+    @app.command("/두레이연동")
+    async def handle_dooray_setup_command(ack: AsyncAck, body: dict[str, object], client: AsyncWebClient) -> None:
+        await ack()
+        await client.views_open(trigger_id=str(body.get("trigger_id", "")), view=build_dooray_setup_modal())
+
+    @app.view("dooray_create_task_modal")
+    async def handle_dooray_create_task_submission(
+        ack: AsyncAck, body: dict[str, object], view: dict[str, object]
+    ) -> None:
+        state: dict[str, object] = view.get("state", {})  # type: ignore[assignment]
+        values: dict[str, dict[str, dict[str, object]]] = state.get("values", {})  # type: ignore[assignment]
+        subject = str(values["subject_block"]["subject_input"].get("value", ""))
+        body_text = str(values["body_block"]["body_input"].get("value", "") or "")
+
+        tag_data = values["tag_block"]["tag_input"]
+        tag_selected: list[dict[str, object]] | None = tag_data.get("selected_options")  # type: ignore[assignment]
+        tag_ids: list[str] | None
+        if tag_selected:
+            tag_ids = [str(opt.get("value", "")) for opt in tag_selected]
+        else:
+            tag_raw = str(tag_data.get("value", "") or "")
+            tag_ids = _parse_csv_input(tag_raw) if tag_raw else None
+
+        due_date = str(values["due_date_block"]["due_date_input"].get("selected_date", "") or "")
+        user: dict[str, str] = body.get("user", {})  # type: ignore[assignment]
+
+        try:
+            task = await service.create_task(
+                subject=subject,
+                body=body_text,
+                slack_user_id=user.get("id", ""),
+                tag_ids=tag_ids,
+                due_date=due_date,
+            )
+        except DoorayServiceError as e:
+            await ack(response_action="update", view=build_dooray_error_modal(f"업무 생성 실패: {e}"))
+            return
+
+        await ack(
+            response_action="update",
+            view=build_dooray_result_modal(
+                "업무 생성 완료",
+                f"업무가 생성되었습니다.\n\n*{task.subject}*\nID: `{task.id}`",
+            ),
+        )
+
+    @app.view("dooray_setup_modal")
+    async def handle_dooray_setup_search(
+        ack: AsyncAck, body: dict[str, object], client: AsyncWebClient, view: dict[str, object]
+    ) -> None:
+        state: dict[str, object] = view.get("state", {})  # type: ignore[assignment]
+        values: dict[str, dict[str, dict[str, object]]] = state.get("values", {})  # type: ignore[assignment]
+        search_name = str(values["search_name_block"]["search_name_input"].get("value", ""))
+
+        try:
+            members = await service.search_members(search_name)
+        except DoorayServiceError as e:
+            await ack()
+            user: dict[str, str] = body.get("user", {})  # type: ignore[assignment]
+            await client.chat_postMessage(channel=user.get("id", ""), text=f"멤버 검색 실패: {e}")
+            return
+
+        await ack(response_action="update", view=build_dooray_setup_select_modal(members))
+
+    @app.view("dooray_setup_select_modal")
+    async def handle_dooray_setup_select(
+        ack: AsyncAck, body: dict[str, object], client: AsyncWebClient, view: dict[str, object]
+    ) -> None:
+        await ack()
+        state: dict[str, object] = view.get("state", {})  # type: ignore[assignment]
+        values: dict[str, dict[str, dict[str, object]]] = state.get("values", {})  # type: ignore[assignment]
+        selected: dict[str, object] = values["member_select_block"]["member_select_input"].get(  # type: ignore[assignment]
+            "selected_option", {}
+        )
+        member_id = str(selected.get("value", "")) if isinstance(selected, dict) else ""
+
+        user: dict[str, str] = body.get("user", {})  # type: ignore[assignment]
+        user_id = user.get("id", "")
+
+        if member_id:
+            await service.setup_user(user_id, member_id)
+            await client.chat_postMessage(
+                channel=user_id,
+                text=f"Dooray 계정이 연결되었습니다. (멤버 ID: `{member_id}`)",
+            )
@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import structlog
+from slack_bolt.async_app import AsyncApp
+from slack_bolt.context.ack.async_ack import AsyncAck
+from slack_sdk.web.async_client import AsyncWebClient
+
+from src.commands.notice import (
+    DELETE_MODAL_TITLE,
+    EDIT_MODAL_TITLE,
+    MODAL_LOAD_FAILED_TEXT,
+    NOTICE_CONFIRMED_TEXT,
+    SEARCH_PAGE_SIZE,
+    SEARCH_USAGE_TEXT,
+    STATUS_MODAL_TITLE,
+    attendance_recorded_text,
+    author_only_text,
+    notice_created_text,
+    notice_deleted_text,
+    notice_not_found_text,
+    remind_excludes_updated_text,
+)
+from src.events.async_home import _publish_home_tab
+from src.services.async_notice_service import AsyncNoticeService
+from src.store.async_notice_store import AsyncNoticeStore
+from src.store.models import AttendanceStatus, MeetingNotice
+from src.utils.listeners import action_id, action_value, body_channel_id, body_user_id
+from src.views.notice_views import (
+    build_edit_modal,
+    build_loading_modal,
+    build_meeting_notice_modal,
+    build_message_modal,
+    build_notice_create_modal,
+    build_notice_delete_confirm_modal,
+    build_notice_search_modal,
+    build_remind_exclude_modal,
+    build_status_modal,
+    parse_meeting_notice_form,
+    parse_notice_form,
+    parse_remind_exclude_form,
+    parse_search_page_value,
+)
+
+logger = structlog.get_logger()
+
+
+async def _send_feedback(client: AsyncWebClient, channel_id: str, user_id: str, text: str) -> None:
+    if channel_id:
+        await client.chat_postEphemeral(channel=channel_id, user=user_id, text=text)
+    else:
+        await client.chat_postMessage(channel=user_id, text=text)
+
+
+async def _open_modal_lazily(
+    client: AsyncWebClient,
+    trigger_id: str,
+    title: str,
+    build: Callable[[], Awaitable[dict[str, Any]]],
+) -> None:
+    """Asyncio counterpart of :func:`src.commands.notice._open_modal_lazily`."""
+    opened = await client.views_open(trigger_id=trigger_id, view=build_loading_modal(title))
+    view: dict[str, Any] = opened["view"]
+    try:
+        modal = await build()
+    except Exception:
+        logger.exception("notice_modal_build_failed", title=title)
+        modal = build_message_modal(title, MODAL_LOAD_FAILED_TEXT)
+    await client.views_update(view_id=view["id"], hash=view.get("hash"), view=modal)
+
+
+def register_async_notice_commands(app: AsyncApp, store: AsyncNoticeStore, service: AsyncNoticeService) -> None:
+    """Asyncio counterpart of :func:`src.commands.notice.register_notice_commands`."""
+
+    async def _search_modal(query: str, user_id: str, cursor: str | None = None, offset: int = 0) -> dict[str, Any]:
+        try:
+            page = await store.search_notices(query, limit=SEARCH_PAGE_SIZE, cursor=cursor)
+        except ValueError:
+            logger.warning("notice_search_invalid_cursor", user_id=user_id)
+            page = await store.search_notices(query, limit=SEARCH_PAGE_SIZE)
+        if page.prev_cursor is None:
+            offset = 0
+        return build_notice_search_modal(
+            query,
+            page.notices,
+            response_rates=await service.compute_response_rates(page.notices),
+            total_count=await store.count_search_results(query),
+            offset=offset,
+            page_size=SEARCH_PAGE_SIZE,
+            next_cursor=page.next_cursor,
+            prev_cursor=page.prev_cursor,
+            viewer_id=user_id,
+        )
+
+    @app.command("/공지")
+    async def handle_notice_create_command(ack: AsyncAck, body: dict[str, object], client: AsyncWebClient) -> None:
+        await ack()
+        view = build_notice_create_modal(str(body.get("channel_id", "")))
+        await client.views_open(trigger_id=str(body.get("trigger_id", "")), view=view)
+
+    @app.command("/정기회의")
+    async def handle_meeting_notice_command(ack: AsyncAck, body: dict[str, object], client: AsyncWebClient) -> None:
+        await ack()
+        view = build_meeting_notice_modal(str(body.get("channel_id", "")))
+        await client.views_open(trigger_id=str(body.get("trigger_id", "")), view=view)
+
+    @app.command("/공지검색")
+    async def handle_notice_search_command(ack: AsyncAck, body: dict[str, object], client: AsyncWebClient) -> None:
+        await ack()
+        query = str(body.get("text", "")).strip()
+        user_id = str(body.get("user_id", ""))
+        if not query:
+            await _send_feedback(client, str(body.get("channel_id", "")), user_id, SEARCH_USAGE_TEXT)
+            return
+        logger.info("notice_search_command", user_id=user_id, query_length=len(query))
+        trigger_id = str(body.get("trigger_id", ""))
+        await _open_modal_lazily(client, trigger_id, "공지 검색", lambda: _search_modal(query, user_id))
+
+    @app.action(re.compile(r"^notice_search_page_(prev|next)$"))
+    async def handle_notice_search_page(ack: AsyncAck, body: dict[str, object], client: AsyncWebClient) -> None:
+        await ack()
+        query, cursor, offset = parse_search_page_value(action_value(body))
+        user_id = body_user_id(body)
+        view: dict[str, str] = body.get("view") or {}  # type: ignore[assignment]
+        if view.get("type") == "home":
+            await _publish_home_tab(client, user_id, store, service, cursor, offset, query=query)
+            return
+        modal = await _search_modal(query, user_id, cursor, offset)
+        await client.views_update(view_id=view.get("id", ""), view=modal)
+
+    @app.action("notice_search_page_noop")
+    async def handle_notice_search_page_noop(ack: AsyncAck) -> None:
+        await ack()
+
+    @app.view("notice_create_modal")
+    async def handle_notice_create_submission(
+        ack: AsyncAck, body: dict[str, object], client: AsyncWebClient, view: dict[str, object]
+    ) -> None:
+        await ack()
+        form = parse_notice_form(view)
+        author_id = body_user_id(body)
+        notice = await service.create_and_post_notice(
+            title=form.title, content=form.content, channel_id=form.channel_id, author_id=author_id
+        )
+        await client.chat_postMessage(channel=author_id, text=notice_created_text(notice))
+
+    @app.view("meeting_notice_modal")
+    async def handle_meeting_notice_submission(
+        ack: AsyncAck, body: dict[str, object], client: AsyncWebClient, view: dict[str, object]
+    ) -> None:
+        await ack()
+        form = parse_meeting_notice_form(view)
+        author_id = body_user_id(body)
+        notice = await service.create_and_post_meeting_notice(
+            title=form.title,
+            channel_id=form.channel_id,
+            author_id=author_id,
+            meeting_datetime=form.meeting_datetime,
+            location=form.location,
+            agenda=form.agenda,
+        )
+        await client.chat_postMessage(channel=author_id, text=notice_created_text(notice))
+
+    @app.action(re.compile(r"^notice_confirm_(.+)$"))
+    async def handle_notice_confirm(ack: AsyncAck, body: dict[str, object], client: AsyncWebClient) -> None:
+        await ack()
+        match = re.match(r"^notice_confirm_(.+)$", action_id(body))
+        if not match:
+            return
+        user_id = body_user_id(body)
+        await service.mark_notice_read(match.group(1), user_id)
+        await client.chat_postEphemeral(channel=body_channel_id(body), user=user_id, text=NOTICE_CONFIRMED_TEXT)
+
+    @app.action(re.compile(r"^meeting_attend_(online|offline|absent)_(.+)$"))
+    async def handle_meeting_attendance(ack: AsyncAck, body: dict[str, object], client: AsyncWebClient) -> None:
+        await ack()
+        match = re.match(r"^meeting_attend_(online|offline|absent)_(.+)$", action_id(body))
+        if not match:
+            return
+        status = AttendanceStatus(match.group(1))
+        user_id = body_user_id(body)
+        await service.set_meeting_attendance(match.group(2), user_id, status)
+        await client.chat_postEphemeral(
+            channel=body_channel_id(body), user=user_id, text=attendance_recorded_text(status)
+        )
+
+    @app.action(re.compile(r"^notice_status_(.+)$"))
+    async def handle_notice_status_button(ack: AsyncAck, body: dict[str, object], client: AsyncWebClient) -> None:
+        await ack()
+        match = re.match(r"^notice_status_(.+)$", action_id(body))
+        if not match:
+            return
+        notice_id = match.group(1)
+
+        async def build() -> dict[str, Any]:
+            notice = await store.get_notice(notice_id)
+            if notice is None:
+                return build_message_modal(STATUS_MODAL_TITLE, notice_not_found_text(notice_id))
+            return build_status_modal(notice, await service.get_channel_members(notice.channel_id))
+
+        await _open_modal_lazily(client, str(body.get("trigger_id", "")), STATUS_MODAL_TITLE, build)
+
+    @app.action(re.compile(r"^notice_remind_(.+)$"))
+    async def handle_notice_remind_button(ack: AsyncAck, body: dict[str, object], client: AsyncWebClient) -> None:
+        await ack()
+        match = re.match(r"^notice_remind_(.+)$", action_id(body))
+        if not match:
+            return
+        notice_id = match.group(1)
+        user_id = body_user_id(body)
+        channel_id = body_channel_id(body)
+        notice = await store.get_notice(notice_id)
+        if notice is None:
+            await _send_feedback(client, channel_id, user_id, notice_not_found_text(notice_id))
+            return
+        # Delivery happens on the reminder worker; report_reminder_job posts the summary when it finishes.
+        if isinstance(notice, MeetingNotice):
+            await service.remind_meeting_non_responders(notice_id, requested_by=user_id, feedback_channel_id=channel_id)
+        else:
+            await service.remind_unread_users(notice_id, requested_by=user_id, feedback_channel_id=channel_id)
+
+    @app.action(re.compile(r"^notice_edit_(.+)$"))
+    async def handle_notice_edit_button(ack: AsyncAck, body: dict[str, object], client: AsyncWebClient) -> None:
+        await ack()
+        match = re.match(r"^notice_edit_(.+)$", action_id(body))
+        if not match:
+            return
+        notice_id = match.group(1)
+        user_id = body_user_id(body)
+
+        async def build() -> dict[str, Any]:
+            notice = await store.get_notice(notice_id)
+            if notice is None:
+                return build_message_modal(EDIT_MODAL_TITLE, notice_not_found_text(notice_id))
+            error = author_only_text(notice, user_id, "수정")
+            if error:
+                return build_message_modal(EDIT_MODAL_TITLE, error)
+            return build_edit_modal(notice)
+
+        await _open_modal_lazily(client, str(body.get("trigger_id", "")), EDIT_MODAL_TITLE, build)
+
+    @app.view("notice_edit_modal")
+    async def handle_notice_edit_submission(ack: AsyncAck, view: dict[str, object]) -> None:
+        await ack()
+        form = parse_notice_form(view)
+        await service.update_and_repost_notice(str(view.get("private_metadata", "")), form.title, form.content)
+
+    @app.view("meeting_notice_edit_modal")
+    async def handle_meeting_notice_edit_submission(ack: AsyncAck, view: dict[str, object]) -> None:
+        await ack()
+        form = parse_meeting_notice_form(view)
+        await service.update_and_repost_meeting_notice(
+            str(view.get("private_metadata", "")), form.title, form.meeting_datetime, form.location, form.agenda
+        )
+
+    @app.action(re.compile(r"^notice_delete_(.+)$"))
+    async def handle_notice_delete_button(ack: AsyncAck, body: dict[str, object], client: AsyncWebClient) -> None:
+        await ack()
+        match = re.match(r"^notice_delete_(.+)$", action_id(body))
+        if not match:
+            return
+        notice_id = match.group(1)
+        user_id = body_user_id(body)
+
+        async def build() -> dict[str, Any]:
+            notice = await store.get_notice(notice_id)
+            if notice is None:
+                return build_message_modal(DELETE_MODAL_TITLE, notice_not_found_text(notice_id))
+            error = author_only_text(notice, user_id, "삭제")
+            if error:
+                return build_message_modal(DELETE_MODAL_TITLE, error)
+            return build_notice_delete_confirm_modal(notice)
+
+        await _open_modal_lazily(client, str(body.get("trigger_id", "")), DELETE_MODAL_TITLE, build)
+
+    @app.view("notice_delete_confirm")
+    async def handle_notice_delete_confirm(
+        ack: AsyncAck, body: dict[str, object], client: AsyncWebClient, view: dict[str, object]
+    ) -> None:
+        await ack()
+        notice_id = str(view.get("private_metadata", ""))
+        user_id = body_user_id(body)
+        await service.delete_notice_message(notice_id)
+        await client.chat_postMessage(channel=user_id, text=notice_deleted_text(notice_id))
+        await _publish_home_tab(client, user_id, store, service)
+
+    @app.action("remind_exclude_manage")
+    async def handle_remind_exclude_manage(ack: AsyncAck, body: dict[str, object], client: AsyncWebClient) -> None:
+        await ack()
+        modal = build_remind_exclude_modal(await store.list_remind_excludes())
+        await client.views_open(trigger_id=str(body.get("trigger_id", "")), view=modal)
+
+    @app.view("remind_exclude_modal")
+    async def handle_remind_exclude_submission(
+        ack: AsyncAck, body: dict[str, object], client: AsyncWebClient, view: dict[str, object]
+    ) -> None:
+        await ack()
+        selected = parse_remind_exclude_form(view)
+        user_id = body_user_id(body)
+        await store.set_remind_excludes(selected)
+        await client.chat_postMessage(channel=user_id, text=remind_excludes_updated_text(len(set(selected))))
+        await _publish_home_tab(client, user_id, store, service)
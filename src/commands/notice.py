@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Callable
+from typing import Any
 
 import structlog
 from slack_bolt import App
@@ -8,22 +10,74 @@ from slack_bolt.context.ack import Ack
 from slack_sdk.web import WebClient
 
 from src.events.home import _publish_home_tab
+from src.services.channel_members import ChannelMemberCache
 from src.services.notice_service import NoticeService
-from src.store.models import AttendanceStatus, MeetingNotice
+from src.services.reminder_worker import ReminderWorker
+from src.services.user_directory import UserDirectory
+from src.store.models import AttendanceStatus, MeetingNotice, Notice, ReminderJob, ReminderKind
 from src.store.notice_store import NoticeStore
+from src.utils.listeners import ack_only, action_id, action_value, body_channel_id, body_user_id
 from src.views.notice_views import (
-    build_meeting_notice_edit_modal,
+    build_edit_modal,
+    build_loading_modal,
     build_meeting_notice_modal,
-    build_meeting_status_modal,
+    build_message_modal,
     build_notice_create_modal,
     build_notice_delete_confirm_modal,
-    build_notice_edit_modal,
-    build_notice_status_modal,
+    build_notice_search_modal,
     build_remind_exclude_modal,
+    build_status_modal,
+    parse_meeting_notice_form,
+    parse_notice_form,
+    parse_remind_exclude_form,
+    parse_search_page_value,
 )
 
 logger = structlog.get_logger()
 
+SEARCH_PAGE_SIZE = 5
+# The notice type is not known until the lookup, so the loading modal gets a neutral title.
+STATUS_MODAL_TITLE = "응답 현황"
+EDIT_MODAL_TITLE = "공지 수정"
+DELETE_MODAL_TITLE = "공지 삭제 확인"
+SEARCH_USAGE_TEXT = "사용법: `/공지검색 <검색어>`"
+NOTICE_CONFIRMED_TEXT = "공지를 확인했습니다."
+MODAL_LOAD_FAILED_TEXT = "내용을 불러오지 못했습니다. 잠시 후 다시 시도해 주세요."
+
+_STATUS_LABELS = {
+    AttendanceStatus.ONLINE: "온라인 참석",
+    AttendanceStatus.OFFLINE: "오프라인 참석",
+    AttendanceStatus.ABSENT: "불참",
+}
+
+
+def notice_not_found_text(notice_id: str) -> str:
+    return f"공지를 찾을 수 없습니다: `{notice_id}`"
+
+
+def author_only_text(notice: Notice, user_id: str, action: str) -> str | None:
+    """Return the feedback for ``user_id`` trying to ``action`` (수정/삭제) someone else's notice, or ``None``."""
+    if notice.author_id == user_id:
+        return None
+    return f"작성자만 공지를 {action}할 수 있습니다."
+
+
+def notice_created_text(notice: Notice) -> str:
+    label = "회의 공지" if isinstance(notice, MeetingNotice) else "공지"
+    return f"{label}가 등록되었습니다: *{notice.title}* (ID: `{notice.notice_id}`)"
+
+
+def attendance_recorded_text(status: AttendanceStatus) -> str:
+    return f"응답이 기록되었습니다: {_STATUS_LABELS[status]}"
+
+
+def notice_deleted_text(notice_id: str) -> str:
+    return f"공지 메시지가 삭제되었습니다. (ID: `{notice_id}`)"
+
+
+def remind_excludes_updated_text(count: int) -> str:
+    return f"리마인드 예외 목록이 업데이트되었습니다. ({count}명)"
+
 
 def _send_feedback(client: WebClient, channel_id: str, user_id: str, text: str) -> None:
     if channel_id:
@@ -32,7 +86,84 @@ def _send_feedback(client: WebClient, channel_id: str, user_id: str, text: str)
         client.chat_postMessage(channel=user_id, text=text)
 
 
-def register_notice_commands(app: App, store: NoticeStore) -> None:
+def report_reminder_job(client: WebClient, job: ReminderJob) -> None:
+    """Tell the requester how a finished reminder job went."""
+    label = "참석 여부" if job.kind == ReminderKind.NON_RESPONDERS else "읽음 확인"
+    text = f"{job.sent}명에게 {label} 리마인드를 보냈습니다."
+    if job.failed:
+        text += f" (실패 {job.failed}명)"
+    if job.requested_by:
+        _send_feedback(client, job.feedback_channel_id, job.requested_by, text)
+
+
+def _open_modal_lazily(
+    client: WebClient,
+    trigger_id: str,
+    title: str,
+    build: Callable[[], dict[str, Any]],
+) -> None:
+    """Open a loading modal with ``trigger_id`` first, then replace it with ``build()``.
+
+    A trigger id expires 3 seconds after the click, so it is spent before any Slack or
+    SQLite work that could outlast it.
+    """
+    opened = client.views_open(trigger_id=trigger_id, view=build_loading_modal(title))
+    view: dict[str, Any] = opened["view"]
+    try:
+        modal = build()
+    except Exception:
+        logger.exception("notice_modal_build_failed", title=title)
+        modal = build_message_modal(title, MODAL_LOAD_FAILED_TEXT)
+    client.views_update(view_id=view["id"], hash=view.get("hash"), view=modal)
+
+
+def register_notice_commands(
+    app: App,
+    store: NoticeStore,
+    user_directory: UserDirectory | None = None,
+    member_cache: ChannelMemberCache | None = None,
+    reminder_worker: ReminderWorker | None = None,
+) -> None:
+    if user_directory is None:
+        user_directory = UserDirectory()
+    if member_cache is None:
+        member_cache = ChannelMemberCache()
+
+    def _service(client: WebClient) -> NoticeService:
+        return NoticeService(
+            store,
+            client,
+            user_directory=user_directory,
+            member_cache=member_cache,
+            reminder_worker=reminder_worker,
+        )
+
+    def _search_modal(
+        client: WebClient,
+        query: str,
+        user_id: str,
+        cursor: str | None = None,
+        offset: int = 0,
+    ) -> dict[str, Any]:
+        try:
+            page = store.search_notices(query, limit=SEARCH_PAGE_SIZE, cursor=cursor)
+        except ValueError:
+            logger.warning("notice_search_invalid_cursor", user_id=user_id)
+            page = store.search_notices(query, limit=SEARCH_PAGE_SIZE)
+        if page.prev_cursor is None:
+            offset = 0
+        return build_notice_search_modal(
+            query,
+            page.notices,
+            response_rates=_service(client).compute_response_rates(page.notices),
+            total_count=store.count_search_results(query),
+            offset=offset,
+            page_size=SEARCH_PAGE_SIZE,
+            next_cursor=page.next_cursor,
+            prev_cursor=page.prev_cursor,
+            viewer_id=user_id,
+        )
+
     @app.command("/공지")
     def handle_notice_create_command(
         ack: Ack,
@@ -55,365 +186,276 @@ def register_notice_commands(app: App, store: NoticeStore) -> None:
         channel_id = str(body.get("channel_id", ""))
         client.views_open(trigger_id=trigger_id, view=build_meeting_notice_modal(channel_id))
 
-    @app.view("notice_create_modal")
-    def handle_notice_create_submission(
-        ack: Ack,
+    def handle_notice_search_command(
+        body: dict[str, object],
+        client: WebClient,
+    ) -> None:
+        query = str(body.get("text", "")).strip()
+        user_id = str(body.get("user_id", ""))
+        if not query:
+            _send_feedback(client, str(body.get("channel_id", "")), user_id, SEARCH_USAGE_TEXT)
+            return
+        trigger_id = str(body.get("trigger_id", ""))
+        logger.info("notice_search_command", user_id=user_id, query_length=len(query))
+        _open_modal_lazily(client, trigger_id, "공지 검색", lambda: _search_modal(client, query, user_id))
+
+    app.command("/공지검색")(ack=ack_only, lazy=[handle_notice_search_command])
+
+    def handle_notice_search_page(
         body: dict[str, object],
         client: WebClient,
-        view: dict[str, object],
     ) -> None:
+        query, cursor, offset = parse_search_page_value(action_value(body))
+        user_id = body_user_id(body)
+        view: dict[str, str] = body.get("view") or {}  # type: ignore[assignment]
+        if view.get("type") == "home":
+            _publish_home_tab(client, user_id, store, cursor, offset, service=_service(client), query=query)
+            return
+        client.views_update(view_id=view.get("id", ""), view=_search_modal(client, query, user_id, cursor, offset))
+
+    app.action(re.compile(r"^notice_search_page_(prev|next)$"))(ack=ack_only, lazy=[handle_notice_search_page])
+
+    @app.action("notice_search_page_noop")
+    def handle_notice_search_page_noop(ack: Ack) -> None:
         ack()
-        state: dict[str, object] = view.get("state", {})  # type: ignore[assignment]
-        values: dict[str, dict[str, dict[str, object]]] = state.get("values", {})  # type: ignore[assignment]
-        title = str(values["title_block"]["title_input"].get("value", ""))
-        content = str(values["content_block"]["content_input"].get("value", ""))
-        channel_id = str(values["channel_block"]["channel_input"].get("selected_channel", ""))
 
-        user: dict[str, str] = body.get("user", {})  # type: ignore[assignment]
-        author_id = user.get("id", "")
+    def handle_notice_create_submission(
+        body: dict[str, object],
+        client: WebClient,
+        view: dict[str, object],
+    ) -> None:
+        form = parse_notice_form(view)
+        author_id = body_user_id(body)
 
-        service = NoticeService(store, client)
+        service = _service(client)
         notice = service.create_and_post_notice(
-            title=title,
-            content=content,
-            channel_id=channel_id,
+            title=form.title,
+            content=form.content,
+            channel_id=form.channel_id,
             author_id=author_id,
         )
 
-        client.chat_postMessage(
-            channel=author_id,
-            text=f"공지가 등록되었습니다: *{notice.title}* (ID: `{notice.notice_id}`)",
-        )
+        client.chat_postMessage(channel=author_id, text=notice_created_text(notice))
+
+    app.view("notice_create_modal")(ack=ack_only, lazy=[handle_notice_create_submission])
 
-    @app.view("meeting_notice_modal")
     def handle_meeting_notice_submission(
-        ack: Ack,
         body: dict[str, object],
         client: WebClient,
         view: dict[str, object],
     ) -> None:
-        ack()
-        state: dict[str, object] = view.get("state", {})  # type: ignore[assignment]
-        values: dict[str, dict[str, dict[str, object]]] = state.get("values", {})  # type: ignore[assignment]
-        title = str(values["title_block"]["title_input"].get("value", ""))
-        meeting_datetime = str(values["datetime_block"]["datetime_input"].get("selected_date_time", ""))
-        location = str(values["location_block"]["location_input"].get("value", ""))
-        agenda = str(values["agenda_block"]["agenda_input"].get("value", ""))
-        channel_id = str(values["channel_block"]["channel_input"].get("selected_channel", ""))
-
-        user: dict[str, str] = body.get("user", {})  # type: ignore[assignment]
-        author_id = user.get("id", "")
-
-        service = NoticeService(store, client)
+        form = parse_meeting_notice_form(view)
+        author_id = body_user_id(body)
+
+        service = _service(client)
         notice = service.create_and_post_meeting_notice(
-            title=title,
-            channel_id=channel_id,
+            title=form.title,
+            channel_id=form.channel_id,
             author_id=author_id,
-            meeting_datetime=meeting_datetime,
-            location=location,
-            agenda=agenda,
+            meeting_datetime=form.meeting_datetime,
+            location=form.location,
+            agenda=form.agenda,
         )
 
-        client.chat_postMessage(
-            channel=author_id,
-            text=f"회의 공지가 등록되었습니다: *{notice.title}* (ID: `{notice.notice_id}`)",
-        )
+        client.chat_postMessage(channel=author_id, text=notice_created_text(notice))
+
+    app.view("meeting_notice_modal")(ack=ack_only, lazy=[handle_meeting_notice_submission])
 
-    @app.action(re.compile(r"^notice_confirm_(.+)$"))
     def handle_notice_confirm(
-        ack: Ack,
         body: dict[str, object],
         client: WebClient,
     ) -> None:
-        ack()
-        actions: list[dict[str, str]] = body.get("actions", [])  # type: ignore[assignment]
-        action_id = actions[0].get("action_id", "") if actions else ""
-        match = re.match(r"^notice_confirm_(.+)$", action_id)
+        match = re.match(r"^notice_confirm_(.+)$", action_id(body))
         if not match:
             return
 
-        notice_id = match.group(1)
-        user: dict[str, str] = body.get("user", {})  # type: ignore[assignment]
-        user_id = user.get("id", "")
-        channel: dict[str, str] = body.get("channel", {})  # type: ignore[assignment]
-        channel_id = channel.get("id", "")
-
-        service = NoticeService(store, client)
-        service.mark_notice_read(notice_id, user_id)
-
-        client.chat_postEphemeral(
-            channel=channel_id,
-            user=user_id,
-            text="공지를 확인했습니다.",
-        )
+        user_id = body_user_id(body)
+        _service(client).mark_notice_read(match.group(1), user_id)
+
+        client.chat_postEphemeral(channel=body_channel_id(body), user=user_id, text=NOTICE_CONFIRMED_TEXT)
+
+    app.action(re.compile(r"^notice_confirm_(.+)$"))(ack=ack_only, lazy=[handle_notice_confirm])
 
-    @app.action(re.compile(r"^meeting_attend_(online|offline|absent)_(.+)$"))
     def handle_meeting_attendance(
-        ack: Ack,
         body: dict[str, object],
         client: WebClient,
     ) -> None:
-        ack()
-        actions: list[dict[str, str]] = body.get("actions", [])  # type: ignore[assignment]
-        action_id = actions[0].get("action_id", "") if actions else ""
-        match = re.match(r"^meeting_attend_(online|offline|absent)_(.+)$", action_id)
+        match = re.match(r"^meeting_attend_(online|offline|absent)_(.+)$", action_id(body))
         if not match:
             return
 
-        status_str = match.group(1)
-        notice_id = match.group(2)
-        status = AttendanceStatus(status_str)
+        status = AttendanceStatus(match.group(1))
+        user_id = body_user_id(body)
+        _service(client).set_meeting_attendance(match.group(2), user_id, status)
 
-        user: dict[str, str] = body.get("user", {})  # type: ignore[assignment]
-        user_id = user.get("id", "")
-        channel: dict[str, str] = body.get("channel", {})  # type: ignore[assignment]
-        channel_id = channel.get("id", "")
+        client.chat_postEphemeral(channel=body_channel_id(body), user=user_id, text=attendance_recorded_text(status))
 
-        service = NoticeService(store, client)
-        service.set_meeting_attendance(notice_id, user_id, status)
+    app.action(re.compile(r"^meeting_attend_(online|offline|absent)_(.+)$"))(
+        ack=ack_only, lazy=[handle_meeting_attendance]
+    )
 
-        status_labels = {
-            AttendanceStatus.ONLINE: "온라인 참석",
-            AttendanceStatus.OFFLINE: "오프라인 참석",
-            AttendanceStatus.ABSENT: "불참",
-        }
-
-        client.chat_postEphemeral(
-            channel=channel_id,
-            user=user_id,
-            text=f"응답이 기록되었습니다: {status_labels[status]}",
-        )
-
-    @app.action(re.compile(r"^notice_status_(.+)$"))
     def handle_notice_status_button(
-        ack: Ack,
         body: dict[str, object],
         client: WebClient,
     ) -> None:
-        ack()
-        actions: list[dict[str, str]] = body.get("actions", [])  # type: ignore[assignment]
-        action_id = actions[0].get("action_id", "") if actions else ""
-        match = re.match(r"^notice_status_(.+)$", action_id)
+        match = re.match(r"^notice_status_(.+)$", action_id(body))
         if not match:
             return
 
         notice_id = match.group(1)
         trigger_id = str(body.get("trigger_id", ""))
-        user: dict[str, str] = body.get("user", {})  # type: ignore[assignment]
-        user_id = user.get("id", "")
-        channel: dict[str, str] = body.get("channel") or {}  # type: ignore[assignment]
-        channel_id = channel.get("id", "")
 
-        notice = store.get_notice(notice_id)
-        if notice is None:
-            _send_feedback(client, channel_id, user_id, f"공지를 찾을 수 없습니다: `{notice_id}`")
-            return
+        def build() -> dict[str, Any]:
+            notice = store.get_notice(notice_id)
+            if notice is None:
+                return build_message_modal(STATUS_MODAL_TITLE, notice_not_found_text(notice_id))
+            return build_status_modal(notice, _service(client).get_channel_members(notice.channel_id))
 
-        service = NoticeService(store, client)
-        members = service.get_channel_members(notice.channel_id)
-        if isinstance(notice, MeetingNotice):
-            modal = build_meeting_status_modal(notice, members)
-        else:
-            modal = build_notice_status_modal(notice, members)
+        _open_modal_lazily(client, trigger_id, STATUS_MODAL_TITLE, build)
 
-        client.views_open(trigger_id=trigger_id, view=modal)
+    app.action(re.compile(r"^notice_status_(.+)$"))(ack=ack_only, lazy=[handle_notice_status_button])
 
-    @app.action(re.compile(r"^notice_remind_(.+)$"))
     def handle_notice_remind_button(
-        ack: Ack,
         body: dict[str, object],
         client: WebClient,
     ) -> None:
-        ack()
-        actions: list[dict[str, str]] = body.get("actions", [])  # type: ignore[assignment]
-        action_id = actions[0].get("action_id", "") if actions else ""
-        match = re.match(r"^notice_remind_(.+)$", action_id)
+        match = re.match(r"^notice_remind_(.+)$", action_id(body))
         if not match:
             return
 
         notice_id = match.group(1)
-        user: dict[str, str] = body.get("user", {})  # type: ignore[assignment]
-        user_id = user.get("id", "")
-        channel: dict[str, str] = body.get("channel") or {}  # type: ignore[assignment]
-        channel_id = channel.get("id", "")
+        user_id = body_user_id(body)
+        channel_id = body_channel_id(body)
 
         notice = store.get_notice(notice_id)
         if notice is None:
-            _send_feedback(client, channel_id, user_id, f"공지를 찾을 수 없습니다: `{notice_id}`")
+            _send_feedback(client, channel_id, user_id, notice_not_found_text(notice_id))
             return
 
-        service = NoticeService(store, client)
+        service = _service(client)
+        # Delivery happens on the reminder worker; report_reminder_job posts the summary when it finishes.
         if isinstance(notice, MeetingNotice):
-            count = service.remind_meeting_non_responders(notice.notice_id)
-            _send_feedback(client, channel_id, user_id, f"{count}명에게 참석 여부 리마인드를 보냈습니다.")
+            service.remind_meeting_non_responders(
+                notice.notice_id, requested_by=user_id, feedback_channel_id=channel_id
+            )
         else:
-            count = service.remind_unread_users(notice.notice_id)
-            _send_feedback(client, channel_id, user_id, f"{count}명에게 읽음 확인 리마인드를 보냈습니다.")
+            service.remind_unread_users(notice.notice_id, requested_by=user_id, feedback_channel_id=channel_id)
+
+    app.action(re.compile(r"^notice_remind_(.+)$"))(ack=ack_only, lazy=[handle_notice_remind_button])
 
-    @app.action(re.compile(r"^notice_edit_(.+)$"))
     def handle_notice_edit_button(
-        ack: Ack,
         body: dict[str, object],
         client: WebClient,
     ) -> None:
-        ack()
-        actions: list[dict[str, str]] = body.get("actions", [])  # type: ignore[assignment]
-        action_id = actions[0].get("action_id", "") if actions else ""
-        match = re.match(r"^notice_edit_(.+)$", action_id)
+        match = re.match(r"^notice_edit_(.+)$", action_id(body))
         if not match:
             return
 
         notice_id = match.group(1)
-        trigger_id = str(body.get("trigger_id", ""))
-        user: dict[str, str] = body.get("user", {})  # type: ignore[assignment]
-        user_id = user.get("id", "")
-        channel: dict[str, str] = body.get("channel") or {}  # type: ignore[assignment]
-        channel_id = channel.get("id", "")
-
-        notice = store.get_notice(notice_id)
-        if notice is None:
-            _send_feedback(client, channel_id, user_id, f"공지를 찾을 수 없습니다: `{notice_id}`")
-            return
+        user_id = body_user_id(body)
 
-        if notice.author_id != user_id:
-            _send_feedback(client, channel_id, user_id, "작성자만 공지를 수정할 수 있습니다.")
-            return
+        def build() -> dict[str, Any]:
+            notice = store.get_notice(notice_id)
+            if notice is None:
+                return build_message_modal(EDIT_MODAL_TITLE, notice_not_found_text(notice_id))
+            error = author_only_text(notice, user_id, "수정")
+            if error:
+                return build_message_modal(EDIT_MODAL_TITLE, error)
+            return build_edit_modal(notice)
 
-        if isinstance(notice, MeetingNotice):
-            modal = build_meeting_notice_edit_modal(notice)
-        else:
-            modal = build_notice_edit_modal(notice)
+        _open_modal_lazily(client, str(body.get("trigger_id", "")), EDIT_MODAL_TITLE, build)
 
-        client.views_open(trigger_id=trigger_id, view=modal)
+    app.action(re.compile(r"^notice_edit_(.+)$"))(ack=ack_only, lazy=[handle_notice_edit_button])
 
-    @app.view("notice_edit_modal")
     def handle_notice_edit_submission(
-        ack: Ack,
         body: dict[str, object],
         client: WebClient,
         view: dict[str, object],
     ) -> None:
-        ack()
-        private_metadata = str(view.get("private_metadata", ""))
-        state: dict[str, object] = view.get("state", {})  # type: ignore[assignment]
-        values: dict[str, dict[str, dict[str, object]]] = state.get("values", {})  # type: ignore[assignment]
-        title = str(values["title_block"]["title_input"].get("value", ""))
-        content = str(values["content_block"]["content_input"].get("value", ""))
+        form = parse_notice_form(view)
+        _service(client).update_and_repost_notice(str(view.get("private_metadata", "")), form.title, form.content)
 
-        service = NoticeService(store, client)
-        service.update_and_repost_notice(private_metadata, title, content)
+    app.view("notice_edit_modal")(ack=ack_only, lazy=[handle_notice_edit_submission])
 
-    @app.view("meeting_notice_edit_modal")
     def handle_meeting_notice_edit_submission(
-        ack: Ack,
         body: dict[str, object],
         client: WebClient,
         view: dict[str, object],
     ) -> None:
-        ack()
-        private_metadata = str(view.get("private_metadata", ""))
-        state: dict[str, object] = view.get("state", {})  # type: ignore[assignment]
-        values: dict[str, dict[str, dict[str, object]]] = state.get("values", {})  # type: ignore[assignment]
-        title = str(values["title_block"]["title_input"].get("value", ""))
-        meeting_datetime = str(values["datetime_block"]["datetime_input"].get("selected_date_time", ""))
-        location = str(values["location_block"]["location_input"].get("value", ""))
-        agenda = str(values["agenda_block"]["agenda_input"].get("value", ""))
-
-        service = NoticeService(store, client)
-        service.update_and_repost_meeting_notice(private_metadata, title, meeting_datetime, location, agenda)
-
-    @app.action(re.compile(r"^notice_delete_(.+)$"))
+        form = parse_meeting_notice_form(view)
+        _service(client).update_and_repost_meeting_notice(
+            str(view.get("private_metadata", "")), form.title, form.meeting_datetime, form.location, form.agenda
+        )
+
+    app.view("meeting_notice_edit_modal")(ack=ack_only, lazy=[handle_meeting_notice_edit_submission])
+
     def handle_notice_delete_button(
-        ack: Ack,
         body: dict[str, object],
         client: WebClient,
     ) -> None:
-        ack()
-        actions: list[dict[str, str]] = body.get("actions", [])  # type: ignore[assignment]
-        action_id = actions[0].get("action_id", "") if actions else ""
-        match = re.match(r"^notice_delete_(.+)$", action_id)
+        match = re.match(r"^notice_delete_(.+)$", action_id(body))
         if not match:
             return
 
         notice_id = match.group(1)
-        trigger_id = str(body.get("trigger_id", ""))
-        user: dict[str, str] = body.get("user", {})  # type: ignore[assignment]
-        user_id = user.get("id", "")
-        channel: dict[str, str] = body.get("channel") or {}  # type: ignore[assignment]
-        channel_id = channel.get("id", "")
+        user_id = body_user_id(body)
 
-        notice = store.get_notice(notice_id)
-        if notice is None:
-            _send_feedback(client, channel_id, user_id, f"공지를 찾을 수 없습니다: `{notice_id}`")
-            return
+        def build() -> dict[str, Any]:
+            notice = store.get_notice(notice_id)
+            if notice is None:
+                return build_message_modal(DELETE_MODAL_TITLE, notice_not_found_text(notice_id))
+            error = author_only_text(notice, user_id, "삭제")
+            if error:
+                return build_message_modal(DELETE_MODAL_TITLE, error)
+            return build_notice_delete_confirm_modal(notice)
 
-        if notice.author_id != user_id:
-            _send_feedback(client, channel_id, user_id, "작성자만 공지를 삭제할 수 있습니다.")
-            return
+        _open_modal_lazily(client, str(body.get("trigger_id", "")), DELETE_MODAL_TITLE, build)
 
-        modal = build_notice_delete_confirm_modal(notice)
-        client.views_open(trigger_id=trigger_id, view=modal)
+    app.action(re.compile(r"^notice_delete_(.+)$"))(ack=ack_only, lazy=[handle_notice_delete_button])
 
-    @app.view("notice_delete_confirm")
     def handle_notice_delete_confirm(
-        ack: Ack,
         body: dict[str, object],
         client: WebClient,
         view: dict[str, object],
     ) -> None:
-        ack()
         notice_id = str(view.get("private_metadata", ""))
-        user: dict[str, str] = body.get("user", {})  # type: ignore[assignment]
-        user_id = user.get("id", "")
+        user_id = body_user_id(body)
 
-        service = NoticeService(store, client)
+        service = _service(client)
         service.delete_notice_message(notice_id)
 
-        client.chat_postMessage(
-            channel=user_id,
-            text=f"공지 메시지가 삭제되었습니다. (ID: `{notice_id}`)",
-        )
+        client.chat_postMessage(channel=user_id, text=notice_deleted_text(notice_id))
+
+        _publish_home_tab(client, user_id, store, service=service)
 
-        _publish_home_tab(client, user_id, store)
+    app.view("notice_delete_confirm")(ack=ack_only, lazy=[handle_notice_delete_confirm])
 
-    @app.action("remind_exclude_manage")
     def handle_remind_exclude_manage(
-        ack: Ack,
         body: dict[str, object],
         client: WebClient,
     ) -> None:
-        ack()
         trigger_id = str(body.get("trigger_id", ""))
-        excludes = store.list_remind_excludes()
-        modal = build_remind_exclude_modal(excludes)
-        client.views_open(trigger_id=trigger_id, view=modal)
+        client.views_open(trigger_id=trigger_id, view=build_remind_exclude_modal(store.list_remind_excludes()))
+
+    app.action("remind_exclude_manage")(ack=ack_only, lazy=[handle_remind_exclude_manage])
 
-    @app.view("remind_exclude_modal")
     def handle_remind_exclude_submission(
-        ack: Ack,
         body: dict[str, object],
         client: WebClient,
         view: dict[str, object],
     ) -> None:
-        ack()
-        state: dict[str, object] = view.get("state", {})  # type: ignore[assignment]
-        values: dict[str, dict[str, dict[str, object]]] = state.get("values", {})  # type: ignore[assignment]
-        selected: list[str] = values["exclude_block"]["remind_exclude_users"].get("selected_users", [])  # type: ignore[assignment]
-
-        user: dict[str, str] = body.get("user", {})  # type: ignore[assignment]
-        user_id = user.get("id", "")
+        new_set = set(parse_remind_exclude_form(view))
+        user_id = body_user_id(body)
 
         current = set(store.list_remind_excludes())
-        new_set = set(selected)
+        with store.transaction():
+            for uid in new_set - current:
+                store.add_remind_exclude(uid)
+            for uid in current - new_set:
+                store.remove_remind_exclude(uid)
 
-        for uid in new_set - current:
-            store.add_remind_exclude(uid)
-        for uid in current - new_set:
-            store.remove_remind_exclude(uid)
+        client.chat_postMessage(channel=user_id, text=remind_excludes_updated_text(len(new_set)))
 
-        client.chat_postMessage(
-            channel=user_id,
-            text=f"리마인드 예외 목록이 업데이트되었습니다. ({len(new_set)}명)",
-        )
+        _publish_home_tab(client, user_id, store, service=_service(client))
 
-        _publish_home_tab(client, user_id, store)
+    app.view("remind_exclude_modal")(ack=ack_only, lazy=[handle_remind_exclude_submission])
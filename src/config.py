@@ -5,6 +5,15 @@ from dataclasses import dataclass
 
 from dotenv import load_dotenv
 
+STORAGE_SEPARATE = "separate"
+STORAGE_UNIFIED = "unified"
+
+RUNTIME_SYNC = "sync"
+RUNTIME_ASYNC = "async"
+
+TRANSPORT_SOCKET = "socket"
+TRANSPORT_HTTP = "http"
+
 
 @dataclass(frozen=True)
 class Settings:
@@ -20,6 +29,15 @@ class Settings:
     dooray_project_id: str = ""
     healthcheck_port: int = 8080
     data_dir: str = "data"
+    reminder_workers: int = 4
+    reminder_rate_per_second: float = 4.0
+    response_flush_interval_ms: int = 50
+    compact_responses: bool = False
+    storage_mode: str = STORAGE_SEPARATE
+    archive_after_days: int = 0
+    runtime: str = RUNTIME_SYNC
+    workers: int = 1
+    transport: str = TRANSPORT_SOCKET
 
     @classmethod
     def from_env(cls) -> Settings:
@@ -36,11 +54,21 @@ class Settings:
         dooray_project_id = os.environ.get("DOORAY_PROJECT_ID", "")
         healthcheck_port = int(os.environ.get("HEALTHCHECK_PORT", "8080"))
         data_dir = os.environ.get("DATA_DIR", "data")
+        reminder_workers = int(os.environ.get("REMINDER_WORKERS", "4"))
+        reminder_rate_per_second = float(os.environ.get("REMINDER_RATE_PER_SECOND", "4.0"))
+        response_flush_interval_ms = int(os.environ.get("RESPONSE_FLUSH_INTERVAL_MS", "50"))
+        compact_responses = os.environ.get("COMPACT_RESPONSES", "false").lower() in ("true", "1", "yes")
+        storage_mode = os.environ.get("STORAGE_MODE", STORAGE_SEPARATE).lower()
+        archive_after_days = int(os.environ.get("ARCHIVE_AFTER_DAYS", "0"))
+        runtime = os.environ.get("RUNTIME", RUNTIME_SYNC).lower()
+        workers = int(os.environ.get("WORKERS", "1"))
+        transport = os.environ.get("TRANSPORT", TRANSPORT_SOCKET).lower()
 
         missing: list[str] = []
         if not slack_bot_token:
             missing.append("SLACK_BOT_TOKEN")
-        if not slack_app_token:
+        # The app-level token only opens Socket Mode connections.
+        if not slack_app_token and transport != TRANSPORT_HTTP:
             missing.append("SLACK_APP_TOKEN")
         if not slack_signing_secret:
             missing.append("SLACK_SIGNING_SECRET")
@@ -49,6 +77,26 @@ class Settings:
             msg = f"Missing required environment variables: {', '.join(missing)}"
             raise ValueError(msg)
 
+        if storage_mode not in (STORAGE_SEPARATE, STORAGE_UNIFIED):
+            msg = f"Invalid STORAGE_MODE: {storage_mode!r} (expected {STORAGE_SEPARATE!r} or {STORAGE_UNIFIED!r})"
+            raise ValueError(msg)
+
+        if runtime not in (RUNTIME_SYNC, RUNTIME_ASYNC):
+            msg = f"Invalid RUNTIME: {runtime!r} (expected {RUNTIME_SYNC!r} or {RUNTIME_ASYNC!r})"
+            raise ValueError(msg)
+
+        if workers < 1:
+            msg = f"Invalid WORKERS: {workers} (expected 1 or more)"
+            raise ValueError(msg)
+
+        if transport not in (TRANSPORT_SOCKET, TRANSPORT_HTTP):
+            msg = f"Invalid TRANSPORT: {transport!r} (expected {TRANSPORT_SOCKET!r} or {TRANSPORT_HTTP!r})"
+            raise ValueError(msg)
+
+        if transport == TRANSPORT_HTTP and runtime == RUNTIME_ASYNC:
+            msg = f"TRANSPORT={TRANSPORT_HTTP!r} runs the sync App in pre-fork workers; set RUNTIME={RUNTIME_SYNC!r}"
+            raise ValueError(msg)
+
         return cls(
             slack_bot_token=slack_bot_token,
             slack_app_token=slack_app_token,
@@ -62,4 +110,13 @@ class Settings:
             dooray_project_id=dooray_project_id,
             healthcheck_port=healthcheck_port,
             data_dir=data_dir,
+            reminder_workers=reminder_workers,
+            reminder_rate_per_second=reminder_rate_per_second,
+            response_flush_interval_ms=response_flush_interval_ms,
+            compact_responses=compact_responses,
+            storage_mode=storage_mode,
+            archive_after_days=archive_after_days,
+            runtime=runtime,
+            workers=workers,
+            transport=transport,
         )
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import re
+
+import structlog
+from slack_bolt.async_app import AsyncApp
+from slack_bolt.context.ack.async_ack import AsyncAck
+from slack_sdk.errors import SlackApiError
+from slack_sdk.web.async_client import AsyncWebClient
+
+from src.events.home import PAGE_SIZE
+from src.services.async_notice_service import AsyncNoticeService
+from src.store.async_notice_store import AsyncNoticeStore
+from src.utils.listeners import action_value, body_user_id
+from src.views.notice_views import (
+    build_home_tab_view,
+    build_meeting_notice_modal,
+    build_notice_create_modal,
+    parse_dashboard_page_value,
+)
+
+logger = structlog.get_logger()
+
+
+async def _publish_home_tab(
+    client: AsyncWebClient,
+    user_id: str,
+    store: AsyncNoticeStore,
+    service: AsyncNoticeService,
+    cursor: str | None = None,
+    offset: int = 0,
+    *,
+    query: str = "",
+) -> None:
+    try:
+        try:
+            if query:
+                page = await store.search_notices(query, limit=PAGE_SIZE, cursor=cursor)
+            else:
+                page = await store.list_notices_page(limit=PAGE_SIZE, cursor=cursor, with_responses=False)
+        except ValueError:
+            logger.warning("home_tab_invalid_cursor", user_id=user_id)
+            if query:
+                page = await store.search_notices(query, limit=PAGE_SIZE)
+            else:
+                page = await store.list_notices_page(limit=PAGE_SIZE, with_responses=False)
+        if page.prev_cursor is None:
+            offset = 0
+        total_count = await store.count_search_results(query) if query else await store.count_notices()
+
+        view = build_home_tab_view(
+            page.notices,
+            response_rates=await service.compute_response_rates(page.notices),
+            total_count=total_count,
+            offset=offset,
+            page_size=PAGE_SIZE,
+            next_cursor=page.next_cursor,
+            prev_cursor=page.prev_cursor,
+            viewer_id=user_id,
+            reminder_jobs=await store.list_active_reminder_jobs(),
+            search_query=query,
+        )
+        logger.info("home_tab_publishing", user_id=user_id, offset=offset, total=total_count)
+        await client.views_publish(user_id=user_id, view=view)
+    except SlackApiError:
+        logger.exception("home_tab_publish_failed", user_id=user_id)
+
+
+def register_async_home_events(app: AsyncApp, store: AsyncNoticeStore, service: AsyncNoticeService) -> None:
+    """Asyncio counterpart of :func:`src.events.home.register_home_events`."""
+
+    @app.event("app_home_opened")
+    async def handle_app_home_opened(event: dict[str, object], client: AsyncWebClient) -> None:
+        if event.get("tab") != "home":
+            return
+        user_id = str(event.get("user", ""))
+        if not user_id:
+            logger.warning("app_home_opened_empty_user_id")
+            return
+        await _publish_home_tab(client, user_id, store, service)
+
+    @app.action(re.compile(r"^dashboard_page_(prev|next|\d+)$"))
+    async def handle_dashboard_page(ack: AsyncAck, body: dict[str, object], client: AsyncWebClient) -> None:
+        await ack()
+        cursor, offset = parse_dashboard_page_value(action_value(body))
+        await _publish_home_tab(client, body_user_id(body), store, service, cursor, offset)
+
+    @app.action("dashboard_page_noop")
+    async def handle_dashboard_page_noop(ack: AsyncAck) -> None:
+        await ack()
+
+    @app.action("home_notice_search")
+    async def handle_home_notice_search(ack: AsyncAck, body: dict[str, object], client: AsyncWebClient) -> None:
+        await ack()
+        query = action_value(body).strip()
+        user_id = body_user_id(body)
+        logger.info("home_notice_search", user_id=user_id, query_length=len(query))
+        await _publish_home_tab(client, user_id, store, service, query=query)
+
+    @app.action("home_notice_search_clear")
+    async def handle_home_notice_search_clear(ack: AsyncAck, body: dict[str, object], client: AsyncWebClient) -> None:
+        await ack()
+        await _publish_home_tab(client, body_user_id(body), store, service)
+
+    @app.action("home_notice_create")
+    async def handle_home_notice_create(ack: AsyncAck, body: dict[str, object], client: AsyncWebClient) -> None:
+        await ack()
+        await client.views_open(trigger_id=str(body.get("trigger_id", "")), view=build_notice_create_modal())
+
+    @app.action("home_meeting_notice_create")
+    async def handle_home_meeting_notice_create(ack: AsyncAck, body: dict[str, object], client: AsyncWebClient) -> None:
+        await ack()
+        await client.views_open(trigger_id=str(body.get("trigger_id", "")), view=build_meeting_notice_modal())
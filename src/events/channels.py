@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import structlog
+from slack_bolt import App
+
+from src.services.channel_members import ChannelMemberCache
+
+if TYPE_CHECKING:
+    from slack_bolt.async_app import AsyncApp
+
+logger = structlog.get_logger()
+
+
+def register_channel_events(app: App, member_cache: ChannelMemberCache) -> None:
+    @app.event("member_joined_channel")
+    def handle_member_joined_channel(event: dict[str, Any]) -> None:
+        channel_id = str(event.get("channel", ""))
+        user_id = str(event.get("user", ""))
+        if channel_id and user_id:
+            member_cache.add_member(channel_id, user_id)
+            logger.debug("channel_member_cache_patched", channel_id=channel_id, joined=user_id)
+
+    @app.event("member_left_channel")
+    def handle_member_left_channel(event: dict[str, Any]) -> None:
+        channel_id = str(event.get("channel", ""))
+        user_id = str(event.get("user", ""))
+        if channel_id and user_id:
+            member_cache.remove_member(channel_id, user_id)
+            logger.debug("channel_member_cache_patched", channel_id=channel_id, left=user_id)
+
+
+def register_async_channel_events(app: AsyncApp, member_cache: ChannelMemberCache) -> None:
+    @app.event("member_joined_channel")
+    async def handle_member_joined_channel(event: dict[str, Any]) -> None:
+        channel_id = str(event.get("channel", ""))
+        user_id = str(event.get("user", ""))
+        if channel_id and user_id:
+            member_cache.add_member(channel_id, user_id)
+            logger.debug("channel_member_cache_patched", channel_id=channel_id, joined=user_id)
+
+    @app.event("member_left_channel")
+    async def handle_member_left_channel(event: dict[str, Any]) -> None:
+        channel_id = str(event.get("channel", ""))
+        user_id = str(event.get("user", ""))
+        if channel_id and user_id:
+            member_cache.remove_member(channel_id, user_id)
+            logger.debug("channel_member_cache_patched", channel_id=channel_id, left=user_id)
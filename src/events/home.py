@@ -8,12 +8,16 @@ from slack_bolt.context.ack import Ack
 from slack_sdk.errors import SlackApiError
 from slack_sdk.web import WebClient
 
+from src.services.channel_members import ChannelMemberCache
 from src.services.notice_service import NoticeService
+from src.services.user_directory import UserDirectory
 from src.store.notice_store import NoticeStore
+from src.utils.listeners import ack_only, action_value, body_user_id
 from src.views.notice_views import (
     build_home_tab_view,
     build_meeting_notice_modal,
     build_notice_create_modal,
+    parse_dashboard_page_value,
 )
 
 logger = structlog.get_logger()
@@ -25,13 +29,32 @@ def _publish_home_tab(
     client: WebClient,
     user_id: str,
     store: NoticeStore,
+    cursor: str | None = None,
     offset: int = 0,
+    *,
+    service: NoticeService | None = None,
+    query: str = "",
 ) -> None:
     try:
-        notices = store.list_notices(limit=PAGE_SIZE, offset=offset)
-        total_count = store.count_notices()
-
-        service = NoticeService(store, client)
+        try:
+            if query:
+                page = store.search_notices(query, limit=PAGE_SIZE, cursor=cursor)
+            else:
+                page = store.list_notices_page(limit=PAGE_SIZE, cursor=cursor, with_responses=False)
+        except ValueError:
+            logger.warning("home_tab_invalid_cursor", user_id=user_id)
+            if query:
+                page = store.search_notices(query, limit=PAGE_SIZE)
+            else:
+                page = store.list_notices_page(limit=PAGE_SIZE, with_responses=False)
+        if page.prev_cursor is None:
+            offset = 0
+        notices = page.notices
+        total_count = store.count_search_results(query) if query else store.count_notices()
+        reminder_jobs = store.list_active_reminder_jobs()
+
+        if service is None:
+            service = NoticeService(store, client)
         rates = service.compute_response_rates(notices)
 
         view = build_home_tab_view(
@@ -40,7 +63,11 @@ def _publish_home_tab(
             total_count=total_count,
             offset=offset,
             page_size=PAGE_SIZE,
+            next_cursor=page.next_cursor,
+            prev_cursor=page.prev_cursor,
             viewer_id=user_id,
+            reminder_jobs=reminder_jobs,
+            search_query=query,
         )
         logger.info("home_tab_publishing", user_id=user_id, offset=offset, total=total_count)
         client.views_publish(user_id=user_id, view=view)
@@ -48,8 +75,20 @@ def _publish_home_tab(
         logger.exception("home_tab_publish_failed", user_id=user_id)
 
 
-def register_home_events(app: App, store: NoticeStore) -> None:
-    @app.event("app_home_opened")
+def register_home_events(
+    app: App,
+    store: NoticeStore,
+    user_directory: UserDirectory | None = None,
+    member_cache: ChannelMemberCache | None = None,
+) -> None:
+    if user_directory is None:
+        user_directory = UserDirectory()
+    if member_cache is None:
+        member_cache = ChannelMemberCache()
+
+    def _service(client: WebClient) -> NoticeService:
+        return NoticeService(store, client, user_directory=user_directory, member_cache=member_cache)
+
     def handle_app_home_opened(
         event: dict[str, object],
         client: WebClient,
@@ -62,31 +101,46 @@ def register_home_events(app: App, store: NoticeStore) -> None:
             logger.warning("app_home_opened_empty_user_id")
             return
 
-        _publish_home_tab(client, user_id, store)
+        _publish_home_tab(client, user_id, store, service=_service(client))
+
+    app.event("app_home_opened")(ack=ack_only, lazy=[handle_app_home_opened])
 
-    @app.action(re.compile(r"^dashboard_page_(\d+)$"))
     def handle_dashboard_page(
-        ack: Ack,
         body: dict[str, object],
         client: WebClient,
     ) -> None:
-        ack()
-        actions: list[dict[str, str]] = body.get("actions", [])  # type: ignore[assignment]
-        action_id = actions[0].get("action_id", "") if actions else ""
-        match = re.match(r"^dashboard_page_(\d+)$", action_id)
-        if not match:
-            return
+        # Offset-based buttons from views published before cursor pagination fall back to the first page.
+        cursor, offset = parse_dashboard_page_value(action_value(body))
+
+        user_id = body_user_id(body)
 
-        offset = int(match.group(1))
-        user: dict[str, str] = body.get("user", {})  # type: ignore[assignment]
-        user_id = user.get("id", "")
+        _publish_home_tab(client, user_id, store, cursor, offset, service=_service(client))
 
-        _publish_home_tab(client, user_id, store, offset)
+    app.action(re.compile(r"^dashboard_page_(prev|next|\d+)$"))(ack=ack_only, lazy=[handle_dashboard_page])
 
     @app.action("dashboard_page_noop")
     def handle_dashboard_page_noop(ack: Ack) -> None:
         ack()
 
+    def handle_home_notice_search(
+        body: dict[str, object],
+        client: WebClient,
+    ) -> None:
+        query = action_value(body).strip()
+        user_id = body_user_id(body)
+        logger.info("home_notice_search", user_id=user_id, query_length=len(query))
+        _publish_home_tab(client, user_id, store, service=_service(client), query=query)
+
+    app.action("home_notice_search")(ack=ack_only, lazy=[handle_home_notice_search])
+
+    def handle_home_notice_search_clear(
+        body: dict[str, object],
+        client: WebClient,
+    ) -> None:
+        _publish_home_tab(client, body_user_id(body), store, service=_service(client))
+
+    app.action("home_notice_search_clear")(ack=ack_only, lazy=[handle_home_notice_search_clear])
+
     @app.action("home_notice_create")
     def handle_home_notice_create(
         ack: Ack,
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import structlog
+from slack_bolt import App
+
+from src.services.user_directory import UserDirectory
+
+if TYPE_CHECKING:
+    from slack_bolt.async_app import AsyncApp
+
+logger = structlog.get_logger()
+
+
+def register_user_events(app: App, user_directory: UserDirectory) -> None:
+    @app.event("user_change")
+    def handle_user_change(event: dict[str, Any]) -> None:
+        user: dict[str, Any] = event.get("user") or {}
+        user_directory.upsert(user)
+        logger.debug("user_directory_patched", event_type="user_change", user_id=user.get("id", ""))
+
+    @app.event("team_join")
+    def handle_team_join(event: dict[str, Any]) -> None:
+        user: dict[str, Any] = event.get("user") or {}
+        user_directory.upsert(user)
+        logger.debug("user_directory_patched", event_type="team_join", user_id=user.get("id", ""))
+
+
+def register_async_user_events(app: AsyncApp, user_directory: UserDirectory) -> None:
+    @app.event("user_change")
+    async def handle_user_change(event: dict[str, Any]) -> None:
+        user: dict[str, Any] = event.get("user") or {}
+        user_directory.upsert(user)
+        logger.debug("user_directory_patched", event_type="user_change", user_id=user.get("id", ""))
+
+    @app.event("team_join")
+    async def handle_team_join(event: dict[str, Any]) -> None:
+        user: dict[str, Any] = event.get("user") or {}
+        user_directory.upsert(user)
+        logger.debug("user_directory_patched", event_type="team_join", user_id=user.get("id", ""))
@@ -3,50 +3,77 @@ from __future__ import annotations
 import json
 import threading
 import time
+from collections.abc import Callable
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, HTTPServer
-from typing import Any, ClassVar
+from typing import Any
 
 import structlog
 
 logger = structlog.get_logger()
 
-# Module-level boot timestamp — set once when the server starts.
-_boot_time: float = 0.0
+# Module-level boot timestamp — set at import and reset when the standalone server starts.
+_boot_time: float = time.time()
+
+# Counters served on ``GET /stats``, keyed by component name.
+_stats_providers: dict[str, Callable[[], dict[str, Any]]] = {}
+
+
+def register_stats(name: str, provider: Callable[[], dict[str, Any]]) -> None:
+    """Expose ``provider()`` under ``name`` on ``GET /stats``; a later call replaces it."""
+    _stats_providers[name] = provider
+
+
+# ---------- routes ----------
+
+
+def _healthz() -> dict[str, Any]:
+    """Liveness probe — always OK if the process is running."""
+    uptime = time.time() - _boot_time
+    return {"status": "ok", "uptime_seconds": round(uptime, 1)}
+
+
+def _readyz() -> dict[str, Any]:
+    """Readiness probe — confirms the app can serve traffic."""
+    return {"status": "ready"}
+
+
+def collect_stats() -> dict[str, Any]:
+    """Runtime counters, e.g. how many redelivered requests were dropped."""
+    return {name: provider() for name, provider in _stats_providers.items()}
+
+
+_ROUTES: dict[str, Callable[[], dict[str, Any]]] = {
+    "/healthz": _healthz,
+    "/readyz": _readyz,
+    "/stats": collect_stats,
+}
+
+
+def health_response(path: str) -> dict[str, Any] | None:
+    """Return the JSON body for ``GET path``, or ``None`` if it is not a health route.
+
+    Shared by the standalone server and the HTTP serving mode, which mounts the same
+    routes next to the Slack endpoint.
+    """
+    route = _ROUTES.get(path)
+    return route() if route is not None else None
 
 
 class _HealthHandler(BaseHTTPRequestHandler):
-    """Minimal HTTP handler that responds to ``GET /healthz``."""
+    """Minimal HTTP handler that responds to ``GET /healthz``, ``/readyz`` and ``/stats``."""
 
     # Suppress default request logging (structlog handles it).
     def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
         return
 
-    # ---------- routes ----------
-
-    _routes: ClassVar[dict[str, str]] = {
-        "/healthz": "_handle_healthz",
-        "/readyz": "_handle_readyz",
-    }
-
     def do_GET(self) -> None:  # noqa: N802
-        handler_name = self._routes.get(self.path)
-        if handler_name is not None:
-            getattr(self, handler_name)()
+        body = health_response(self.path)
+        if body is not None:
+            self._respond(HTTPStatus.OK, body)
         else:
             self._respond(HTTPStatus.NOT_FOUND, {"error": "not found"})
 
-    # ---------- health / ready ----------
-
-    def _handle_healthz(self) -> None:
-        """Liveness probe — always OK if the process is running."""
-        uptime = time.time() - _boot_time
-        self._respond(HTTPStatus.OK, {"status": "ok", "uptime_seconds": round(uptime, 1)})
-
-    def _handle_readyz(self) -> None:
-        """Readiness probe — confirms the app can serve traffic."""
-        self._respond(HTTPStatus.OK, {"status": "ready"})
-
     # ---------- helpers ----------
 
     def _respond(self, status: HTTPStatus, body: dict[str, Any]) -> None:
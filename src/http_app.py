@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Callable, Iterable
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+
+import structlog
+from gunicorn.app.base import BaseApplication  # type: ignore[import-untyped]
+from slack_bolt import App
+from slack_bolt.adapter.wsgi import SlackRequestHandler
+
+from src.config import Settings
+from src.healthcheck import health_response, register_stats
+from src.logging_config import setup_logging
+
+if TYPE_CHECKING:
+    from _typeshed.wsgi import StartResponse, WSGIApplication, WSGIEnvironment
+
+logger = structlog.get_logger()
+
+SLACK_EVENTS_PATH = "/slack/events"
+# Request threads per worker process; Bolt acks first and runs listeners on its own pool.
+THREADS_PER_WORKER = 8
+# A worker that does not check in with the master for this long is killed and replaced.
+WORKER_TIMEOUT = 30
+GRACEFUL_TIMEOUT = 10
+
+AppFactory = Callable[[Settings], App]
+
+
+def _json_response(start_response: StartResponse, status: HTTPStatus, body: dict[str, Any]) -> Iterable[bytes]:
+    payload = json.dumps(body).encode()
+    start_response(
+        f"{status.value} {status.phrase}",
+        [("Content-Type", "application/json"), ("Content-Length", str(len(payload)))],
+    )
+    return [payload]
+
+
+def create_wsgi_app(app: App, *, path: str = SLACK_EVENTS_PATH) -> WSGIApplication:
+    """Serve Slack requests on ``POST path`` and the healthcheck routes on ``GET`` from one WSGI app.
+
+    Slack requests go through Bolt's WSGI handler, so the App's signing-secret
+    verification decides whether they are accepted.
+    """
+    slack_handler = SlackRequestHandler(app, path=path)
+
+    def wsgi_app(environ: WSGIEnvironment, start_response: StartResponse) -> Iterable[bytes]:
+        method = environ.get("REQUEST_METHOD", "GET")
+        request_path = environ.get("PATH_INFO", "/")
+        if request_path == path:
+            if method != "POST":
+                return _json_response(start_response, HTTPStatus.METHOD_NOT_ALLOWED, {"error": "method not allowed"})
+            return slack_handler(environ, start_response)
+        if method == "GET":
+            body = health_response(request_path)
+            if body is not None:
+                return _json_response(start_response, HTTPStatus.OK, body)
+        return _json_response(start_response, HTTPStatus.NOT_FOUND, {"error": "not found"})
+
+    return wsgi_app
+
+
+class SlackHTTPServer(BaseApplication):  # type: ignore[misc]
+    """Pre-fork gunicorn server running ``settings.workers`` processes of the Slack WSGI app.
+
+    The App is built in every worker after the fork rather than in the master, so no
+    SQLite connection or background thread crosses a fork; with several workers the
+    background jobs run in the leader only, as in Socket Mode.
+    """
+
+    def __init__(self, settings: Settings, app_factory: AppFactory) -> None:
+        self._settings = settings
+        self._app_factory = app_factory
+        super().__init__()
+
+    def load_config(self) -> None:
+        options: dict[str, Any] = {
+            "bind": f"0.0.0.0:{self._settings.healthcheck_port}",
+            "workers": self._settings.workers,
+            "worker_class": "gthread",
+            "threads": THREADS_PER_WORKER,
+            "timeout": WORKER_TIMEOUT,
+            "graceful_timeout": GRACEFUL_TIMEOUT,
+            "preload_app": False,
+            # RequestLoggingMiddleware already logs every Slack request.
+            "accesslog": None,
+            "loglevel": self._settings.log_level.lower(),
+        }
+        for key, value in options.items():
+            self.cfg.set(key, value)
+
+    def load(self) -> WSGIApplication:
+        app = self._app_factory(self._settings)
+        # /stats comes from whichever worker takes the request.
+        register_stats("http_worker", lambda: {"pid": os.getpid()})
+        logger.info("http_worker_started", pid=os.getpid())
+        return create_wsgi_app(app)
+
+
+def run_http_app(settings: Settings, app_factory: AppFactory) -> None:
+    """Serve the Events API and healthcheck routes on ``HEALTHCHECK_PORT`` until SIGTERM or SIGINT."""
+    setup_logging(log_level=settings.log_level, json_output=settings.log_json)
+    logger.info(
+        "http_server_starting",
+        port=settings.healthcheck_port,
+        workers=settings.workers,
+        threads=THREADS_PER_WORKER,
+    )
+    SlackHTTPServer(settings, app_factory).run()
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from src.middleware.dedupe_middleware import DedupeMiddleware
 from src.middleware.logging_middleware import RequestLoggingMiddleware
 
-__all__ = ["RequestLoggingMiddleware"]
+# The AsyncApp middlewares live in src.middleware.async_middleware, which needs aiohttp.
+__all__ = ["DedupeMiddleware", "RequestLoggingMiddleware"]
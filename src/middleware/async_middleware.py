@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+import structlog
+from slack_bolt.middleware.async_middleware import AsyncMiddleware
+from slack_bolt.request.async_request import AsyncBoltRequest
+from slack_bolt.response import BoltResponse
+
+from src.middleware.dedupe_middleware import retry_fields
+from src.middleware.logging_middleware import bind_request_context
+from src.services.event_dedupe import EventDeduplicator, delivery_key
+
+logger = structlog.get_logger()
+
+
+class AsyncRequestLoggingMiddleware(AsyncMiddleware):
+    """:class:`~src.middleware.RequestLoggingMiddleware` for ``AsyncApp``.
+
+    structlog contextvars are per task, so concurrent requests on one event loop keep
+    their own ``request_id``.
+    """
+
+    async def async_process(
+        self,
+        *,
+        req: AsyncBoltRequest,
+        resp: BoltResponse,
+        next: Callable[[], Awaitable[BoltResponse]],  # noqa: A002
+    ) -> BoltResponse | None:
+        bind_request_context(req.body)
+        logger.info("request_started")
+
+        try:
+            result = await next()
+        except Exception:
+            logger.exception("request_failed")
+            raise
+        else:
+            logger.info("request_completed")
+            return result
+
+
+class AsyncDedupeMiddleware(AsyncMiddleware):
+    """:class:`~src.middleware.DedupeMiddleware` for ``AsyncApp``; SQLite claims run off the event loop."""
+
+    def __init__(self, deduplicator: EventDeduplicator) -> None:
+        self._deduplicator = deduplicator
+
+    async def async_process(
+        self,
+        *,
+        req: AsyncBoltRequest,
+        resp: BoltResponse,
+        next: Callable[[], Awaitable[BoltResponse]],  # noqa: A002
+    ) -> BoltResponse | None:
+        key = delivery_key(req.body)
+        if key is None:
+            return await next()
+        if not await asyncio.to_thread(self._deduplicator.claim, key):
+            logger.info("duplicate_request_dropped", delivery_key=key, **retry_fields(req.headers))
+            return BoltResponse(status=200, body="")
+        try:
+            return await next()
+        except Exception:
+            await asyncio.to_thread(self._deduplicator.release, key)
+            raise
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+import structlog
+from slack_bolt.middleware import Middleware
+from slack_bolt.request import BoltRequest
+from slack_bolt.response import BoltResponse
+
+from src.services.event_dedupe import EventDeduplicator, delivery_key
+
+logger = structlog.get_logger()
+
+
+def retry_fields(headers: dict[str, Any]) -> dict[str, str]:
+    return {
+        "retry_num": next(iter(headers.get("x-slack-retry-num", [])), ""),
+        "retry_reason": next(iter(headers.get("x-slack-retry-reason", [])), ""),
+    }
+
+
+class DedupeMiddleware(Middleware):
+    """Bolt middleware that acks redelivered requests without running any listener.
+
+    Slack redelivers events and interactions it did not see acknowledged in time. The
+    first delivery of each ``event_id`` / ``trigger_id`` is claimed in ``deduplicator``;
+    later ones get an empty 200 so Slack stops retrying. A claim is released when the
+    listener chain raises, so a retry can still do the work.
+    """
+
+    def __init__(self, deduplicator: EventDeduplicator) -> None:
+        self._deduplicator = deduplicator
+
+    def process(
+        self,
+        *,
+        req: BoltRequest,
+        resp: BoltResponse,
+        next: Callable[[], BoltResponse],  # noqa: A002
+    ) -> BoltResponse | None:
+        key = delivery_key(req.body)
+        if key is None:
+            return next()
+        if not self._deduplicator.claim(key):
+            logger.info("duplicate_request_dropped", delivery_key=key, **retry_fields(req.headers))
+            return BoltResponse(status=200, body="")
+        try:
+            return next()
+        except Exception:
+            self._deduplicator.release(key)
+            raise
@@ -33,6 +33,24 @@ def _extract_context(body: dict[str, Any]) -> dict[str, str]:
     }
 
 
+def bind_request_context(body: Any) -> None:
+    request_id = str(uuid.uuid4())
+
+    ctx = _extract_context(body if isinstance(body, dict) else {})
+
+    # Bind to structlog contextvars — all subsequent log calls include these
+    structlog.contextvars.clear_contextvars()
+    structlog.contextvars.bind_contextvars(request_id=request_id, **ctx)
+
+    # Set Sentry scope so errors are tagged with the same context
+    scope = sentry_sdk.get_current_scope()
+    scope.set_tag("request_id", request_id)
+    scope.set_tag("command", ctx["command"])
+    scope.set_tag("event_type", ctx["event_type"])
+    if ctx["slack_user_id"]:
+        scope.set_user({"id": ctx["slack_user_id"]})
+
+
 class RequestLoggingMiddleware(Middleware):
     """Bolt middleware that binds request context to every log line.
 
@@ -51,22 +69,7 @@ class RequestLoggingMiddleware(Middleware):
         resp: BoltResponse,
         next: Callable[[], BoltResponse],  # noqa: A002
     ) -> BoltResponse | None:
-        request_id = str(uuid.uuid4())
-
-        ctx = _extract_context(req.body if isinstance(req.body, dict) else {})
-
-        # Bind to structlog contextvars — all subsequent log calls include these
-        structlog.contextvars.clear_contextvars()
-        structlog.contextvars.bind_contextvars(request_id=request_id, **ctx)
-
-        # Set Sentry scope so errors are tagged with the same context
-        scope = sentry_sdk.get_current_scope()
-        scope.set_tag("request_id", request_id)
-        scope.set_tag("command", ctx["command"])
-        scope.set_tag("event_type", ctx["event_type"])
-        if ctx["slack_user_id"]:
-            scope.set_user({"id": ctx["slack_user_id"]})
-
+        bind_request_context(req.body)
         logger.info("request_started")
 
         try:
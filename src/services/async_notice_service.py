@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import structlog
+from slack_sdk.errors import SlackApiError
+from slack_sdk.web.async_client import AsyncWebClient
+
+from src.services.channel_members import ChannelMemberCache
+from src.services.notice_service import (
+    MEMBER_PAGE_SIZE,
+    REMINDER_RESPONSE_TYPES,
+    build_reminder_text,
+    format_response_rate,
+    new_meeting_notice,
+    new_notice,
+)
+from src.services.reminder_worker import ReminderWorker
+from src.services.user_directory import UserDirectory
+from src.store.async_notice_store import AsyncNoticeStore
+from src.store.models import AttendanceStatus, MeetingNotice, Notice, ReminderJob, ReminderKind
+from src.views.notice_views import build_meeting_notice_message, build_notice_message
+
+logger = structlog.get_logger()
+
+
+class AsyncNoticeService:
+    """:class:`~src.services.notice_service.NoticeService` for the asyncio runtime.
+
+    Slack calls go through ``AsyncWebClient`` and store calls through
+    :class:`AsyncNoticeStore`. Reminder DMs are still sent by the thread-based
+    :class:`ReminderWorker`; this service only queues the jobs and wakes it up.
+    """
+
+    def __init__(
+        self,
+        store: AsyncNoticeStore,
+        client: AsyncWebClient,
+        *,
+        reminder_worker: ReminderWorker,
+        user_directory: UserDirectory | None = None,
+        member_cache: ChannelMemberCache | None = None,
+        member_page_size: int = MEMBER_PAGE_SIZE,
+    ) -> None:
+        self._store = store
+        self._client = client
+        self._reminder_worker = reminder_worker
+        self._user_directory = user_directory if user_directory is not None else UserDirectory()
+        self._member_cache = member_cache if member_cache is not None else ChannelMemberCache()
+        self._member_page_size = member_page_size
+
+    async def create_and_post_notice(self, *, title: str, content: str, channel_id: str, author_id: str) -> Notice:
+        notice = new_notice(title=title, content=content, channel_id=channel_id, author_id=author_id)
+        result = await self._client.chat_postMessage(channel=channel_id, **build_notice_message(notice))
+        notice.message_ts = result.get("ts", "")
+        await self._store.create_notice(notice)
+        return notice
+
+    async def create_and_post_meeting_notice(
+        self,
+        *,
+        title: str,
+        channel_id: str,
+        author_id: str,
+        meeting_datetime: str,
+        location: str,
+        agenda: str,
+    ) -> MeetingNotice:
+        notice = new_meeting_notice(
+            title=title,
+            channel_id=channel_id,
+            author_id=author_id,
+            meeting_datetime=meeting_datetime,
+            location=location,
+            agenda=agenda,
+        )
+        result = await self._client.chat_postMessage(channel=channel_id, **build_meeting_notice_message(notice))
+        notice.message_ts = result.get("ts", "")
+        await self._store.create_meeting_notice(notice)
+        return notice
+
+    async def update_and_repost_notice(self, notice_id: str, title: str, content: str) -> None:
+        await self._store.update_notice(notice_id, title, content)
+        notice = await self._store.get_notice(notice_id)
+        if notice is None:
+            return
+        await self._client.chat_update(channel=notice.channel_id, ts=notice.message_ts, **build_notice_message(notice))
+
+    async def update_and_repost_meeting_notice(
+        self, notice_id: str, title: str, meeting_datetime: str, location: str, agenda: str
+    ) -> None:
+        await self._store.update_meeting_notice(notice_id, title, meeting_datetime, location, agenda)
+        notice = await self._store.get_notice(notice_id)
+        if notice is None or not isinstance(notice, MeetingNotice):
+            return
+        msg = build_meeting_notice_message(notice)
+        await self._client.chat_update(channel=notice.channel_id, ts=notice.message_ts, **msg)
+
+    async def delete_notice_message(self, notice_id: str) -> bool:
+        notice = await self._store.get_notice(notice_id)
+        if notice is None or not notice.message_ts:
+            return False
+        await self._client.chat_delete(channel=notice.channel_id, ts=notice.message_ts)
+        await self._store.update_message_ts(notice_id, "")
+        return True
+
+    async def compute_response_rates(self, notices: list[Notice | MeetingNotice]) -> dict[str, str]:
+        channel_members: dict[str, int] = {}
+        rates: dict[str, str] = {}
+        counts = await self._store.count_responses([notice.notice_id for notice in notices])
+
+        for notice in notices:
+            if notice.channel_id not in channel_members:
+                try:
+                    channel_members[notice.channel_id] = len(await self.get_channel_members(notice.channel_id))
+                except SlackApiError:
+                    logger.warning("channel_members_fetch_failed", channel_id=notice.channel_id)
+                    channel_members[notice.channel_id] = 0
+            rates[notice.notice_id] = format_response_rate(
+                notice, counts.get(notice.notice_id, {}), channel_members[notice.channel_id]
+            )
+
+        return rates
+
+    async def mark_notice_read(self, notice_id: str, user_id: str) -> bool:
+        if await self._store.get_notice(notice_id) is None:
+            return False
+        await self._store.mark_read(notice_id, user_id)
+        return True
+
+    async def set_meeting_attendance(self, notice_id: str, user_id: str, status: AttendanceStatus) -> bool:
+        notice = await self._store.get_notice(notice_id)
+        if notice is None or not isinstance(notice, MeetingNotice):
+            return False
+        await self._store.set_attendance(notice_id, user_id, status)
+        return True
+
+    async def get_channel_members(self, channel_id: str) -> list[str]:
+        channel_ids = await self._member_cache.get_or_load_async(
+            channel_id, lambda: self.fetch_channel_members(channel_id)
+        )
+        if not channel_ids:
+            return []
+        return await self._user_directory.filter_humans_async(self._client, channel_ids)
+
+    async def fetch_channel_members(self, channel_id: str) -> list[str]:
+        """Return every member id of ``channel_id``, following ``conversations.members`` cursors."""
+        members: list[str] = []
+        cursor = ""
+        while True:
+            result = await self._client.conversations_members(
+                channel=channel_id, limit=self._member_page_size, cursor=cursor or None
+            )
+            members.extend(result.get("members", []))
+            metadata: dict[str, str] = result.get("response_metadata") or {}
+            cursor = metadata.get("next_cursor") or ""
+            if not cursor:
+                return members
+
+    async def remind_unread_users(
+        self, notice_id: str, *, requested_by: str = "", feedback_channel_id: str = ""
+    ) -> ReminderJob | None:
+        """Queue reminder DMs for channel members who have not read the notice."""
+        notice = await self._store.get_notice(notice_id)
+        if notice is None:
+            return None
+        return await self._enqueue_reminders(
+            notice, ReminderKind.UNREAD, requested_by=requested_by, feedback_channel_id=feedback_channel_id
+        )
+
+    async def remind_meeting_non_responders(
+        self, notice_id: str, *, requested_by: str = "", feedback_channel_id: str = ""
+    ) -> ReminderJob | None:
+        """Queue reminder DMs for channel members who have not answered the meeting notice."""
+        notice = await self._store.get_notice(notice_id)
+        if notice is None or not isinstance(notice, MeetingNotice):
+            return None
+        return await self._enqueue_reminders(
+            notice, ReminderKind.NON_RESPONDERS, requested_by=requested_by, feedback_channel_id=feedback_channel_id
+        )
+
+    async def _enqueue_reminders(
+        self, notice: Notice, kind: ReminderKind, *, requested_by: str, feedback_channel_id: str
+    ) -> ReminderJob:
+        members = await self.get_channel_members(notice.channel_id)
+        excludes = set(await self._store.list_remind_excludes())
+        pending = await self._store.members_without_response(notice.notice_id, members, REMINDER_RESPONSE_TYPES[kind])
+        job = await self._store.create_reminder_job(
+            notice_id=notice.notice_id,
+            kind=kind,
+            text=build_reminder_text(notice, kind),
+            requested_by=requested_by,
+            feedback_channel_id=feedback_channel_id,
+            user_ids=[m for m in pending if m not in excludes],
+        )
+        logger.info("reminder_job_queued", job_id=job.job_id, notice_id=notice.notice_id, total=job.total)
+        self._reminder_worker.notify()
+        return job
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+
+import structlog
+
+logger = structlog.get_logger()
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    revalidations: int
+    evictions: int
+    size: int
+
+
+@dataclass
+class _Entry:
+    members: dict[str, None]
+    fetched_at: float
+
+
+class ChannelMemberCache:
+    """LRU cache of channel member ids keyed by channel id.
+
+    Entries are filled lazily by :meth:`get_or_load`, patched from
+    ``member_joined_channel`` / ``member_left_channel`` events, and reloaded once they
+    are older than ``ttl_seconds`` so missed events cannot drift the cache forever.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_channels: int = 256,
+        ttl_seconds: float = 600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_channels = max_channels
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._revalidations = 0
+        self._evictions = 0
+
+    def get_or_load(self, channel_id: str, loader: Callable[[], Iterable[str]]) -> list[str]:
+        """Return the cached members of ``channel_id``, calling ``loader`` on a miss or expiry."""
+        cached = self._lookup(channel_id)
+        if cached is not None:
+            return cached
+        return self._fill(channel_id, loader())
+
+    async def get_or_load_async(self, channel_id: str, loader: Callable[[], Awaitable[Iterable[str]]]) -> list[str]:
+        """:meth:`get_or_load` with an awaitable ``loader``, for the asyncio runtime."""
+        cached = self._lookup(channel_id)
+        if cached is not None:
+            return cached
+        return self._fill(channel_id, await loader())
+
+    def _lookup(self, channel_id: str) -> list[str] | None:
+        with self._lock:
+            entry = self._entries.get(channel_id)
+            if entry is not None and self._clock() - entry.fetched_at < self._ttl_seconds:
+                self._entries.move_to_end(channel_id)
+                self._hits += 1
+                return list(entry.members)
+            if entry is None:
+                self._misses += 1
+            else:
+                self._revalidations += 1
+        return None
+
+    def _fill(self, channel_id: str, loaded: Iterable[str]) -> list[str]:
+        members = dict.fromkeys(loaded)
+        with self._lock:
+            self._entries[channel_id] = _Entry(members=members, fetched_at=self._clock())
+            self._entries.move_to_end(channel_id)
+            while len(self._entries) > self._max_channels:
+                evicted, _ = self._entries.popitem(last=False)
+                self._evictions += 1
+                logger.debug("channel_member_cache_evicted", channel_id=evicted)
+        return list(members)
+
+    def add_member(self, channel_id: str, user_id: str) -> None:
+        with self._lock:
+            entry = self._entries.get(channel_id)
+            if entry is not None:
+                entry.members[user_id] = None
+
+    def remove_member(self, channel_id: str, user_id: str) -> None:
+        with self._lock:
+            entry = self._entries.get(channel_id)
+            if entry is not None:
+                entry.members.pop(user_id, None)
+
+    def invalidate(self, channel_id: str) -> None:
+        with self._lock:
+            self._entries.pop(channel_id, None)
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                revalidations=self._revalidations,
+                evictions=self._evictions,
+                size=len(self._entries),
+            )
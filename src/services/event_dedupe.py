@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import structlog
+
+from src.store.event_store import ProcessedEventStore
+
+logger = structlog.get_logger()
+
+# Slack retries a delivery up to three times, the last one about five minutes later.
+DEFAULT_DEDUPE_TTL = 900.0
+DEFAULT_DEDUPE_MAX_ENTRIES = 10_000
+DEFAULT_PRUNE_INTERVAL = 300.0
+
+
+def delivery_key(body: Mapping[str, Any]) -> str | None:
+    """Return the id Slack keeps across redeliveries of ``body``, or ``None`` if it has none.
+
+    Events API callbacks carry an ``event_id``; commands, actions and view submissions
+    carry the ``trigger_id`` of the user interaction that produced them.
+    """
+    event_id = body.get("event_id")
+    if event_id:
+        return f"event:{event_id}"
+    trigger_id = body.get("trigger_id")
+    if trigger_id:
+        return f"trigger:{trigger_id}"
+    return None
+
+
+@dataclass(frozen=True)
+class DedupeStats:
+    checked: int
+    dropped: int
+    size: int
+
+
+class EventDeduplicator:
+    """Bounded TTL record of Slack deliveries that are already being handled.
+
+    Recent keys live in an in-memory LRU of at most ``max_entries``. With a ``store`` every
+    new key is also claimed in SQLite, so redeliveries that arrive after a restart, or at
+    another process sharing the database, are recognised too.
+    """
+
+    def __init__(
+        self,
+        *,
+        store: ProcessedEventStore | None = None,
+        ttl_seconds: float = DEFAULT_DEDUPE_TTL,
+        max_entries: int = DEFAULT_DEDUPE_MAX_ENTRIES,
+        prune_interval: float = DEFAULT_PRUNE_INTERVAL,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._store = store
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._prune_interval = prune_interval
+        self._clock = clock
+        # key -> expiry; insertion order is expiry order because the TTL is fixed.
+        self._seen: OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.Lock()
+        self._checked = 0
+        self._dropped = 0
+        self._next_prune = clock() + prune_interval
+
+    def claim(self, key: str) -> bool:
+        """Mark ``key`` as being handled; return ``False`` if it already was within the TTL."""
+        now = self._clock()
+        with self._lock:
+            self._checked += 1
+            self._expire(now)
+            if key in self._seen:
+                self._dropped += 1
+                return False
+            prune = self._store is not None and now >= self._next_prune
+            if prune:
+                self._next_prune = now + self._prune_interval
+
+        if self._store is not None:
+            if prune:
+                self._store.prune(now - self._ttl_seconds)
+            if not self._store.claim(key, now, expires_before=now - self._ttl_seconds):
+                with self._lock:
+                    self._dropped += 1
+                    self._remember(key, now)
+                return False
+
+        with self._lock:
+            if key in self._seen:
+                # A concurrent claim of the same key won the race for the memory slot.
+                self._dropped += 1
+                return False
+            self._remember(key, now)
+        return True
+
+    def release(self, key: str) -> None:
+        """Forget ``key`` so a redelivery is handled again, e.g. after the handler failed."""
+        with self._lock:
+            self._seen.pop(key, None)
+        if self._store is not None:
+            self._store.release(key)
+
+    def stats(self) -> DedupeStats:
+        with self._lock:
+            return DedupeStats(checked=self._checked, dropped=self._dropped, size=len(self._seen))
+
+    def _remember(self, key: str, now: float) -> None:
+        self._seen[key] = now + self._ttl_seconds
+        while len(self._seen) > self._max_entries:
+            self._seen.popitem(last=False)
+
+    def _expire(self, now: float) -> None:
+        while self._seen:
+            key, expires_at = next(iter(self._seen.items()))
+            if expires_at > now:
+                return
+            del self._seen[key]
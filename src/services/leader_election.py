@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import os
+import socket
+import threading
+import time
+from collections.abc import Sequence
+from typing import Protocol
+
+import structlog
+
+from src.store.lease_store import LeaseStore
+
+logger = structlog.get_logger()
+
+LEADER_LEASE = "singleton-jobs"
+DEFAULT_LEASE_TTL = 15.0
+DEFAULT_RENEW_INTERVAL = 5.0
+
+
+class BackgroundJob(Protocol):
+    def start(self) -> None: ...
+
+    def stop(self, timeout: float | None = None) -> None: ...
+
+
+def default_holder() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class LeaderElector:
+    """Runs ``jobs`` only while this process holds the ``name`` lease in :class:`LeaseStore`.
+
+    Every worker process campaigns every ``renew_interval`` seconds. The leader renews its
+    lease before ``ttl`` runs out; when it stops renewing (crash, stall, shutdown) another
+    worker takes over once the lease expires and starts the jobs there. A leader that
+    notices it lost the lease stops its jobs, but for up to ``ttl`` seconds after a stall
+    two processes may run them, so jobs must tolerate brief overlap.
+    """
+
+    def __init__(
+        self,
+        store: LeaseStore,
+        jobs: Sequence[BackgroundJob],
+        *,
+        name: str = LEADER_LEASE,
+        holder: str | None = None,
+        ttl: float = DEFAULT_LEASE_TTL,
+        renew_interval: float = DEFAULT_RENEW_INTERVAL,
+    ) -> None:
+        if renew_interval >= ttl:
+            msg = f"renew_interval ({renew_interval}) must be shorter than the lease ttl ({ttl})"
+            raise ValueError(msg)
+        self._store = store
+        self._jobs = list(jobs)
+        self._name = name
+        self.holder = holder if holder is not None else default_holder()
+        self._ttl = ttl
+        self._renew_interval = renew_interval
+        self._leader = False
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self._leader
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, daemon=True, name="leader-election")
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop campaigning, stop the jobs if leading and hand the lease over right away."""
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        if self._leader:
+            self._demote()
+            self._store.release(self._name, self.holder)
+
+    def campaign_once(self) -> bool:
+        """Try to take or renew the lease, start or stop the jobs to match and return leadership."""
+        try:
+            held = self._store.try_acquire(self._name, self.holder, time.time(), self._ttl)
+        except Exception:
+            # Without a renewed lease another worker may take over; stop rather than overlap.
+            logger.exception("leader_lease_renew_failed", lease=self._name, holder=self.holder)
+            held = False
+        if held and not self._leader:
+            self._leader = True
+            logger.info("leader_elected", lease=self._name, holder=self.holder)
+        elif not held and self._leader:
+            logger.warning("leader_demoted", lease=self._name, holder=self.holder)
+            self._demote()
+        if self._leader:
+            # Every renewal, so a job that could not start yet (e.g. still stopping) is retried.
+            for job in self._jobs:
+                try:
+                    job.start()
+                except Exception:
+                    logger.exception("leader_job_start_failed", job=type(job).__name__)
+        return self._leader
+
+    def _demote(self) -> None:
+        self._leader = False
+        for job in self._jobs:
+            try:
+                job.stop(self._renew_interval)
+            except Exception:
+                logger.exception("leader_job_stop_failed", job=type(job).__name__)
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self.campaign_once()
+            self._stopping.wait(self._renew_interval)
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import structlog
+
+from src.store.notice_store import NoticeStore
+
+logger = structlog.get_logger()
+
+DEFAULT_ARCHIVE_INTERVAL = 3600.0
+
+
+class NoticeArchiver:
+    """Background job that moves notices older than ``max_age`` seconds to the archive database.
+
+    Keeps the hot ``notices.db`` bounded to recent history, so its indexes and page cache
+    stay small no matter how long the bot has been running.
+    """
+
+    def __init__(
+        self,
+        store: NoticeStore,
+        max_age: float,
+        *,
+        interval: float = DEFAULT_ARCHIVE_INTERVAL,
+    ) -> None:
+        self._store = store
+        self._max_age = max_age
+        self._interval = interval
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopping = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(self._stopping,), daemon=True, name="notice-archiver")
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def run_once(self) -> int:
+        """Archive every notice that is old enough now and return how many were moved."""
+        return self._store.archive_notices(time.time() - self._max_age)
+
+    def _run(self, stopping: threading.Event) -> None:
+        while not stopping.is_set():
+            try:
+                self.run_once()
+            except Exception:
+                logger.exception("notice_archive_failed")
+            stopping.wait(self._interval)
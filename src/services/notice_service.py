@@ -1,16 +1,23 @@
 from __future__ import annotations
 
 import time
+from collections.abc import Iterator
 
 import structlog
 from slack_sdk.errors import SlackApiError
 from slack_sdk.web import WebClient
 
+from src.services.channel_members import ChannelMemberCache
+from src.services.reminder_dispatcher import ReminderDispatcher
+from src.services.reminder_worker import ReminderWorker
+from src.services.user_directory import UserDirectory
 from src.store.models import (
     AttendanceStatus,
     MeetingNotice,
     Notice,
     NoticeType,
+    ReminderJob,
+    ReminderKind,
     generate_notice_id,
 )
 from src.store.notice_store import NoticeStore
@@ -27,11 +34,88 @@ def _build_message_link(channel_id: str, message_ts: str) -> str:
 
 logger = structlog.get_logger()
 
+MEMBER_PAGE_SIZE = 200
+
+_READ = frozenset({"read"})
+_ATTENDANCE = frozenset(s.value for s in AttendanceStatus)
+
+
+def new_notice(*, title: str, content: str, channel_id: str, author_id: str) -> Notice:
+    return Notice(
+        notice_id=generate_notice_id(),
+        notice_type=NoticeType.GENERAL,
+        title=title,
+        content=content,
+        channel_id=channel_id,
+        author_id=author_id,
+        created_at=time.time(),
+    )
+
+
+def new_meeting_notice(
+    *,
+    title: str,
+    channel_id: str,
+    author_id: str,
+    meeting_datetime: str,
+    location: str,
+    agenda: str,
+) -> MeetingNotice:
+    return MeetingNotice(
+        notice_id=generate_notice_id(),
+        notice_type=NoticeType.MEETING,
+        title=title,
+        content=f"회의: {title}",
+        channel_id=channel_id,
+        author_id=author_id,
+        created_at=time.time(),
+        meeting_datetime=meeting_datetime,
+        location=location,
+        agenda=agenda,
+    )
+
+
+def format_response_rate(notice: Notice, counts: dict[str, int], member_count: int) -> str:
+    """Return ``"responded/members"`` from the notice's response counts by type, or ``"-"`` without members."""
+    if member_count <= 0:
+        return "-"
+    if notice.notice_type == NoticeType.MEETING:
+        responded = sum(counts.get(status.value, 0) for status in AttendanceStatus)
+    else:
+        responded = counts.get("read", 0)
+    return f"{responded}/{member_count}"
+
+
+_REMINDER_TEXTS = {
+    ReminderKind.UNREAD: "아직 확인하지 않은 공지가 있습니다",
+    ReminderKind.NON_RESPONDERS: "아직 응답하지 않은 회의 공지가 있습니다",
+}
+# Members with any of these responses are not reminded.
+REMINDER_RESPONSE_TYPES = {ReminderKind.UNREAD: _READ, ReminderKind.NON_RESPONDERS: _ATTENDANCE}
+
+
+def build_reminder_text(notice: Notice, kind: ReminderKind) -> str:
+    link = _build_message_link(notice.channel_id, notice.message_ts)
+    return f"{_REMINDER_TEXTS[kind]}: *{notice.title}*\n<{link}|공지 바로가기>"
+
 
 class NoticeService:
-    def __init__(self, store: NoticeStore, client: WebClient) -> None:
+    def __init__(
+        self,
+        store: NoticeStore,
+        client: WebClient,
+        *,
+        user_directory: UserDirectory | None = None,
+        member_cache: ChannelMemberCache | None = None,
+        member_page_size: int = MEMBER_PAGE_SIZE,
+        reminder_worker: ReminderWorker | None = None,
+    ) -> None:
         self._store = store
         self._client = client
+        self._user_directory = user_directory if user_directory is not None else UserDirectory()
+        self._member_cache = member_cache if member_cache is not None else ChannelMemberCache()
+        self._member_page_size = member_page_size
+        self._reminder_worker = reminder_worker
 
     def create_and_post_notice(
         self,
@@ -41,22 +125,14 @@ class NoticeService:
         channel_id: str,
         author_id: str,
     ) -> Notice:
-        notice = Notice(
-            notice_id=generate_notice_id(),
-            notice_type=NoticeType.GENERAL,
-            title=title,
-            content=content,
-            channel_id=channel_id,
-            author_id=author_id,
-            created_at=time.time(),
-        )
+        notice = new_notice(title=title, content=content, channel_id=channel_id, author_id=author_id)
 
         msg = build_notice_message(notice)
         result = self._client.chat_postMessage(channel=channel_id, **msg)
         notice.message_ts = result.get("ts", "")
 
+        # Persisted only once the message exists, so the row is never without its ts.
         self._store.create_notice(notice)
-        self._store.update_message_ts(notice.notice_id, notice.message_ts)
 
         return notice
 
@@ -70,14 +146,10 @@ class NoticeService:
         location: str,
         agenda: str,
     ) -> MeetingNotice:
-        notice = MeetingNotice(
-            notice_id=generate_notice_id(),
-            notice_type=NoticeType.MEETING,
+        notice = new_meeting_notice(
             title=title,
-            content=f"회의: {title}",
             channel_id=channel_id,
             author_id=author_id,
-            created_at=time.time(),
             meeting_datetime=meeting_datetime,
             location=location,
             agenda=agenda,
@@ -88,7 +160,6 @@ class NoticeService:
         notice.message_ts = result.get("ts", "")
 
         self._store.create_meeting_notice(notice)
-        self._store.update_message_ts(notice.notice_id, notice.message_ts)
 
         return notice
 
@@ -144,22 +215,20 @@ class NoticeService:
         self,
         notices: list[Notice | MeetingNotice],
     ) -> dict[str, str]:
-        channel_members: dict[str, list[str]] = {}
+        channel_members: dict[str, int] = {}
         rates: dict[str, str] = {}
+        counts = self._store.count_responses([notice.notice_id for notice in notices])
 
         for notice in notices:
             if notice.channel_id not in channel_members:
                 try:
-                    channel_members[notice.channel_id] = self.get_channel_members(notice.channel_id)
+                    channel_members[notice.channel_id] = len(self.get_channel_members(notice.channel_id))
                 except SlackApiError:
                     logger.warning("channel_members_fetch_failed", channel_id=notice.channel_id)
-                    channel_members[notice.channel_id] = []
-            total = len(channel_members[notice.channel_id])
-            if isinstance(notice, MeetingNotice):
-                responded = len(notice.attendance)
-            else:
-                responded = len(notice.read_by)
-            rates[notice.notice_id] = f"{responded}/{total}" if total > 0 else "-"
+                    channel_members[notice.channel_id] = 0
+            rates[notice.notice_id] = format_response_rate(
+                notice, counts.get(notice.notice_id, {}), channel_members[notice.channel_id]
+            )
 
         return rates
 
@@ -178,50 +247,91 @@ class NoticeService:
         return True
 
     def get_channel_members(self, channel_id: str) -> list[str]:
-        channel_result = self._client.conversations_members(channel=channel_id)
-        channel_ids = set(channel_result.get("members", []))
+        channel_ids = self._member_cache.get_or_load(channel_id, lambda: self.iter_channel_members(channel_id))
         if not channel_ids:
             return []
 
-        users_result = self._client.users_list()
-        return [
-            u["id"]
-            for u in users_result.get("members", [])
-            if u["id"] in channel_ids and not u.get("is_bot") and u.get("id") != "USLACKBOT"
-        ]
-
-    def remind_unread_users(self, notice_id: str) -> int:
-        notice = self._store.get_notice(notice_id)
-        if notice is None:
-            return 0
+        return self._user_directory.filter_humans(self._client, channel_ids)
 
-        members = self.get_channel_members(notice.channel_id)
-        excludes = set(self._store.list_remind_excludes())
-        unread = [m for m in members if not notice.is_read_by(m) and m not in excludes]
+    def iter_channel_members(self, channel_id: str, *, page_size: int | None = None) -> Iterator[str]:
+        """Yield every member id of ``channel_id``, following ``conversations.members`` cursors.
 
-        link = _build_message_link(notice.channel_id, notice.message_ts)
-        for user_id in unread:
-            self._client.chat_postMessage(
-                channel=user_id,
-                text=(f"아직 확인하지 않은 공지가 있습니다: *{notice.title}*\n<{link}|공지 바로가기>"),
+        Ids are yielded page by page as they arrive, so callers that only count or diff
+        members never hold more than one page in memory.
+        """
+        cursor = ""
+        while True:
+            result = self._client.conversations_members(
+                channel=channel_id,
+                limit=page_size or self._member_page_size,
+                cursor=cursor or None,
             )
+            members: list[str] = result.get("members", [])
+            yield from members
+            metadata: dict[str, str] = result.get("response_metadata") or {}
+            cursor = metadata.get("next_cursor") or ""
+            if not cursor:
+                return
+
+    def remind_unread_users(
+        self,
+        notice_id: str,
+        *,
+        requested_by: str = "",
+        feedback_channel_id: str = "",
+    ) -> ReminderJob | None:
+        """Queue reminder DMs for channel members who have not read the notice."""
+        notice = self._store.get_notice(notice_id)
+        if notice is None:
+            return None
+        return self._enqueue_reminders(
+            notice, ReminderKind.UNREAD, requested_by=requested_by, feedback_channel_id=feedback_channel_id
+        )
 
-        return len(unread)
-
-    def remind_meeting_non_responders(self, notice_id: str) -> int:
+    def remind_meeting_non_responders(
+        self,
+        notice_id: str,
+        *,
+        requested_by: str = "",
+        feedback_channel_id: str = "",
+    ) -> ReminderJob | None:
+        """Queue reminder DMs for channel members who have not answered the meeting notice."""
         notice = self._store.get_notice(notice_id)
         if notice is None or not isinstance(notice, MeetingNotice):
-            return 0
+            return None
+        return self._enqueue_reminders(
+            notice, ReminderKind.NON_RESPONDERS, requested_by=requested_by, feedback_channel_id=feedback_channel_id
+        )
 
+    def _enqueue_reminders(
+        self,
+        notice: Notice,
+        kind: ReminderKind,
+        *,
+        requested_by: str,
+        feedback_channel_id: str,
+    ) -> ReminderJob:
         members = self.get_channel_members(notice.channel_id)
         excludes = set(self._store.list_remind_excludes())
-        non_responders = [m for m in members if m not in notice.attendance and m not in excludes]
-
-        link = _build_message_link(notice.channel_id, notice.message_ts)
-        for user_id in non_responders:
-            self._client.chat_postMessage(
-                channel=user_id,
-                text=(f"아직 응답하지 않은 회의 공지가 있습니다: *{notice.title}*\n<{link}|공지 바로가기>"),
-            )
-
-        return len(non_responders)
+        pending = self._store.members_without_response(notice.notice_id, members, REMINDER_RESPONSE_TYPES[kind])
+        job = self._store.create_reminder_job(
+            notice_id=notice.notice_id,
+            kind=kind,
+            text=build_reminder_text(notice, kind),
+            requested_by=requested_by,
+            feedback_channel_id=feedback_channel_id,
+            user_ids=[m for m in pending if m not in excludes],
+        )
+        logger.info("reminder_job_queued", job_id=job.job_id, notice_id=notice.notice_id, total=job.total)
+
+        if self._reminder_worker is not None:
+            self._reminder_worker.notify()
+            return job
+
+        # Without a background worker, drain the queue on the calling thread.
+        dispatcher = ReminderDispatcher()
+        try:
+            ReminderWorker(self._store, self._client, dispatcher).run_once()
+        finally:
+            dispatcher.shutdown()
+        return self._store.get_reminder_job(job.job_id) or job
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import concurrent.futures
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import structlog
+from slack_sdk.errors import SlackApiError
+from slack_sdk.web import WebClient
+
+logger = structlog.get_logger()
+
+# chat.postMessage allows roughly one message per second per channel with short bursts,
+# plus a workspace-wide ceiling. Each reminder DM goes to a different channel, so the
+# bucket only has to stay under the workspace ceiling.
+DEFAULT_RATE_PER_SECOND = 4.0
+DEFAULT_BURST = 8
+DEFAULT_WORKERS = 4
+DEFAULT_MAX_RETRIES = 3
+
+
+@dataclass(frozen=True)
+class ReminderMessage:
+    user_id: str
+    text: str
+
+
+@dataclass
+class ReminderResult:
+    sent: int = 0
+    failed: int = 0
+    throttled: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.sent + self.failed
+
+
+class TokenBucket:
+    """Blocking token bucket shared by all reminder workers."""
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        capacity: int,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._rate = rate_per_second
+        self._capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._clock = clock
+        self._sleep = sleep
+        self._updated_at = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+                self._updated_at = now
+                if now < self._paused_until:
+                    delay = self._paused_until - now
+                elif self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                else:
+                    delay = (1.0 - self._tokens) / self._rate
+            self._sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for ``seconds``, e.g. after a 429 ``Retry-After``."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+            self._tokens = 0.0
+
+
+def _retry_after(error: SlackApiError) -> float | None:
+    response = error.response
+    if response is None or response.status_code != 429:
+        return None
+    headers = response.headers or {}
+    raw = headers.get("Retry-After") or headers.get("retry-after") or "1"
+    if isinstance(raw, list):
+        raw = raw[0]
+    try:
+        return max(float(raw), 0.0)
+    except ValueError:
+        return 1.0
+
+
+class ReminderDispatcher:
+    """Sends reminder DMs through a bounded worker pool behind a shared token bucket."""
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = DEFAULT_WORKERS,
+        rate_per_second: float = DEFAULT_RATE_PER_SECOND,
+        burst: int = DEFAULT_BURST,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._bucket = TokenBucket(rate_per_second, burst, clock=clock, sleep=sleep)
+        self._max_retries = max_retries
+        self._workers = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="reminder-worker")
+
+    def dispatch(
+        self,
+        client: WebClient,
+        messages: Sequence[ReminderMessage],
+        *,
+        on_result: Callable[[ReminderMessage, bool], None] | None = None,
+    ) -> ReminderResult:
+        """Send ``messages`` and block until all are settled.
+
+        ``on_result`` is called from the worker thread right after each message succeeds or
+        gives up, so callers can checkpoint progress as it happens.
+        """
+        result = ReminderResult()
+        lock = threading.Lock()
+
+        def send(message: ReminderMessage) -> None:
+            try:
+                sent, throttled = self._send(client, message)
+            except Exception:
+                logger.exception("reminder_send_error", user_id=message.user_id)
+                sent, throttled = False, 0
+            with lock:
+                result.throttled += throttled
+                if sent:
+                    result.sent += 1
+                else:
+                    result.failed += 1
+            if on_result is not None:
+                on_result(message, sent)
+
+        concurrent.futures.wait([self._workers.submit(send, message) for message in messages])
+        logger.info("reminder_run_finished", sent=result.sent, failed=result.failed, throttled=result.throttled)
+        return result
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        self._workers.shutdown(wait=wait)
+
+    def _send(self, client: WebClient, message: ReminderMessage) -> tuple[bool, int]:
+        throttled = 0
+        for _ in range(self._max_retries + 1):
+            self._bucket.acquire()
+            try:
+                client.chat_postMessage(channel=message.user_id, text=message.text)
+            except SlackApiError as e:
+                delay = _retry_after(e)
+                if delay is None:
+                    logger.warning("reminder_send_failed", user_id=message.user_id, error=str(e))
+                    return False, throttled
+                throttled += 1
+                logger.info("reminder_throttled", user_id=message.user_id, retry_after=delay)
+                self._bucket.pause(delay)
+            else:
+                return True, throttled
+        logger.warning("reminder_retries_exhausted", user_id=message.user_id)
+        return False, throttled
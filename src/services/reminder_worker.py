@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable
+
+import structlog
+from slack_sdk.web import WebClient
+
+from src.services.reminder_dispatcher import ReminderDispatcher, ReminderMessage
+from src.store.models import ReminderDelivery, ReminderJob
+from src.store.notice_store import NoticeStore
+
+logger = structlog.get_logger()
+
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_POLL_INTERVAL = 30.0
+# A claimed batch not settled within this long is assumed abandoned by a crashed worker.
+# It has to outlast sending one batch at the dispatcher's rate limit, retries included.
+DEFAULT_CLAIM_TTL = 300.0
+
+
+class ReminderWorker:
+    """Background worker that drains the persistent reminder queue in ``NoticeStore``.
+
+    Deliveries are claimed in batches and each outcome is checkpointed as soon as the DM
+    is settled, so a restarted process resumes where the previous one stopped instead of
+    messaging everyone again. Claims older than ``claim_ttl`` are requeued, so only
+    deliveries that were in flight during a crash can be sent twice.
+    """
+
+    def __init__(
+        self,
+        store: NoticeStore,
+        client: WebClient,
+        dispatcher: ReminderDispatcher,
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        claim_ttl: float = DEFAULT_CLAIM_TTL,
+        on_job_finished: Callable[[ReminderJob], None] | None = None,
+        start_on_notify: bool = True,
+    ) -> None:
+        """Create a worker for ``store``'s reminder queue; :meth:`start` runs it.
+
+        With ``start_on_notify=False`` only the caller starts it (e.g. the elected leader of
+        several worker processes) and :meth:`notify` just wakes a running worker.
+        """
+        self._store = store
+        self._client = client
+        self._dispatcher = dispatcher
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        self._claim_ttl = claim_ttl
+        self._on_job_finished = on_job_finished
+        self._start_on_notify = start_on_notify
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start the worker thread unless it is running or a stopped one is still finishing its batch."""
+        with self._start_lock:
+            if self._thread is not None:
+                if not self._stopping.is_set():
+                    return
+                if self._thread.is_alive():
+                    # A second thread would resend the batch the old one has claimed; the
+                    # caller retries (the leader does on every lease renewal).
+                    logger.warning("reminder_worker_still_stopping")
+                    return
+            # A fresh event per run, so a thread still finishing after stop() cannot resume.
+            self._stopping = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run, args=(self._stopping,), daemon=True, name="reminder-worker"
+            )
+            self._thread.start()
+        self._wakeup.set()
+
+    def notify(self) -> None:
+        """Wake the worker after new jobs were enqueued, starting it on first use."""
+        if self._thread is None and self._start_on_notify:
+            self.start()
+        else:
+            self._wakeup.set()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the worker thread; :meth:`start` can run it again once the thread has exited."""
+        with self._start_lock:
+            self._stopping.set()
+            self._wakeup.set()
+            if self._thread is not None:
+                self._thread.join(timeout)
+                if self._thread.is_alive():
+                    logger.warning("reminder_worker_stop_timeout", timeout=timeout)
+                    return
+                self._thread = None
+
+    def run_once(self) -> int:
+        """Process every pending delivery on the calling thread and return how many were handled."""
+        requeued = self._store.requeue_claimed_reminder_deliveries(time.time() - self._claim_ttl)
+        if requeued:
+            logger.info("reminder_deliveries_requeued", count=requeued)
+        handled = 0
+        while not self._stopping.is_set():
+            batch = self._store.claim_reminder_deliveries(self._batch_size)
+            if not batch:
+                break
+            self._process(batch)
+            handled += len(batch)
+        self._finish_jobs()
+        return handled
+
+    def _run(self, stopping: threading.Event) -> None:
+        while not stopping.is_set():
+            self._wakeup.wait(self._poll_interval)
+            self._wakeup.clear()
+            try:
+                self.run_once()
+            except Exception:
+                logger.exception("reminder_worker_failed")
+
+    def _process(self, batch: list[ReminderDelivery]) -> None:
+        by_job: dict[int, list[ReminderDelivery]] = defaultdict(list)
+        for delivery in batch:
+            by_job[delivery.job_id].append(delivery)
+
+        for job_id, deliveries in by_job.items():
+
+            def checkpoint(message: ReminderMessage, sent: bool, job_id: int = job_id) -> None:
+                self._store.complete_reminder_delivery(job_id, message.user_id, sent=sent)
+
+            messages = [ReminderMessage(user_id=d.user_id, text=d.text) for d in deliveries]
+            self._dispatcher.dispatch(self._client, messages, on_result=checkpoint)
+
+    def _finish_jobs(self) -> None:
+        for job in self._store.finish_reminder_jobs():
+            logger.info("reminder_job_finished", job_id=job.job_id, sent=job.sent, failed=job.failed)
+            if self._on_job_finished is None:
+                continue
+            try:
+                self._on_job_finished(job)
+            except Exception:
+                logger.exception("reminder_job_callback_failed", job_id=job.job_id)
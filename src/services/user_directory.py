@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import structlog
+from slack_sdk.errors import SlackApiError
+from slack_sdk.web import WebClient
+
+if TYPE_CHECKING:
+    from slack_sdk.web.async_client import AsyncWebClient
+
+logger = structlog.get_logger()
+
+SLACKBOT_USER_ID = "USLACKBOT"
+
+
+@dataclass(frozen=True)
+class DirectoryUser:
+    id: str
+    is_bot: bool = False
+    deleted: bool = False
+
+    @property
+    def is_human(self) -> bool:
+        return not self.is_bot and not self.deleted and self.id != SLACKBOT_USER_ID
+
+    @classmethod
+    def from_payload(cls, user: dict[str, Any]) -> DirectoryUser:
+        return cls(
+            id=str(user.get("id", "")),
+            is_bot=bool(user.get("is_bot")),
+            deleted=bool(user.get("deleted")),
+        )
+
+
+class UserDirectory:
+    """Process-wide cache of workspace users, used to filter bots out of channel members.
+
+    The directory is loaded with paginated ``users.list`` on first use and reloaded once
+    ``ttl_seconds`` have passed. ``user_change`` and ``team_join`` events patch it in place
+    through :meth:`upsert`, so most lookups never touch the Slack API.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = 3600.0,
+        page_size: int = 200,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._page_size = page_size
+        self._clock = clock
+        self._users: dict[str, DirectoryUser] = {}
+        self._humans: set[str] = set()
+        self._loaded_at: float | None = None
+        self._lock = threading.Lock()
+        self._async_lock = asyncio.Lock()
+
+    def filter_humans(self, client: WebClient, user_ids: Iterable[str]) -> list[str]:
+        """Return the human (non-bot, active) users among ``user_ids``, preserving order.
+
+        Ids the directory has never seen are dropped, as ``users.list`` would have done.
+        """
+        self._ensure_fresh(client)
+        humans = self._humans
+        return [uid for uid in user_ids if uid in humans]
+
+    async def filter_humans_async(self, client: AsyncWebClient, user_ids: Iterable[str]) -> list[str]:
+        """:meth:`filter_humans` with an ``AsyncWebClient``, for the asyncio runtime."""
+        if not self._is_fresh():
+            async with self._async_lock:
+                if not self._is_fresh():
+                    try:
+                        self._replace(await self._fetch_async(client))
+                    except SlackApiError:
+                        if self._loaded_at is None:
+                            raise
+                        self._keep_stale()
+        humans = self._humans
+        return [uid for uid in user_ids if uid in humans]
+
+    def upsert(self, user: dict[str, Any]) -> None:
+        """Apply a user payload from a ``user_change`` or ``team_join`` event."""
+        entry = DirectoryUser.from_payload(user)
+        if not entry.id:
+            return
+        with self._lock:
+            self._put(entry)
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    def _put(self, entry: DirectoryUser) -> None:
+        self._users[entry.id] = entry
+        if entry.is_human:
+            self._humans.add(entry.id)
+        else:
+            self._humans.discard(entry.id)
+
+    def _is_fresh(self) -> bool:
+        loaded_at = self._loaded_at
+        return loaded_at is not None and self._clock() - loaded_at < self._ttl_seconds
+
+    def _ensure_fresh(self, client: WebClient) -> None:
+        if self._is_fresh():
+            return
+        with self._lock:
+            if self._is_fresh():
+                return
+            try:
+                self._replace(self._fetch(client))
+            except SlackApiError:
+                if self._loaded_at is None:
+                    raise
+                self._keep_stale()
+
+    def _keep_stale(self) -> None:
+        # Keep serving the stale directory rather than failing every caller.
+        logger.warning("user_directory_refresh_failed", cached_users=len(self._users))
+        self._loaded_at = self._clock()
+
+    def _fetch(self, client: WebClient) -> dict[str, DirectoryUser]:
+        users: dict[str, DirectoryUser] = {}
+        cursor = ""
+        while True:
+            result = client.users_list(limit=self._page_size, cursor=cursor or None)
+            cursor = self._add_page(users, result)
+            if not cursor:
+                return users
+
+    async def _fetch_async(self, client: AsyncWebClient) -> dict[str, DirectoryUser]:
+        users: dict[str, DirectoryUser] = {}
+        cursor = ""
+        while True:
+            result = await client.users_list(limit=self._page_size, cursor=cursor or None)
+            cursor = self._add_page(users, result)
+            if not cursor:
+                return users
+
+    @staticmethod
+    def _add_page(users: dict[str, DirectoryUser], result: Any) -> str:
+        """Add one ``users.list`` page to ``users`` and return the next cursor."""
+        members: list[dict[str, Any]] = result.get("members", [])
+        for member in members:
+            entry = DirectoryUser.from_payload(member)
+            users[entry.id] = entry
+        metadata: dict[str, Any] = result.get("response_metadata") or {}
+        return str(metadata.get("next_cursor") or "")
+
+    def _replace(self, users: dict[str, DirectoryUser]) -> None:
+        self._users = users
+        self._humans = {uid for uid, entry in users.items() if entry.is_human}
+        self._loaded_at = self._clock()
+        logger.info("user_directory_loaded", users=len(users), humans=len(self._humans))
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+from src.store.models import AttendanceStatus, MeetingNotice, Notice, ReminderJob, ReminderKind
+from src.store.notice_store import NoticePage, NoticeStore
+
+
+class AsyncNoticeStore:
+    """Awaitable facade over :class:`NoticeStore` for the asyncio runtime.
+
+    Every call runs on one dedicated DB thread, so SQLite never blocks the event loop and
+    concurrent handlers queue for that thread instead of each holding a worker thread.
+    The wrapped :attr:`store` stays usable directly by thread-based background workers.
+    """
+
+    def __init__(self, store: NoticeStore) -> None:
+        self.store = store
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="notice-db")
+
+    async def _run[**P, T](self, fn: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+
+    async def create_notice(self, notice: Notice) -> None:
+        await self._run(self.store.create_notice, notice)
+
+    async def create_meeting_notice(self, notice: MeetingNotice) -> None:
+        await self._run(self.store.create_meeting_notice, notice)
+
+    async def update_notice(self, notice_id: str, title: str, content: str) -> None:
+        await self._run(self.store.update_notice, notice_id, title, content)
+
+    async def update_meeting_notice(
+        self, notice_id: str, title: str, meeting_datetime: str, location: str, agenda: str
+    ) -> None:
+        await self._run(self.store.update_meeting_notice, notice_id, title, meeting_datetime, location, agenda)
+
+    async def update_message_ts(self, notice_id: str, message_ts: str) -> None:
+        await self._run(self.store.update_message_ts, notice_id, message_ts)
+
+    async def get_notice(self, notice_id: str) -> Notice | MeetingNotice | None:
+        return await self._run(self.store.get_notice, notice_id)
+
+    async def list_notices_page(
+        self,
+        *,
+        limit: int = 10,
+        cursor: str | None = None,
+        channel_id: str | None = None,
+        with_responses: bool = True,
+    ) -> NoticePage:
+        return await self._run(
+            self.store.list_notices_page,
+            limit=limit,
+            cursor=cursor,
+            channel_id=channel_id,
+            with_responses=with_responses,
+        )
+
+    async def search_notices(
+        self, query: str, *, limit: int = 10, cursor: str | None = None, with_responses: bool = False
+    ) -> NoticePage:
+        return await self._run(
+            self.store.search_notices, query, limit=limit, cursor=cursor, with_responses=with_responses
+        )
+
+    async def count_search_results(self, query: str) -> int:
+        return await self._run(self.store.count_search_results, query)
+
+    async def count_notices(self, channel_id: str | None = None) -> int:
+        return await self._run(self.store.count_notices, channel_id)
+
+    async def count_responses(self, notice_ids: Sequence[str]) -> dict[str, dict[str, int]]:
+        return await self._run(self.store.count_responses, notice_ids)
+
+    async def members_without_response(
+        self, notice_id: str, members: Sequence[str], response_types: frozenset[str]
+    ) -> list[str]:
+        return await self._run(self.store.members_without_response, notice_id, members, response_types)
+
+    async def mark_read(self, notice_id: str, user_id: str) -> None:
+        await self._run(self.store.mark_read, notice_id, user_id)
+
+    async def set_attendance(self, notice_id: str, user_id: str, status: AttendanceStatus) -> None:
+        await self._run(self.store.set_attendance, notice_id, user_id, status)
+
+    async def list_remind_excludes(self) -> list[str]:
+        return await self._run(self.store.list_remind_excludes)
+
+    async def set_remind_excludes(self, user_ids: Iterable[str]) -> None:
+        """Replace the remind exclude list with ``user_ids`` in one transaction."""
+        await self._run(self._set_remind_excludes, set(user_ids))
+
+    def _set_remind_excludes(self, new_set: set[str]) -> None:
+        current = set(self.store.list_remind_excludes())
+        with self.store.transaction():
+            for uid in new_set - current:
+                self.store.add_remind_exclude(uid)
+            for uid in current - new_set:
+                self.store.remove_remind_exclude(uid)
+
+    async def create_reminder_job(
+        self,
+        *,
+        notice_id: str,
+        kind: ReminderKind,
+        text: str,
+        requested_by: str,
+        feedback_channel_id: str,
+        user_ids: Sequence[str],
+    ) -> ReminderJob:
+        return await self._run(
+            self.store.create_reminder_job,
+            notice_id=notice_id,
+            kind=kind,
+            text=text,
+            requested_by=requested_by,
+            feedback_channel_id=feedback_channel_id,
+            user_ids=user_ids,
+        )
+
+    async def list_active_reminder_jobs(self) -> list[ReminderJob]:
+        return await self._run(self.store.list_active_reminder_jobs)
+
+    async def close(self) -> None:
+        """Flush and close the wrapped store on the DB thread, then stop that thread."""
+        await self._run(self.store.close)
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import queue
+import sqlite3
+import threading
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from pathlib import Path
+
+DEFAULT_READ_POOL_SIZE = 4
+DEFAULT_BUSY_TIMEOUT_MS = 5000
+
+
+def _is_memory(db_path: str) -> bool:
+    return db_path in ("", ":memory:")
+
+
+class ConnectionPool:
+    """One writer connection guarded by a lock plus a small pool of read-only connections.
+
+    File databases are switched to WAL so readers work from their own snapshot and never
+    wait for a writer's commit. ``synchronous=NORMAL`` keeps WAL durable across application
+    crashes while skipping the fsync on every commit.
+
+    An in-memory database only exists on the connection that created it, so there every
+    read goes through the writer connection under the same lock.
+
+    ``attach`` maps schema names to extra database files that are attached to every
+    connection. Stores that share the pool then share its lock, readers and page cache, and
+    queries can join across schemas. Each attached file keeps its own WAL.
+    """
+
+    def __init__(
+        self,
+        db_path: Path | str = ":memory:",
+        *,
+        read_pool_size: int = DEFAULT_READ_POOL_SIZE,
+        synchronous: str = "NORMAL",
+        busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS,
+        attach: Mapping[str, Path | str] | None = None,
+    ) -> None:
+        self._db_path = str(db_path)
+        self._busy_timeout_ms = busy_timeout_ms
+        self._in_memory = _is_memory(self._db_path)
+        self._attached = {schema: str(path) for schema, path in (attach or {}).items()}
+        if not self._in_memory and any(_is_memory(path) for path in self._attached.values()):
+            msg = "In-memory databases can only be attached to an in-memory main database"
+            raise ValueError(msg)
+        self._write_lock = threading.RLock()
+        self._transaction_owner: int | None = None
+        self.writer = sqlite3.connect(self._db_path, check_same_thread=False)
+        self.writer.row_factory = sqlite3.Row
+        self.writer.execute(f"PRAGMA busy_timeout = {busy_timeout_ms}")
+        # Let REPLACE fire delete triggers for the row it removes, so triggers see every change.
+        self.writer.execute("PRAGMA recursive_triggers = ON")
+        for schema, path in self._attached.items():
+            self.writer.execute("ATTACH DATABASE ? AS ?", (path, schema))
+
+        self._read_pool_size = 0 if self._in_memory else read_pool_size
+        self._readers: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._opened_readers = 0
+        self._readers_lock = threading.Lock()
+        self._all_readers: list[sqlite3.Connection] = []
+        if not self._in_memory:
+            for schema in ("main", *self._attached):
+                # Only takes effect on a new file; it has to come before the switch to WAL.
+                self.writer.execute(f"PRAGMA {schema}.auto_vacuum = INCREMENTAL")
+                self.writer.execute(f"PRAGMA {schema}.journal_mode = WAL")
+                self.writer.execute(f"PRAGMA {schema}.synchronous = {synchronous}")
+
+    @property
+    def schemas(self) -> tuple[str, ...]:
+        return ("main", *self._attached)
+
+    @contextmanager
+    def write(self) -> Iterator[sqlite3.Connection]:
+        """Hold the write lock and run the block in one transaction on the writer connection.
+
+        Nested ``write()`` blocks on the same thread join the outer transaction, and reads
+        made by that thread inside the block see its uncommitted writes. The transaction
+        takes SQLite's write lock up front (``BEGIN IMMEDIATE``), so a read-modify-write block
+        stays atomic when other processes share the file.
+        """
+        with self._write_lock:
+            if self._transaction_owner is not None:
+                yield self.writer
+                return
+            self._transaction_owner = threading.get_ident()
+            try:
+                with self.writer:
+                    self.writer.execute("BEGIN IMMEDIATE")
+                    yield self.writer
+            finally:
+                self._transaction_owner = None
+
+    @contextmanager
+    def read(self, *, snapshot: bool = False) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection for the duration of the block.
+
+        With ``snapshot=True`` every query in the block sees the same committed state.
+        """
+        if self._read_pool_size <= 0 or self._transaction_owner == threading.get_ident():
+            with self._write_lock:
+                yield self.writer
+            return
+
+        conn = self._acquire_reader()
+        try:
+            if snapshot:
+                conn.execute("BEGIN")
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._readers.put(conn)
+
+    def backup(self, directory: Path | str) -> list[Path]:
+        """Write a consistent copy of every schema to ``directory`` and return the files."""
+        target_dir = Path(directory)
+        target_dir.mkdir(parents=True, exist_ok=True)
+        files: list[Path] = []
+        with self._write_lock:
+            for schema in self.schemas:
+                path = Path(self._attached.get(schema, self._db_path))
+                target = target_dir / (path.name if not _is_memory(str(path)) else f"{schema}.db")
+                dest = sqlite3.connect(target)
+                try:
+                    self.writer.backup(dest, name=schema)
+                finally:
+                    dest.close()
+                files.append(target)
+        return files
+
+    def close(self) -> None:
+        with self._readers_lock:
+            for conn in self._all_readers:
+                conn.close()
+            self._all_readers.clear()
+        with self._write_lock:
+            self.writer.close()
+
+    def _acquire_reader(self) -> sqlite3.Connection:
+        try:
+            return self._readers.get_nowait()
+        except queue.Empty:
+            pass
+        with self._readers_lock:
+            if self._opened_readers < self._read_pool_size:
+                self._opened_readers += 1
+                conn = self._open_reader()
+                self._all_readers.append(conn)
+                return conn
+        return self._readers.get()
+
+    def _open_reader(self) -> sqlite3.Connection:
+        uri = f"{Path(self._db_path).resolve().as_uri()}?mode=ro"
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA busy_timeout = {self._busy_timeout_ms}")
+        for schema, path in self._attached.items():
+            conn.execute("ATTACH DATABASE ? AS ?", (f"{Path(path).resolve().as_uri()}?mode=ro", schema))
+        return conn
@@ -1,45 +1,64 @@
 from __future__ import annotations
 
-import sqlite3
 from pathlib import Path
 
+from src.store.connection import DEFAULT_READ_POOL_SIZE, ConnectionPool
+from src.store.migrations import Migration, migrate
+
+_MIGRATIONS = (
+    Migration(
+        1,
+        "initial schema",
+        """
+        CREATE TABLE IF NOT EXISTS {schema}.dooray_user_mapping (
+            slack_user_id TEXT PRIMARY KEY,
+            dooray_member_id TEXT NOT NULL
+        );
+        """,
+    ),
+)
+
 
 class DoorayStore:
-    def __init__(self, db_path: Path | str = ":memory:") -> None:
-        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
-        self._conn.row_factory = sqlite3.Row
-        self._create_tables()
-
-    def _create_tables(self) -> None:
-        self._conn.executescript("""
-            CREATE TABLE IF NOT EXISTS dooray_user_mapping (
-                slack_user_id TEXT PRIMARY KEY,
-                dooray_member_id TEXT NOT NULL
-            );
-        """)
+    def __init__(
+        self,
+        db_path: Path | str = ":memory:",
+        *,
+        read_pool_size: int = DEFAULT_READ_POOL_SIZE,
+        pool: ConnectionPool | None = None,
+        schema: str = "main",
+    ) -> None:
+        """Open the store at ``db_path``, or on a shared ``pool`` in its ``schema``."""
+        self._owns_pool = pool is None
+        self._pool = pool if pool is not None else ConnectionPool(db_path, read_pool_size=read_pool_size)
+        self._schema = schema
+        migrate(self._pool, _MIGRATIONS, schema=schema)
 
     def set_user_mapping(self, slack_user_id: str, dooray_member_id: str) -> None:
-        self._conn.execute(
-            "INSERT OR REPLACE INTO dooray_user_mapping (slack_user_id, dooray_member_id) VALUES (?, ?)",
-            (slack_user_id, dooray_member_id),
-        )
-        self._conn.commit()
+        with self._pool.write() as conn:
+            conn.execute(
+                f"INSERT OR REPLACE INTO {self._schema}.dooray_user_mapping (slack_user_id, dooray_member_id) "
+                "VALUES (?, ?)",
+                (slack_user_id, dooray_member_id),
+            )
 
     def get_dooray_member_id(self, slack_user_id: str) -> str | None:
-        row = self._conn.execute(
-            "SELECT dooray_member_id FROM dooray_user_mapping WHERE slack_user_id = ?",
-            (slack_user_id,),
-        ).fetchone()
+        with self._pool.read() as conn:
+            row = conn.execute(
+                f"SELECT dooray_member_id FROM {self._schema}.dooray_user_mapping WHERE slack_user_id = ?",
+                (slack_user_id,),
+            ).fetchone()
         if row is None:
             return None
         return str(row["dooray_member_id"])
 
     def remove_user_mapping(self, slack_user_id: str) -> None:
-        self._conn.execute(
-            "DELETE FROM dooray_user_mapping WHERE slack_user_id = ?",
-            (slack_user_id,),
-        )
-        self._conn.commit()
+        with self._pool.write() as conn:
+            conn.execute(
+                f"DELETE FROM {self._schema}.dooray_user_mapping WHERE slack_user_id = ?",
+                (slack_user_id,),
+            )
 
     def close(self) -> None:
-        self._conn.close()
+        if self._owns_pool:
+            self._pool.close()
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from src.store.connection import DEFAULT_READ_POOL_SIZE, ConnectionPool
+from src.store.migrations import Migration, migrate
+
+_MIGRATIONS = (
+    Migration(
+        1,
+        "initial schema",
+        """
+        CREATE TABLE IF NOT EXISTS {schema}.processed_events (
+            event_key TEXT PRIMARY KEY,
+            processed_at REAL NOT NULL
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS {schema}.idx_processed_events_processed_at
+            ON processed_events (processed_at);
+        """,
+    ),
+)
+
+
+class ProcessedEventStore:
+    """Keys of Slack deliveries that were already handled, kept across restarts."""
+
+    def __init__(
+        self,
+        db_path: Path | str = ":memory:",
+        *,
+        read_pool_size: int = DEFAULT_READ_POOL_SIZE,
+        pool: ConnectionPool | None = None,
+        schema: str = "main",
+    ) -> None:
+        """Open the store at ``db_path``, or on a shared ``pool`` in its ``schema``."""
+        self._owns_pool = pool is None
+        self._pool = pool if pool is not None else ConnectionPool(db_path, read_pool_size=read_pool_size)
+        self._schema = schema
+        migrate(self._pool, _MIGRATIONS, schema=schema)
+
+    def claim(self, event_key: str, now: float, *, expires_before: float) -> bool:
+        """Record ``event_key`` as processed at ``now`` and return whether it was new.
+
+        A key last processed before ``expires_before`` counts as new again. The check and
+        the insert are one statement, so of two processes claiming the same key only one wins.
+        """
+        with self._pool.write() as conn:
+            cursor = conn.execute(
+                f"INSERT INTO {self._schema}.processed_events (event_key, processed_at) VALUES (?, ?) "
+                "ON CONFLICT (event_key) DO UPDATE SET processed_at = excluded.processed_at "
+                "WHERE processed_at < ?",
+                (event_key, now, expires_before),
+            )
+        return cursor.rowcount == 1
+
+    def release(self, event_key: str) -> None:
+        with self._pool.write() as conn:
+            conn.execute(f"DELETE FROM {self._schema}.processed_events WHERE event_key = ?", (event_key,))
+
+    def prune(self, before: float) -> int:
+        """Delete keys processed before ``before`` and return how many were removed."""
+        with self._pool.write() as conn:
+            cursor = conn.execute(f"DELETE FROM {self._schema}.processed_events WHERE processed_at < ?", (before,))
+        return cursor.rowcount
+
+    def close(self) -> None:
+        if self._owns_pool:
+            self._pool.close()
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from src.store.connection import DEFAULT_READ_POOL_SIZE, ConnectionPool
+from src.store.migrations import Migration, migrate
+
+_MIGRATIONS = (
+    Migration(
+        1,
+        "initial schema",
+        """
+        CREATE TABLE IF NOT EXISTS {schema}.leases (
+            name TEXT PRIMARY KEY,
+            holder TEXT NOT NULL,
+            expires_at REAL NOT NULL
+        ) WITHOUT ROWID;
+        """,
+    ),
+)
+
+
+class LeaseStore:
+    """Named, time-limited leases shared by every process that opens the same database."""
+
+    def __init__(
+        self,
+        db_path: Path | str = ":memory:",
+        *,
+        read_pool_size: int = DEFAULT_READ_POOL_SIZE,
+        pool: ConnectionPool | None = None,
+        schema: str = "main",
+    ) -> None:
+        """Open the store at ``db_path``, or on a shared ``pool`` in its ``schema``."""
+        self._owns_pool = pool is None
+        self._pool = pool if pool is not None else ConnectionPool(db_path, read_pool_size=read_pool_size)
+        self._schema = schema
+        migrate(self._pool, _MIGRATIONS, schema=schema)
+
+    def try_acquire(self, name: str, holder: str, now: float, ttl: float) -> bool:
+        """Take or renew lease ``name`` for ``holder`` until ``now + ttl``; return whether it holds it.
+
+        Succeeds when the lease is free, expired or already held by ``holder``, in one
+        statement, so two processes can never both get it.
+        """
+        with self._pool.write() as conn:
+            cursor = conn.execute(
+                f"INSERT INTO {self._schema}.leases (name, holder, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT (name) DO UPDATE SET holder = excluded.holder, expires_at = excluded.expires_at "
+                "WHERE leases.holder = excluded.holder OR leases.expires_at <= ?",
+                (name, holder, now + ttl, now),
+            )
+        return cursor.rowcount == 1
+
+    def release(self, name: str, holder: str) -> None:
+        """Give up lease ``name`` if ``holder`` still holds it."""
+        with self._pool.write() as conn:
+            conn.execute(f"DELETE FROM {self._schema}.leases WHERE name = ? AND holder = ?", (name, holder))
+
+    def holder(self, name: str, now: float) -> str | None:
+        """Return who holds lease ``name`` at ``now``, or ``None`` if it is free or expired."""
+        with self._pool.read() as conn:
+            row = conn.execute(
+                f"SELECT holder FROM {self._schema}.leases WHERE name = ? AND expires_at > ?",
+                (name, now),
+            ).fetchone()
+        return str(row["holder"]) if row is not None else None
+
+    def close(self) -> None:
+        if self._owns_pool:
+            self._pool.close()
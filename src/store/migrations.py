@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import sqlite3
+import time
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass
+
+import structlog
+
+from src.store.connection import ConnectionPool
+
+logger = structlog.get_logger()
+
+DEFAULT_BACKFILL_BATCH = 500
+
+# Migrates at most ``batch_size`` rows and returns how many it touched.
+BackfillStep = Callable[[sqlite3.Connection, int], int]
+
+
+@dataclass(frozen=True)
+class Migration:
+    """One numbered schema change.
+
+    ``script`` runs in a single ``BEGIN IMMEDIATE`` transaction together with the
+    ``user_version`` bump; ``{schema}`` in it is replaced with the target schema name.
+    ``backfill`` then runs in short batches, one transaction each, so other writers only
+    ever wait for one batch. It is either a statement using ``:batch_size`` (finished
+    once it changes fewer rows than that) or a :data:`BackfillStep`. Both must be safe
+    to re-run: an interrupted backfill resumes at the next startup.
+    """
+
+    version: int
+    name: str
+    script: str = ""
+    backfill: str | BackfillStep | None = None
+
+
+def _statements(script: str) -> Iterator[str]:
+    buffer = ""
+    for line in script.splitlines(keepends=True):
+        buffer += line
+        if sqlite3.complete_statement(buffer):
+            yield buffer.strip()
+            buffer = ""
+    if buffer.strip():
+        yield buffer.strip()
+
+
+def schema_version(conn: sqlite3.Connection, schema: str = "main") -> int:
+    return int(conn.execute(f"PRAGMA {schema}.user_version").fetchone()[0])
+
+
+def migrate(
+    pool: ConnectionPool,
+    migrations: Sequence[Migration],
+    *,
+    schema: str = "main",
+    batch_size: int = DEFAULT_BACKFILL_BATCH,
+    batch_pause: float = 0.0,
+) -> int:
+    """Bring ``schema`` up to the last of ``migrations`` and return the resulting version.
+
+    A database that is already current costs two small reads. ``batch_pause`` sleeps
+    between backfill batches to leave room for other writers on a busy database.
+    """
+    versions = [m.version for m in migrations]
+    if versions != list(range(1, len(migrations) + 1)):
+        msg = f"Migrations must be numbered 1..n without gaps, got {versions}"
+        raise ValueError(msg)
+    by_version = {m.version: m for m in migrations}
+    latest = len(migrations)
+
+    with pool.read() as conn:
+        current = schema_version(conn, schema)
+        pending = _pending_backfills(conn, schema) if current else []
+    if current == latest and not pending:
+        return current
+    if current > latest:
+        logger.warning("schema_newer_than_code", schema=schema, version=current, known=latest)
+        return current
+
+    for migration in migrations[current:]:
+        if _apply(pool, migration, schema):
+            pending.append(migration.version)
+    for version in pending:
+        _run_backfill(pool, by_version[version], schema, batch_size, batch_pause)
+    return latest
+
+
+def _pending_backfills(conn: sqlite3.Connection, schema: str) -> list[int]:
+    return [int(row[0]) for row in conn.execute(f"SELECT version FROM {schema}.schema_backfills ORDER BY version")]
+
+
+def _apply(pool: ConnectionPool, migration: Migration, schema: str) -> bool:
+    """Run ``migration``'s script and return whether a backfill was queued for it."""
+    with pool.write() as conn:
+        if not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+        # Another process sharing the file may have migrated while we waited for the lock.
+        if schema_version(conn, schema) >= migration.version:
+            return False
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {schema}.schema_backfills (version INTEGER PRIMARY KEY, name TEXT NOT NULL)"
+        )
+        for statement in _statements(migration.script.format(schema=schema)):
+            conn.execute(statement)
+        if migration.backfill is not None:
+            conn.execute(
+                f"INSERT OR IGNORE INTO {schema}.schema_backfills (version, name) VALUES (?, ?)",
+                (migration.version, migration.name),
+            )
+        conn.execute(f"PRAGMA {schema}.user_version = {migration.version}")
+    logger.info("schema_migrated", schema=schema, version=migration.version, migration=migration.name)
+    return migration.backfill is not None
+
+
+def _run_backfill(pool: ConnectionPool, migration: Migration, schema: str, batch_size: int, batch_pause: float) -> None:
+    backfill = migration.backfill
+    started = time.monotonic()
+    total = 0
+    while True:
+        with pool.write() as conn:
+            if isinstance(backfill, str):
+                changed = conn.execute(backfill.format(schema=schema), {"batch_size": batch_size}).rowcount
+            elif backfill is not None:
+                changed = backfill(conn, batch_size)
+            else:
+                changed = 0
+            total += changed
+            done = changed < batch_size
+            if done:
+                conn.execute(f"DELETE FROM {schema}.schema_backfills WHERE version = ?", (migration.version,))
+        if done:
+            break
+        if batch_pause:
+            time.sleep(batch_pause)
+    logger.info(
+        "schema_backfilled",
+        schema=schema,
+        version=migration.version,
+        migration=migration.name,
+        rows=total,
+        elapsed=round(time.monotonic() - started, 3),
+    )
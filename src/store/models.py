@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import secrets
 import time
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from enum import StrEnum
 
@@ -23,7 +24,7 @@ def generate_notice_id() -> str:
     return f"notice_{ts}_{hex_part}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Notice:
     notice_id: str
     notice_type: NoticeType
@@ -33,17 +34,25 @@ class Notice:
     author_id: str
     created_at: float
     message_ts: str = ""
-    read_by: list[str] = field(default_factory=list)
+    # Ordered set of reader ids: O(1) membership, iteration in the order users read it.
+    read_by: dict[str, None] = field(default_factory=dict)
 
     def is_read_by(self, user_id: str) -> bool:
         return user_id in self.read_by
 
     def mark_read(self, user_id: str) -> None:
-        if user_id not in self.read_by:
-            self.read_by.append(user_id)
+        self.read_by[user_id] = None
 
+    def unmark_read(self, user_id: str) -> None:
+        self.read_by.pop(user_id, None)
 
-@dataclass
+    def unread_members(self, members: Iterable[str]) -> list[str]:
+        """Return ``members`` who have not read the notice, in their original order."""
+        read_by = self.read_by
+        return [m for m in members if m not in read_by]
+
+
+@dataclass(slots=True)
 class MeetingNotice(Notice):
     meeting_datetime: str = ""
     location: str = ""
@@ -55,3 +64,48 @@ class MeetingNotice(Notice):
 
     def set_attendance(self, user_id: str, status: AttendanceStatus) -> None:
         self.attendance[user_id] = status
+
+    def clear_attendance(self, user_id: str) -> None:
+        self.attendance.pop(user_id, None)
+
+    def non_responders(self, members: Iterable[str]) -> list[str]:
+        """Return ``members`` without an attendance response, in their original order."""
+        attendance = self.attendance
+        return [m for m in members if m not in attendance]
+
+
+class ReminderKind(StrEnum):
+    UNREAD = "unread"
+    NON_RESPONDERS = "non_responders"
+
+
+class ReminderJobStatus(StrEnum):
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+
+
+@dataclass(slots=True)
+class ReminderJob:
+    job_id: int
+    notice_id: str
+    kind: ReminderKind
+    text: str
+    requested_by: str
+    feedback_channel_id: str
+    status: ReminderJobStatus
+    total: int
+    created_at: float
+    sent: int = 0
+    failed: int = 0
+
+    @property
+    def remaining(self) -> int:
+        return self.total - self.sent - self.failed
+
+
+@dataclass(frozen=True, slots=True)
+class ReminderDelivery:
+    job_id: int
+    user_id: str
+    text: str
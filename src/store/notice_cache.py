@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import dataclasses
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+from src.store.models import MeetingNotice, Notice
+
+DEFAULT_MAX_NOTICES = 512
+
+
+@dataclass(frozen=True)
+class NoticeCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def _copy_notice(notice: Notice | MeetingNotice) -> Notice | MeetingNotice:
+    if isinstance(notice, MeetingNotice):
+        return dataclasses.replace(notice, read_by=dict(notice.read_by), attendance=dict(notice.attendance))
+    return dataclasses.replace(notice, read_by=dict(notice.read_by))
+
+
+class NoticeCache:
+    """Bounded LRU of hydrated notices, keyed by notice id.
+
+    Callers always get their own copy, so mutating a returned notice never leaks into the
+    cache. Every write bumps a generation counter; :meth:`put` drops values that were
+    loaded before a write, so a slow reader cannot put back a row that was just changed.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_NOTICES) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, Notice | MeetingNotice] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get_many(self, notice_ids: Iterable[str]) -> dict[str, Notice | MeetingNotice]:
+        """Return copies of the cached notices among ``notice_ids``; absent ids count as misses."""
+        found: dict[str, Notice | MeetingNotice] = {}
+        with self._lock:
+            for notice_id in notice_ids:
+                notice = self._entries.get(notice_id)
+                if notice is None:
+                    self._misses += 1
+                    continue
+                self._entries.move_to_end(notice_id)
+                self._hits += 1
+                found[notice_id] = _copy_notice(notice)
+        return found
+
+    def put_many(self, notices: Iterable[Notice | MeetingNotice], generation: int) -> None:
+        """Cache ``notices`` loaded at ``generation``, unless a write happened since."""
+        with self._lock:
+            if generation != self._generation:
+                return
+            for notice in notices:
+                self._entries[notice.notice_id] = _copy_notice(notice)
+                self._entries.move_to_end(notice.notice_id)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def patch(self, notice_id: str, update: Callable[[Notice | MeetingNotice], None]) -> None:
+        """Apply ``update`` to the cached notice in place, if it is cached."""
+        with self._lock:
+            self._generation += 1
+            notice = self._entries.get(notice_id)
+            if notice is not None:
+                update(notice)
+
+    def invalidate(self, notice_id: str) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.pop(notice_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self) -> NoticeCacheStats:
+        with self._lock:
+            return NoticeCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+            )
@@ -1,91 +1,499 @@
 from __future__ import annotations
 
+import base64
+import json
 import sqlite3
 import time
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
 
-from src.store.models import AttendanceStatus, MeetingNotice, Notice, NoticeType
+import structlog
+
+from src.store.connection import DEFAULT_READ_POOL_SIZE, ConnectionPool
+from src.store.migrations import Migration, migrate
+from src.store.models import (
+    AttendanceStatus,
+    MeetingNotice,
+    Notice,
+    NoticeType,
+    ReminderDelivery,
+    ReminderJob,
+    ReminderJobStatus,
+    ReminderKind,
+)
+from src.store.notice_cache import DEFAULT_MAX_NOTICES, NoticeCache, NoticeCacheStats
+from src.store.response_bitmap import ResponseBitmap, UserInterner
+from src.store.response_buffer import PendingResponse, ResponseWriteBuffer
+
+logger = structlog.get_logger()
+
+_ATTENDANCE_VALUES = frozenset(s.value for s in AttendanceStatus)
+
+# Fold the response log into bitmaps once this many rows have accumulated.
+DEFAULT_COMPACT_THRESHOLD = 1000
+
+ARCHIVE_SCHEMA = "archive"
+DEFAULT_ARCHIVE_BATCH = 200
+# Pages released per incremental_vacuum call after an archive run (4 MiB with 4 KiB pages).
+DEFAULT_VACUUM_PAGES = 1024
+
+_NOTICE_COLUMNS = (
+    "id, type, title, content, channel_id, message_ts, author_id, created_at, meeting_datetime, location, agenda"
+)
+
+# Columns copied into ``notices_fts``.
+_INDEXED_COLUMNS = frozenset({"title", "content", "agenda", "location"})
+
+_CURSOR_OLDER = "older"
+_CURSOR_NEWER = "newer"
+
+
+def _encode_cursor(direction: str, created_at: float, notice_id: str) -> str:
+    raw = json.dumps([direction, created_at, notice_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[str, float, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        direction, created_at, notice_id = json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError) as e:
+        msg = f"Invalid notice cursor: {cursor!r}"
+        raise ValueError(msg) from e
+    if direction not in (_CURSOR_OLDER, _CURSOR_NEWER):
+        msg = f"Invalid notice cursor: {cursor!r}"
+        raise ValueError(msg)
+    return str(direction), float(created_at), str(notice_id)
+
+
+def _apply_response(notice: Notice | MeetingNotice, response: PendingResponse) -> None:
+    """Patch a cached notice the way ``NoticeStore._build_notice`` would read ``response`` back."""
+    if isinstance(notice, MeetingNotice):
+        if response.response_type in _ATTENDANCE_VALUES:
+            notice.set_attendance(response.user_id, AttendanceStatus(response.response_type))
+        else:
+            notice.clear_attendance(response.user_id)
+    elif response.response_type == "read":
+        notice.mark_read(response.user_id)
+    else:
+        notice.unmark_read(response.user_id)
+
+
+def _response_counts(notice: Notice | MeetingNotice) -> dict[str, int]:
+    """``{response_type: count}`` of a hydrated notice, as :meth:`NoticeStore.count_responses` returns it."""
+    if isinstance(notice, MeetingNotice):
+        return dict(Counter(status.value for status in notice.attendance.values()))
+    return {"read": len(notice.read_by)} if notice.read_by else {}
+
+
+def _fts_id_query(notice_id: str) -> str:
+    """FTS5 query for the index row of ``notice_id``; the id column is indexed for this lookup only."""
+    return 'notice_id:"' + notice_id.replace('"', '""') + '"'
+
+
+def _fts_search_query(query: str) -> str:
+    """Turn free text into an FTS5 query: every word must match, as a prefix.
+
+    Prefix matching lets "회의" find "회의는" and "회의실". Words are quoted, so FTS5
+    operators typed by users are searched for literally.
+    """
+    terms = ['"' + term.replace('"', '""') + '"*' for term in query.split()]
+    if not terms:
+        return ""
+    return "{title content agenda location} : (" + " ".join(terms) + ")"
+
+
+def _backfill_by_notice(
+    conn: sqlite3.Connection,
+    state_table: str,
+    batch_size: int,
+    apply: Callable[[sqlite3.Connection, list[str]], None],
+) -> int:
+    """Run ``apply`` on the next ``batch_size`` notice ids after the cursor kept in ``state_table``.
+
+    The state table is dropped once every notice has been visited.
+    """
+    row = conn.execute(f"SELECT cursor FROM {state_table}").fetchone()
+    if row is None:
+        return 0
+    notice_ids = [
+        r["id"]
+        for r in conn.execute("SELECT id FROM notices WHERE id > ? ORDER BY id LIMIT ?", (row["cursor"], batch_size))
+    ]
+    if notice_ids:
+        apply(conn, notice_ids)
+    if len(notice_ids) < batch_size:
+        conn.execute(f"DROP TABLE {state_table}")
+    else:
+        conn.execute(f"UPDATE {state_table} SET cursor = ?", (notice_ids[-1],))
+    return len(notice_ids)
+
+
+def _recount_responses(conn: sqlite3.Connection, notice_ids: list[str]) -> None:
+    placeholders = ", ".join("?" for _ in notice_ids)
+    # Triggers have been counting new responses since the migration; a recount replaces that.
+    conn.execute(f"DELETE FROM notice_response_counts WHERE notice_id IN ({placeholders})", notice_ids)
+    conn.execute(
+        f"""INSERT INTO notice_response_counts (notice_id, response_type, count)
+            SELECT notice_id, response_type, COUNT(*) FROM notice_responses
+            WHERE notice_id IN ({placeholders})
+            GROUP BY notice_id, response_type""",
+        notice_ids,
+    )
+
+
+def _index_notices(conn: sqlite3.Connection, notice_ids: list[str], schema: str = "main") -> None:
+    """(Re)index ``notice_ids`` from ``{schema}.notices``; archived notices stay in the main index."""
+    # Notices created since the migration were indexed by the insert trigger already.
+    for notice_id in notice_ids:
+        conn.execute(
+            "DELETE FROM main.notices_fts WHERE notices_fts MATCH ? AND notice_id = ?",
+            (_fts_id_query(notice_id), notice_id),
+        )
+    placeholders = ", ".join("?" for _ in notice_ids)
+    conn.execute(
+        f"""INSERT INTO main.notices_fts (notice_id, title, content, agenda, location)
+            SELECT id, title, content, coalesce(agenda, ''), coalesce(location, '') FROM {schema}.notices
+            WHERE id IN ({placeholders})""",
+        notice_ids,
+    )
+
+
+def _backfill_response_counts(conn: sqlite3.Connection, batch_size: int) -> int:
+    """Recount the responses of the next ``batch_size`` notices, in id order."""
+    return _backfill_by_notice(conn, "notice_response_counts_backfill", batch_size, _recount_responses)
+
+
+def _backfill_search_index(conn: sqlite3.Connection, batch_size: int) -> int:
+    """Add the next ``batch_size`` notices, in id order, to the full-text index."""
+    return _backfill_by_notice(conn, "notices_fts_backfill", batch_size, _index_notices)
+
+
+_MIGRATIONS = (
+    Migration(
+        1,
+        "initial schema",
+        """
+        CREATE TABLE IF NOT EXISTS notices (
+            id TEXT PRIMARY KEY,
+            type TEXT NOT NULL,
+            title TEXT NOT NULL,
+            content TEXT NOT NULL,
+            channel_id TEXT NOT NULL,
+            message_ts TEXT NOT NULL DEFAULT '',
+            author_id TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            meeting_datetime TEXT,
+            location TEXT,
+            agenda TEXT
+        );
+        CREATE TABLE IF NOT EXISTS notice_responses (
+            notice_id TEXT NOT NULL,
+            user_id TEXT NOT NULL,
+            response_type TEXT NOT NULL,
+            responded_at REAL NOT NULL,
+            PRIMARY KEY (notice_id, user_id),
+            FOREIGN KEY (notice_id) REFERENCES notices(id)
+        );
+        CREATE TABLE IF NOT EXISTS user_ids (
+            id INTEGER PRIMARY KEY,
+            user_id TEXT NOT NULL UNIQUE
+        );
+        CREATE TABLE IF NOT EXISTS notice_response_bitmaps (
+            notice_id TEXT NOT NULL,
+            response_type TEXT NOT NULL,
+            bitmap BLOB NOT NULL,
+            PRIMARY KEY (notice_id, response_type),
+            FOREIGN KEY (notice_id) REFERENCES notices(id)
+        );
+        CREATE TABLE IF NOT EXISTS remind_excludes (
+            user_id TEXT PRIMARY KEY
+        );
+        CREATE TABLE IF NOT EXISTS reminder_jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            notice_id TEXT NOT NULL,
+            kind TEXT NOT NULL,
+            text TEXT NOT NULL,
+            requested_by TEXT NOT NULL,
+            feedback_channel_id TEXT NOT NULL DEFAULT '',
+            status TEXT NOT NULL,
+            total INTEGER NOT NULL,
+            sent INTEGER NOT NULL DEFAULT 0,
+            failed INTEGER NOT NULL DEFAULT 0,
+            created_at REAL NOT NULL,
+            finished_at REAL
+        );
+        CREATE TABLE IF NOT EXISTS reminder_deliveries (
+            job_id INTEGER NOT NULL,
+            user_id TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            claimed_at REAL,
+            PRIMARY KEY (job_id, user_id),
+            FOREIGN KEY (job_id) REFERENCES reminder_jobs(id)
+        );
+        CREATE INDEX IF NOT EXISTS idx_notices_created_at ON notices (created_at, id);
+        CREATE INDEX IF NOT EXISTS idx_notices_channel_created_at ON notices (channel_id, created_at, id);
+        CREATE INDEX IF NOT EXISTS idx_notice_responses_type
+            ON notice_responses (notice_id, response_type, user_id);
+        CREATE INDEX IF NOT EXISTS idx_reminder_jobs_status ON reminder_jobs (status);
+        CREATE INDEX IF NOT EXISTS idx_reminder_deliveries_status ON reminder_deliveries (status, job_id);
+        """,
+    ),
+    Migration(
+        2,
+        "notice_response_counts",
+        """
+        CREATE TABLE notice_response_counts (
+            notice_id TEXT NOT NULL,
+            response_type TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (notice_id, response_type)
+        ) WITHOUT ROWID;
+        CREATE TABLE notice_response_counts_backfill (cursor TEXT NOT NULL);
+        INSERT INTO notice_response_counts_backfill (cursor) VALUES ('');
+        CREATE TRIGGER notice_responses_count_insert AFTER INSERT ON notice_responses
+        BEGIN
+            INSERT INTO notice_response_counts (notice_id, response_type, count)
+                VALUES (NEW.notice_id, NEW.response_type, 1)
+                ON CONFLICT (notice_id, response_type) DO UPDATE SET count = count + 1;
+        END;
+        CREATE TRIGGER notice_responses_count_delete AFTER DELETE ON notice_responses
+        BEGIN
+            UPDATE notice_response_counts SET count = count - 1
+                WHERE notice_id = OLD.notice_id AND response_type = OLD.response_type;
+            DELETE FROM notice_response_counts
+                WHERE notice_id = OLD.notice_id AND response_type = OLD.response_type AND count <= 0;
+        END;
+        CREATE TRIGGER notice_responses_count_update AFTER UPDATE OF notice_id, response_type ON notice_responses
+            WHEN OLD.notice_id IS NOT NEW.notice_id OR OLD.response_type IS NOT NEW.response_type
+        BEGIN
+            UPDATE notice_response_counts SET count = count - 1
+                WHERE notice_id = OLD.notice_id AND response_type = OLD.response_type;
+            DELETE FROM notice_response_counts
+                WHERE notice_id = OLD.notice_id AND response_type = OLD.response_type AND count <= 0;
+            INSERT INTO notice_response_counts (notice_id, response_type, count)
+                VALUES (NEW.notice_id, NEW.response_type, 1)
+                ON CONFLICT (notice_id, response_type) DO UPDATE SET count = count + 1;
+        END;
+        """,
+        backfill=_backfill_response_counts,
+    ),
+    Migration(
+        3,
+        "notices_fts",
+        """
+        CREATE VIRTUAL TABLE notices_fts USING fts5(
+            notice_id, title, content, agenda, location,
+            tokenize = 'unicode61 remove_diacritics 2',
+            prefix = '1 2'
+        );
+        CREATE TABLE notices_fts_backfill (cursor TEXT NOT NULL);
+        INSERT INTO notices_fts_backfill (cursor) VALUES ('');
+        CREATE TRIGGER notices_fts_insert AFTER INSERT ON notices
+        BEGIN
+            INSERT INTO notices_fts (notice_id, title, content, agenda, location)
+                VALUES (NEW.id, NEW.title, NEW.content, coalesce(NEW.agenda, ''), coalesce(NEW.location, ''));
+        END;
+        CREATE TRIGGER notices_fts_update AFTER UPDATE OF title, content, agenda, location ON notices
+        BEGIN
+            DELETE FROM notices_fts
+                WHERE notices_fts MATCH 'notice_id:"' || replace(OLD.id, '"', '""') || '"' AND notice_id = OLD.id;
+            INSERT INTO notices_fts (notice_id, title, content, agenda, location)
+                VALUES (NEW.id, NEW.title, NEW.content, coalesce(NEW.agenda, ''), coalesce(NEW.location, ''));
+        END;
+        CREATE TRIGGER notices_fts_delete AFTER DELETE ON notices
+        BEGIN
+            DELETE FROM notices_fts
+                WHERE notices_fts MATCH 'notice_id:"' || replace(OLD.id, '"', '""') || '"' AND notice_id = OLD.id;
+        END;
+        """,
+        backfill=_backfill_search_index,
+    ),
+)
+
+
+# The archive mirrors the hot notice columns; a migration that adds one to ``notices``
+# has to add it here too.
+_ARCHIVE_MIGRATIONS = (
+    Migration(
+        1,
+        "archive schema",
+        """
+        CREATE TABLE IF NOT EXISTS {schema}.notices (
+            id TEXT PRIMARY KEY,
+            type TEXT NOT NULL,
+            title TEXT NOT NULL,
+            content TEXT NOT NULL,
+            channel_id TEXT NOT NULL,
+            message_ts TEXT NOT NULL DEFAULT '',
+            author_id TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            meeting_datetime TEXT,
+            location TEXT,
+            agenda TEXT
+        );
+        CREATE TABLE IF NOT EXISTS {schema}.notice_responses (
+            notice_id TEXT NOT NULL,
+            user_id TEXT NOT NULL,
+            response_type TEXT NOT NULL,
+            responded_at REAL,
+            PRIMARY KEY (notice_id, user_id)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS {schema}.idx_archived_notices_created_at ON notices (created_at, id);
+        """,
+    ),
+    Migration(
+        2,
+        "index archived notices",
+        # Earlier archive runs dropped moved notices from the search index; the archive
+        # is cold, so one statement puts them back.
+        """
+        INSERT INTO main.notices_fts (notice_id, title, content, agenda, location)
+            SELECT id, title, content, coalesce(agenda, ''), coalesce(location, '') FROM {schema}.notices;
+        """,
+    ),
+)
+
+
+@dataclass
+class NoticePage:
+    notices: list[Notice | MeetingNotice] = field(default_factory=list)
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
 
 
 class NoticeStore:
-    def __init__(self, db_path: Path | str = ":memory:") -> None:
-        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
-        self._conn.row_factory = sqlite3.Row
-        self._create_tables()
-
-    def _create_tables(self) -> None:
-        self._conn.executescript("""
-            CREATE TABLE IF NOT EXISTS notices (
-                id TEXT PRIMARY KEY,
-                type TEXT NOT NULL,
-                title TEXT NOT NULL,
-                content TEXT NOT NULL,
-                channel_id TEXT NOT NULL,
-                message_ts TEXT NOT NULL DEFAULT '',
-                author_id TEXT NOT NULL,
-                created_at REAL NOT NULL,
-                meeting_datetime TEXT,
-                location TEXT,
-                agenda TEXT
-            );
-            CREATE TABLE IF NOT EXISTS notice_responses (
-                notice_id TEXT NOT NULL,
-                user_id TEXT NOT NULL,
-                response_type TEXT NOT NULL,
-                responded_at REAL NOT NULL,
-                PRIMARY KEY (notice_id, user_id),
-                FOREIGN KEY (notice_id) REFERENCES notices(id)
-            );
-            CREATE TABLE IF NOT EXISTS remind_excludes (
-                user_id TEXT PRIMARY KEY
-            );
-        """)
+    def __init__(
+        self,
+        db_path: Path | str = ":memory:",
+        *,
+        read_pool_size: int = DEFAULT_READ_POOL_SIZE,
+        response_flush_interval: float | None = None,
+        notice_cache_size: int = DEFAULT_MAX_NOTICES,
+        compact_responses: bool = False,
+        compact_threshold: int = DEFAULT_COMPACT_THRESHOLD,
+        pool: ConnectionPool | None = None,
+        archive_path: Path | str | None = None,
+    ) -> None:
+        """Open the store at ``db_path``.
+
+        ``response_flush_interval`` enables write-behind for :meth:`mark_read` and
+        :meth:`set_attendance`: responses are buffered and committed in batches at most that
+        many seconds later, while reads on this store already include them. ``None`` commits
+        every response before returning.
+
+        ``notice_cache_size`` bounds the LRU of hydrated notices behind :meth:`get_notices`;
+        ``0`` disables it.
+
+        ``compact_responses`` keeps ``notice_responses`` as a write log only: every
+        ``compact_threshold`` rows it is folded into one bitmap BLOB per notice and response
+        type over interned user ids (see :meth:`compact_responses`).
+
+        Pass ``pool`` to share one :class:`ConnectionPool` with other stores; the notice
+        tables then live in its main schema and :meth:`close` leaves the pool open.
+
+        ``archive_path`` attaches a cold database that :meth:`archive_notices` moves old
+        notices into; :meth:`get_notices` falls back to it for ids missing from the hot
+        tables, and archived notices stay in the search index. A shared ``pool`` enables
+        the archive when it attaches an ``"archive"`` schema.
+        """
+        if pool is not None and archive_path is not None:
+            msg = "Attach the archive to the shared pool as the 'archive' schema instead"
+            raise ValueError(msg)
+        self._owns_pool = pool is None
+        if pool is None:
+            attach = {ARCHIVE_SCHEMA: archive_path} if archive_path is not None else None
+            pool = ConnectionPool(db_path, read_pool_size=read_pool_size, attach=attach)
+        self._pool = pool
+        self._archive = ARCHIVE_SCHEMA in pool.schemas
+        self._cache = NoticeCache(notice_cache_size) if notice_cache_size > 0 else None
+        self._touched: set[str] | None = None
+        self._responses: ResponseWriteBuffer | None = None
+        if response_flush_interval is not None:
+            self._responses = ResponseWriteBuffer(self._write_responses, flush_interval=response_flush_interval)
+        migrate(self._pool, _MIGRATIONS)
+        if self._archive:
+            migrate(self._pool, _ARCHIVE_MIGRATIONS, schema=ARCHIVE_SCHEMA)
+        self._compact = compact_responses
+        self._compact_threshold = compact_threshold
+        self._interner = UserInterner()
+        self._log_rows = 0
+        if compact_responses:
+            self._interner.load(self._pool.writer)
+            self._log_rows = self._pool.writer.execute("SELECT COUNT(*) FROM notice_responses").fetchone()[0]
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group several writes into one transaction that commits when the block exits.
+
+        The write lock is held for the whole block, so keep Slack API calls outside it.
+        """
+        touched: set[str] | None = None
+        try:
+            with self._pool.write():
+                if self._touched is not None:
+                    yield
+                    return
+                touched = self._touched = set()
+                try:
+                    yield
+                finally:
+                    self._touched = None
+        except BaseException:
+            # Cached notices may have been patched with writes that were just rolled back.
+            if self._cache is not None:
+                self._cache.clear()
+            raise
+        # Another thread may have cached the pre-commit rows while the block was open.
+        for notice_id in touched or ():
+            self._invalidate(notice_id)
 
     def create_notice(self, notice: Notice) -> None:
-        self._conn.execute(
-            """INSERT INTO notices (id, type, title, content, channel_id, message_ts, author_id, created_at)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                notice.notice_id,
-                notice.notice_type.value,
-                notice.title,
-                notice.content,
-                notice.channel_id,
-                notice.message_ts,
-                notice.author_id,
-                notice.created_at,
-            ),
-        )
-        self._conn.commit()
+        """Insert ``notice`` with its final ``message_ts`` in a single statement."""
+        with self._pool.write() as conn:
+            conn.execute(
+                """INSERT INTO notices (id, type, title, content, channel_id, message_ts, author_id, created_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                (
+                    notice.notice_id,
+                    notice.notice_type.value,
+                    notice.title,
+                    notice.content,
+                    notice.channel_id,
+                    notice.message_ts,
+                    notice.author_id,
+                    notice.created_at,
+                ),
+            )
 
     def create_meeting_notice(self, notice: MeetingNotice) -> None:
-        self._conn.execute(
-            """INSERT INTO notices
-               (id, type, title, content, channel_id, message_ts, author_id, created_at,
-                meeting_datetime, location, agenda)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                notice.notice_id,
-                notice.notice_type.value,
-                notice.title,
-                notice.content,
-                notice.channel_id,
-                notice.message_ts,
-                notice.author_id,
-                notice.created_at,
-                notice.meeting_datetime,
-                notice.location,
-                notice.agenda,
-            ),
-        )
-        self._conn.commit()
+        """Insert ``notice`` with its final ``message_ts`` in a single statement."""
+        with self._pool.write() as conn:
+            conn.execute(
+                """INSERT INTO notices
+                   (id, type, title, content, channel_id, message_ts, author_id, created_at,
+                    meeting_datetime, location, agenda)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (
+                    notice.notice_id,
+                    notice.notice_type.value,
+                    notice.title,
+                    notice.content,
+                    notice.channel_id,
+                    notice.message_ts,
+                    notice.author_id,
+                    notice.created_at,
+                    notice.meeting_datetime,
+                    notice.location,
+                    notice.agenda,
+                ),
+            )
 
     def update_notice(self, notice_id: str, title: str, content: str) -> None:
-        self._conn.execute(
-            "UPDATE notices SET title = ?, content = ? WHERE id = ?",
-            (title, content, notice_id),
-        )
-        self._conn.commit()
+        self._update_notice_row(notice_id, {"title": title, "content": content})
 
     def update_meeting_notice(
         self,
@@ -95,36 +503,162 @@ class NoticeStore:
         location: str,
         agenda: str,
     ) -> None:
-        self._conn.execute(
-            "UPDATE notices SET title = ?, content = ?, meeting_datetime = ?, location = ?, agenda = ? WHERE id = ?",
-            (title, f"회의: {title}", meeting_datetime, location, agenda, notice_id),
+        self._update_notice_row(
+            notice_id,
+            {
+                "title": title,
+                "content": f"회의: {title}",
+                "meeting_datetime": meeting_datetime,
+                "location": location,
+                "agenda": agenda,
+            },
         )
-        self._conn.commit()
 
     def update_message_ts(self, notice_id: str, message_ts: str) -> None:
-        self._conn.execute(
-            "UPDATE notices SET message_ts = ? WHERE id = ?",
-            (message_ts, notice_id),
-        )
-        self._conn.commit()
+        self._update_notice_row(notice_id, {"message_ts": message_ts})
+
+    def _update_notice_row(self, notice_id: str, values: Mapping[str, str]) -> None:
+        """Update the notice in whichever schema holds it: hot tables first, then the archive."""
+        assignments = ", ".join(f"{column} = ?" for column in values)
+        params = (*values.values(), notice_id)
+        with self._pool.write() as conn:
+            updated = conn.execute(f"UPDATE main.notices SET {assignments} WHERE id = ?", params).rowcount
+            if not updated and self._archive:
+                updated = conn.execute(
+                    f"UPDATE {ARCHIVE_SCHEMA}.notices SET {assignments} WHERE id = ?", params
+                ).rowcount
+                # The index triggers only watch main.notices.
+                if updated and values.keys() & _INDEXED_COLUMNS:
+                    _index_notices(conn, [notice_id], ARCHIVE_SCHEMA)
+        self._invalidate(notice_id)
 
     def get_notice(self, notice_id: str) -> Notice | MeetingNotice | None:
-        row = self._conn.execute("SELECT * FROM notices WHERE id = ?", (notice_id,)).fetchone()
-        if row is None:
-            return None
+        notices = self.get_notices([notice_id])
+        return notices[0] if notices else None
+
+    def get_notices(self, notice_ids: Sequence[str]) -> list[Notice | MeetingNotice]:
+        """Return several notices in the order of ``notice_ids``, skipping unknown ids.
+
+        Cached notices are served from memory; the rest are hydrated with two queries.
+        Ids missing from the hot tables are looked up in the archive, when one is attached.
+        """
+        if not notice_ids:
+            return []
+        unique_ids = list(dict.fromkeys(notice_ids))
+        if self._cache is None:
+            return self._load_notices(unique_ids)
+
+        found = self._cache.get_many(unique_ids)
+        missing = [nid for nid in unique_ids if nid not in found]
+        if missing:
+            generation = self._cache.generation
+            loaded = self._load_notices(missing)
+            self._cache.put_many(loaded, generation)
+            found.update((notice.notice_id, notice) for notice in loaded)
+        return [found[nid] for nid in unique_ids if nid in found]
 
-        responses = self._conn.execute(
-            "SELECT user_id, response_type FROM notice_responses WHERE notice_id = ?",
-            (notice_id,),
+    def cache_stats(self) -> NoticeCacheStats:
+        if self._cache is None:
+            return NoticeCacheStats(hits=0, misses=0, evictions=0, size=0)
+        return self._cache.stats()
+
+    def _load_notices(self, notice_ids: list[str]) -> list[Notice | MeetingNotice]:
+        placeholders = ", ".join("?" for _ in notice_ids)
+        with self._pool.read(snapshot=self._compact or self._archive) as conn:
+            rows = conn.execute(
+                f"SELECT * FROM notices WHERE id IN ({placeholders})",
+                tuple(notice_ids),
+            ).fetchall()
+            by_id = {row["id"]: row for row in rows}
+            archived: dict[str, dict[str, str]] = {}
+            missing = [nid for nid in notice_ids if nid not in by_id]
+            if self._archive and missing:
+                by_id.update(self._load_archived(conn, missing, archived))
+            ordered = [by_id[nid] for nid in notice_ids if nid in by_id]
+            return self._hydrate(conn, ordered, archived=archived)
+
+    @staticmethod
+    def _load_archived(
+        conn: sqlite3.Connection, notice_ids: list[str], responses: dict[str, dict[str, str]]
+    ) -> dict[str, sqlite3.Row]:
+        """Return archived notice rows by id and add their responses to ``responses``."""
+        placeholders = ", ".join("?" for _ in notice_ids)
+        rows = conn.execute(
+            f"SELECT * FROM {ARCHIVE_SCHEMA}.notices WHERE id IN ({placeholders})",
+            tuple(notice_ids),
+        ).fetchall()
+        if rows:
+            for resp in conn.execute(
+                f"""SELECT notice_id, user_id, response_type FROM {ARCHIVE_SCHEMA}.notice_responses
+                    WHERE notice_id IN ({placeholders})""",
+                tuple(notice_ids),
+            ):
+                responses.setdefault(resp["notice_id"], {})[resp["user_id"]] = resp["response_type"]
+        return {row["id"]: row for row in rows}
+
+    def _hydrate(
+        self,
+        conn: sqlite3.Connection,
+        rows: list[sqlite3.Row],
+        *,
+        with_responses: bool = True,
+        archived: Mapping[str, dict[str, str]] | None = None,
+    ) -> list[Notice | MeetingNotice]:
+        if not rows:
+            return []
+        if not with_responses:
+            return [self._build_notice(row, {}) for row in rows]
+        notice_ids = [row["id"] for row in rows]
+        # Take buffered responses first: a flush that commits after this point is either
+        # still listed here or already visible to the query below.
+        pending = self._pending_responses(notice_ids)
+        grouped: dict[str, dict[str, str]] = defaultdict(dict)
+        # Responses given after a notice was archived land in the hot tables and win.
+        for notice_id, responses in (archived or {}).items():
+            grouped[notice_id].update(responses)
+        if self._compact:
+            for notice_id, bitmaps in self._load_bitmaps(conn, notice_ids).items():
+                for response_type, bitmap in bitmaps.items():
+                    for i in bitmap.ids():
+                        grouped[notice_id][self._interner.user(conn, i)] = response_type
+        for resp in self._load_response_log(conn, notice_ids):
+            grouped[resp["notice_id"]][resp["user_id"]] = resp["response_type"]
+        for pending_resp in pending:
+            grouped[pending_resp.notice_id][pending_resp.user_id] = pending_resp.response_type
+
+        return [self._build_notice(row, grouped.get(row["id"], {})) for row in rows]
+
+    @staticmethod
+    def _load_response_log(conn: sqlite3.Connection, notice_ids: Sequence[str]) -> list[sqlite3.Row]:
+        placeholders = ", ".join("?" for _ in notice_ids)
+        return conn.execute(
+            f"SELECT notice_id, user_id, response_type FROM notice_responses WHERE notice_id IN ({placeholders})",
+            tuple(notice_ids),
         ).fetchall()
 
+    @staticmethod
+    def _load_bitmaps(conn: sqlite3.Connection, notice_ids: Sequence[str]) -> dict[str, dict[str, ResponseBitmap]]:
+        placeholders = ", ".join("?" for _ in notice_ids)
+        rows = conn.execute(
+            f"""SELECT notice_id, response_type, bitmap FROM notice_response_bitmaps
+                WHERE notice_id IN ({placeholders})""",
+            tuple(notice_ids),
+        ).fetchall()
+        bitmaps: dict[str, dict[str, ResponseBitmap]] = defaultdict(dict)
+        for row in rows:
+            bitmaps[row["notice_id"]][row["response_type"]] = ResponseBitmap.from_bytes(row["bitmap"])
+        return bitmaps
+
+    @staticmethod
+    def _build_notice(row: sqlite3.Row, responses: Mapping[str, str]) -> Notice | MeetingNotice:
+        """Build a notice from its row and a ``{user_id: response_type}`` mapping."""
         notice_type = NoticeType(row["type"])
 
         if notice_type == NoticeType.MEETING:
             attendance: dict[str, AttendanceStatus] = {}
-            for resp in responses:
-                if resp["response_type"] in {s.value for s in AttendanceStatus}:
-                    attendance[resp["user_id"]] = AttendanceStatus(resp["response_type"])
+            for user_id, response_type in responses.items():
+                if response_type in _ATTENDANCE_VALUES:
+                    attendance[user_id] = AttendanceStatus(response_type)
 
             return MeetingNotice(
                 notice_id=row["id"],
@@ -141,7 +675,7 @@ class NoticeStore:
                 attendance=attendance,
             )
 
-        read_by = [resp["user_id"] for resp in responses if resp["response_type"] == "read"]
+        read_by = dict.fromkeys(user_id for user_id, response_type in responses.items() if response_type == "read")
 
         return Notice(
             notice_id=row["id"],
@@ -161,64 +695,640 @@ class NoticeStore:
         limit: int = 10,
         offset: int = 0,
     ) -> list[Notice | MeetingNotice]:
+        with self._pool.read(snapshot=self._compact) as conn:
+            if channel_id:
+                rows = conn.execute(
+                    "SELECT * FROM notices WHERE channel_id = ? ORDER BY created_at DESC LIMIT ? OFFSET ?",
+                    (channel_id, limit, offset),
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT * FROM notices ORDER BY created_at DESC LIMIT ? OFFSET ?",
+                    (limit, offset),
+                ).fetchall()
+
+            return self._hydrate(conn, rows)
+
+    def list_notices_page(
+        self,
+        *,
+        limit: int = 10,
+        cursor: str | None = None,
+        channel_id: str | None = None,
+        with_responses: bool = True,
+    ) -> NoticePage:
+        """Return one page of notices using keyset pagination over ``(created_at, id)``.
+
+        ``cursor`` is an opaque token taken from a previous page's ``next_cursor`` or
+        ``prev_cursor``. Pages stay stable when new notices are created, and the cost of
+        a page does not depend on how deep it is. With ``with_responses=False`` the notices
+        come back without ``read_by``/``attendance``; use :meth:`count_responses` instead.
+        """
+        direction, key = _CURSOR_OLDER, None
+        if cursor:
+            direction, created_at, notice_id = _decode_cursor(cursor)
+            key = (created_at, notice_id)
+
+        conditions: list[str] = []
+        params: list[object] = []
         if channel_id:
-            rows = self._conn.execute(
-                "SELECT id FROM notices WHERE channel_id = ? ORDER BY created_at DESC LIMIT ? OFFSET ?",
-                (channel_id, limit, offset),
+            conditions.append("channel_id = ?")
+            params.append(channel_id)
+        if key is not None:
+            op = "<" if direction == _CURSOR_OLDER else ">"
+            conditions.append(f"(created_at, id) {op} (?, ?)")
+            params.extend(key)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        order = "DESC" if direction == _CURSOR_OLDER else "ASC"
+
+        with self._pool.read(snapshot=self._compact and with_responses) as conn:
+            rows = conn.execute(
+                f"SELECT * FROM notices {where} ORDER BY created_at {order}, id {order} LIMIT ?",
+                (*params, limit + 1),
             ).fetchall()
-        else:
-            rows = self._conn.execute(
-                "SELECT id FROM notices ORDER BY created_at DESC LIMIT ? OFFSET ?",
-                (limit, offset),
+            has_more = len(rows) > limit
+            rows = rows[:limit]
+            if direction == _CURSOR_NEWER:
+                rows.reverse()
+
+            page = NoticePage(notices=self._hydrate(conn, rows, with_responses=with_responses))
+        if not rows:
+            return page
+
+        first, last = rows[0], rows[-1]
+        has_older = has_more if direction == _CURSOR_OLDER else True
+        has_newer = key is not None and (has_more if direction == _CURSOR_NEWER else True)
+        if has_older:
+            page.next_cursor = _encode_cursor(_CURSOR_OLDER, last["created_at"], last["id"])
+        if has_newer:
+            page.prev_cursor = _encode_cursor(_CURSOR_NEWER, first["created_at"], first["id"])
+        return page
+
+    def search_notices(
+        self,
+        query: str,
+        *,
+        limit: int = 10,
+        cursor: str | None = None,
+        with_responses: bool = False,
+    ) -> NoticePage:
+        """Return one page of notices matching ``query``, best bm25 match first.
+
+        Title matches weigh most, then agenda and location, then content. ``cursor`` works
+        like in :meth:`list_notices_page`; it keys on ``(score, id)``, so a page may shift
+        slightly if notices are edited between requests.
+        """
+        match = _fts_search_query(query)
+        if not match:
+            return NoticePage()
+        direction, key = _CURSOR_OLDER, None
+        if cursor:
+            direction, score, notice_id = _decode_cursor(cursor)
+            key = (score, notice_id)
+
+        # "older" walks towards worse matches, i.e. higher bm25 scores.
+        params: list[object] = [match]
+        where = ""
+        if key is not None:
+            where = f"WHERE (score, notice_id) {'>' if direction == _CURSOR_OLDER else '<'} (?, ?)"
+            params.extend(key)
+        order = "ASC" if direction == _CURSOR_OLDER else "DESC"
+        with self._pool.read(snapshot=True) as conn:
+            hits = conn.execute(
+                f"""SELECT notice_id, score FROM (
+                        SELECT notice_id, bm25(notices_fts, 0.0, 10.0, 1.0, 2.0, 2.0) AS score
+                        FROM notices_fts WHERE notices_fts MATCH ?
+                    ) {where}
+                    ORDER BY score {order}, notice_id {order} LIMIT ?""",
+                (*params, limit + 1),
+            ).fetchall()
+            has_more = len(hits) > limit
+            hits = hits[:limit]
+            if direction == _CURSOR_NEWER:
+                hits.reverse()
+            if not hits:
+                return NoticePage()
+
+            placeholders = ", ".join("?" for _ in hits)
+            rows = conn.execute(
+                f"SELECT * FROM notices WHERE id IN ({placeholders})",
+                tuple(hit["notice_id"] for hit in hits),
+            ).fetchall()
+            by_id = {row["id"]: row for row in rows}
+            archived: dict[str, dict[str, str]] = {}
+            missing = [hit["notice_id"] for hit in hits if hit["notice_id"] not in by_id]
+            if self._archive and missing:
+                by_id.update(self._load_archived(conn, missing, archived))
+            ordered = [by_id[hit["notice_id"]] for hit in hits if hit["notice_id"] in by_id]
+            page = NoticePage(notices=self._hydrate(conn, ordered, with_responses=with_responses, archived=archived))
+
+        first, last = hits[0], hits[-1]
+        if has_more if direction == _CURSOR_OLDER else True:
+            page.next_cursor = _encode_cursor(_CURSOR_OLDER, last["score"], last["notice_id"])
+        if key is not None and (has_more if direction == _CURSOR_NEWER else True):
+            page.prev_cursor = _encode_cursor(_CURSOR_NEWER, first["score"], first["notice_id"])
+        return page
+
+    def count_search_results(self, query: str) -> int:
+        match = _fts_search_query(query)
+        if not match:
+            return 0
+        with self._pool.read() as conn:
+            row = conn.execute("SELECT COUNT(*) AS cnt FROM notices_fts WHERE notices_fts MATCH ?", (match,)).fetchone()
+        return int(row["cnt"]) if row else 0
+
+    def count_responses(self, notice_ids: Sequence[str]) -> dict[str, dict[str, int]]:
+        """Return ``{notice_id: {response_type: count}}``.
+
+        Reads the trigger-maintained ``notice_response_counts`` rows, so the cost does not
+        grow with the number of responses. In compact mode the counts come from bitmap sizes.
+        Archived notices are counted from their hydrated responses, archived and later ones.
+        """
+        if not notice_ids:
+            return {}
+        archived = self._archived_ids(notice_ids)
+        hot = [notice_id for notice_id in notice_ids if notice_id not in archived]
+        counts: dict[str, dict[str, int]] = {}
+        if hot:
+            counts = self._count_compacted_responses(hot) if self._compact else self._count_logged_responses(hot)
+        # Archived notices have no counter rows: count the responses they hydrate with.
+        for notice in self.get_notices(list(archived)):
+            counts[notice.notice_id] = _response_counts(notice)
+        return {notice_id: counts.get(notice_id, {}) for notice_id in notice_ids}
+
+    def _archived_ids(self, notice_ids: Sequence[str]) -> set[str]:
+        if not self._archive:
+            return set()
+        placeholders = ", ".join("?" for _ in notice_ids)
+        with self._pool.read() as conn:
+            rows = conn.execute(
+                f"SELECT id FROM {ARCHIVE_SCHEMA}.notices WHERE id IN ({placeholders})", tuple(notice_ids)
+            ).fetchall()
+        return {row["id"] for row in rows}
+
+    def _count_logged_responses(self, notice_ids: Sequence[str]) -> dict[str, dict[str, int]]:
+        placeholders = ", ".join("?" for _ in notice_ids)
+        pending = self._pending_responses(notice_ids)
+        with self._pool.read(snapshot=bool(pending)) as conn:
+            rows = conn.execute(
+                f"""SELECT notice_id, response_type, count FROM notice_response_counts
+                    WHERE notice_id IN ({placeholders})""",
+                tuple(notice_ids),
             ).fetchall()
+            stored: list[sqlite3.Row] = []
+            if pending:
+                keys = ", ".join("(?, ?)" for _ in pending)
+                stored = conn.execute(
+                    f"""SELECT notice_id, response_type FROM notice_responses
+                        WHERE (notice_id, user_id) IN (VALUES {keys})""",
+                    tuple(value for resp in pending for value in (resp.notice_id, resp.user_id)),
+                ).fetchall()
 
-        notices: list[Notice | MeetingNotice] = []
+        counts: dict[str, dict[str, int]] = {notice_id: {} for notice_id in notice_ids}
         for row in rows:
-            notice = self.get_notice(row["id"])
-            if notice is not None:
-                notices.append(notice)
-        return notices
+            counts[row["notice_id"]][row["response_type"]] = int(row["count"])
+        # Buffered responses replace whatever the same users had committed before.
+        for row in stored:
+            by_type = counts[row["notice_id"]]
+            by_type[row["response_type"]] -= 1
+            if not by_type[row["response_type"]]:
+                del by_type[row["response_type"]]
+        for resp in pending:
+            by_type = counts[resp.notice_id]
+            by_type[resp.response_type] = by_type.get(resp.response_type, 0) + 1
+        return counts
+
+    def _count_compacted_responses(self, notice_ids: Sequence[str]) -> dict[str, dict[str, int]]:
+        pending = self._pending_responses(notice_ids)
+        with self._pool.read(snapshot=True) as conn:
+            bitmaps = self._load_bitmaps(conn, notice_ids)
+            log = self._load_response_log(conn, notice_ids)
+            overrides = {(r["notice_id"], r["user_id"]): r["response_type"] for r in log}
+            overrides.update(((r.notice_id, r.user_id), r.response_type) for r in pending)
+            interned = self._interner.resolve(conn, {user_id for _, user_id in overrides})
+
+        counts: dict[str, dict[str, int]] = {notice_id: {} for notice_id in notice_ids}
+        for notice_id, notice_bitmaps in bitmaps.items():
+            counts[notice_id] = {response_type: len(bitmap) for response_type, bitmap in notice_bitmaps.items()}
+        # Logged and buffered responses replace whatever the bitmaps hold for the same user.
+        for (notice_id, user_id), response_type in overrides.items():
+            by_type = counts[notice_id]
+            i = interned.get(user_id)
+            for previous, bitmap in bitmaps.get(notice_id, {}).items():
+                if i is not None and i in bitmap:
+                    by_type[previous] -= 1
+            by_type[response_type] = by_type.get(response_type, 0) + 1
+        return {
+            notice_id: {response_type: n for response_type, n in by_type.items() if n}
+            for notice_id, by_type in counts.items()
+        }
+
+    def members_without_response(
+        self,
+        notice_id: str,
+        members: Sequence[str],
+        response_types: frozenset[str],
+    ) -> list[str]:
+        """Return ``members`` (in order) who have no response of ``response_types`` on the notice.
+
+        With compacted responses this is a bitmap difference between the interned members
+        and the responders; otherwise, or for an archived notice, it is a set lookup on the
+        hydrated notice.
+        """
+        if not self._compact or self._archived_ids([notice_id]):
+            notice = self.get_notice(notice_id)
+            if notice is None:
+                return list(members)
+            responded = set(notice.read_by) if "read" in response_types else set()
+            if isinstance(notice, MeetingNotice):
+                responded.update(u for u, status in notice.attendance.items() if status.value in response_types)
+            return [m for m in members if m not in responded]
+
+        pending = self._pending_responses([notice_id])
+        with self._pool.read(snapshot=True) as conn:
+            bitmaps = self._load_bitmaps(conn, [notice_id]).get(notice_id, {})
+            overrides = {r["user_id"]: r["response_type"] for r in self._load_response_log(conn, [notice_id])}
+            overrides.update((r.user_id, r.response_type) for r in pending)
+            interned = self._interner.resolve(conn, [*members, *overrides])
+
+        responders = ResponseBitmap()
+        for response_type, bitmap in bitmaps.items():
+            if response_type in response_types:
+                responders = responders | bitmap
+        responded_uninterned: set[str] = set()
+        for user_id, response_type in overrides.items():
+            i = interned.get(user_id)
+            if response_type in response_types:
+                if i is None:
+                    responded_uninterned.add(user_id)
+                else:
+                    responders.add(i)
+            elif i is not None:
+                responders.discard(i)
+
+        missing = ResponseBitmap.from_ids(interned[m] for m in members if m in interned) - responders
+        return [m for m in members if m not in responded_uninterned and (m not in interned or interned[m] in missing)]
+
+    def compact_responses(self) -> int:
+        """Fold the ``notice_responses`` log into per-notice bitmaps; returns the rows folded."""
+        if not self._compact:
+            return 0
+        self.flush_responses()
+        return self._fold_response_log()
+
+    def _fold_response_log(self) -> int:
+        with self._pool.write() as conn:
+            rows = conn.execute(
+                "SELECT notice_id, user_id, response_type FROM notice_responses ORDER BY responded_at"
+            ).fetchall()
+            if not rows:
+                return 0
+            user_ids = list(dict.fromkeys(row["user_id"] for row in rows))
+            assigned = self._interner.assign(conn, user_ids)
+            interned = {**self._interner.resolve(conn, [u for u in user_ids if u not in assigned]), **assigned}
+            notice_ids = list(dict.fromkeys(row["notice_id"] for row in rows))
+            bitmaps = self._load_bitmaps(conn, notice_ids)
+            for row in rows:
+                i = interned[row["user_id"]]
+                by_type = bitmaps[row["notice_id"]]
+                for bitmap in by_type.values():
+                    bitmap.discard(i)
+                by_type.setdefault(row["response_type"], ResponseBitmap()).add(i)
+
+            placeholders = ", ".join("?" for _ in notice_ids)
+            conn.execute(f"DELETE FROM notice_response_bitmaps WHERE notice_id IN ({placeholders})", notice_ids)
+            conn.executemany(
+                "INSERT INTO notice_response_bitmaps (notice_id, response_type, bitmap) VALUES (?, ?, ?)",
+                [
+                    (notice_id, response_type, bitmap.to_bytes())
+                    for notice_id, by_type in bitmaps.items()
+                    for response_type, bitmap in by_type.items()
+                    if bitmap
+                ],
+            )
+            conn.execute("DELETE FROM notice_responses")
+        self._interner.publish(assigned)
+        self._log_rows = 0
+        return len(rows)
+
+    def archive_notices(
+        self,
+        older_than: float,
+        *,
+        batch_size: int = DEFAULT_ARCHIVE_BATCH,
+        vacuum_pages: int = DEFAULT_VACUUM_PAGES,
+    ) -> int:
+        """Move notices created before ``older_than`` (epoch seconds) and their responses to the archive.
+
+        Each batch moves in its own transaction, so other writers wait for one batch at a
+        time. Notices with an unfinished reminder job stay hot. Afterwards freed pages are
+        returned with ``incremental_vacuum``. Returns how many notices were moved.
+        """
+        if not self._archive:
+            return 0
+        self.flush_responses()
+        moved = 0
+        while True:
+            batch = self._archive_batch(older_than, batch_size)
+            moved += batch
+            if batch < batch_size:
+                break
+        if moved:
+            self._incremental_vacuum(vacuum_pages)
+            logger.info("notices_archived", count=moved, older_than=older_than)
+        return moved
+
+    def _archive_batch(self, older_than: float, batch_size: int) -> int:
+        with self._pool.write() as conn:
+            notice_ids = [
+                row["id"]
+                for row in conn.execute(
+                    """SELECT id FROM notices
+                       WHERE created_at < ? AND id NOT IN (
+                           SELECT notice_id FROM reminder_jobs WHERE status != ?
+                       )
+                       ORDER BY created_at, id LIMIT ?""",
+                    (older_than, ReminderJobStatus.DONE.value, batch_size),
+                )
+            ]
+            if not notice_ids:
+                return 0
+            placeholders = ", ".join("?" for _ in notice_ids)
+            responses: dict[tuple[str, str], tuple[str, float | None]] = {}
+            if self._compact:
+                # Bitmaps keep no timestamps.
+                for notice_id, bitmaps in self._load_bitmaps(conn, notice_ids).items():
+                    for response_type, bitmap in bitmaps.items():
+                        for i in bitmap.ids():
+                            responses[(notice_id, self._interner.user(conn, i))] = (response_type, None)
+            for row in conn.execute(
+                f"""SELECT notice_id, user_id, response_type, responded_at FROM notice_responses
+                    WHERE notice_id IN ({placeholders})""",
+                notice_ids,
+            ):
+                responses[(row["notice_id"], row["user_id"])] = (row["response_type"], row["responded_at"])
+
+            conn.execute(
+                f"""INSERT OR REPLACE INTO {ARCHIVE_SCHEMA}.notices ({_NOTICE_COLUMNS})
+                    SELECT {_NOTICE_COLUMNS} FROM main.notices WHERE id IN ({placeholders})""",
+                notice_ids,
+            )
+            conn.executemany(
+                f"""INSERT OR REPLACE INTO {ARCHIVE_SCHEMA}.notice_responses
+                    (notice_id, user_id, response_type, responded_at) VALUES (?, ?, ?, ?)""",
+                [(nid, uid, rtype, at) for (nid, uid), (rtype, at) in responses.items()],
+            )
+            log_rows = conn.execute(
+                f"DELETE FROM main.notice_responses WHERE notice_id IN ({placeholders})", notice_ids
+            ).rowcount
+            conn.execute(f"DELETE FROM main.notice_response_bitmaps WHERE notice_id IN ({placeholders})", notice_ids)
+            conn.execute(f"DELETE FROM main.notices WHERE id IN ({placeholders})", notice_ids)
+            # The delete trigger dropped them from the search index; old notices stay searchable.
+            _index_notices(conn, notice_ids, ARCHIVE_SCHEMA)
+        self._log_rows = max(self._log_rows - log_rows, 0)
+        for notice_id in notice_ids:
+            self._invalidate(notice_id)
+        return len(notice_ids)
+
+    def _incremental_vacuum(self, pages: int) -> None:
+        with self._pool.write() as conn:
+            if conn.execute("PRAGMA main.auto_vacuum").fetchone()[0] != 2:  # INCREMENTAL
+                logger.info("notice_vacuum_skipped", reason="auto_vacuum is not incremental; run VACUUM once to enable")
+                return
+            conn.execute(f"PRAGMA main.incremental_vacuum({int(pages)})").fetchall()
 
     def count_notices(self, channel_id: str | None = None) -> int:
-        if channel_id:
-            row = self._conn.execute(
-                "SELECT COUNT(*) AS cnt FROM notices WHERE channel_id = ?",
-                (channel_id,),
-            ).fetchone()
-        else:
-            row = self._conn.execute("SELECT COUNT(*) AS cnt FROM notices").fetchone()
+        with self._pool.read() as conn:
+            if channel_id:
+                row = conn.execute(
+                    "SELECT COUNT(*) AS cnt FROM notices WHERE channel_id = ?",
+                    (channel_id,),
+                ).fetchone()
+            else:
+                row = conn.execute("SELECT COUNT(*) AS cnt FROM notices").fetchone()
         return int(row["cnt"]) if row else 0
 
     def mark_read(self, notice_id: str, user_id: str) -> None:
-        self._conn.execute(
-            """INSERT OR REPLACE INTO notice_responses (notice_id, user_id, response_type, responded_at)
-               VALUES (?, ?, 'read', ?)""",
-            (notice_id, user_id, time.time()),
-        )
-        self._conn.commit()
+        self._put_response(PendingResponse(notice_id, user_id, "read", time.time()))
 
     def set_attendance(self, notice_id: str, user_id: str, status: AttendanceStatus) -> None:
-        self._conn.execute(
-            """INSERT OR REPLACE INTO notice_responses (notice_id, user_id, response_type, responded_at)
-               VALUES (?, ?, ?, ?)""",
-            (notice_id, user_id, status.value, time.time()),
-        )
-        self._conn.commit()
+        self._put_response(PendingResponse(notice_id, user_id, status.value, time.time()))
+
+    def flush_responses(self) -> int:
+        """Commit buffered responses now; returns how many rows were written."""
+        return self._responses.flush() if self._responses is not None else 0
+
+    def _invalidate(self, notice_id: str) -> None:
+        if self._cache is None:
+            return
+        self._cache.invalidate(notice_id)
+        if self._touched is not None:
+            self._touched.add(notice_id)
+
+    def _put_response(self, response: PendingResponse) -> None:
+        if self._responses is None:
+            self._write_responses([response])
+        else:
+            self._responses.put(response)
+        if self._cache is None:
+            return
+        self._cache.patch(response.notice_id, lambda notice: _apply_response(notice, response))
+        if self._touched is not None:
+            self._touched.add(response.notice_id)
+
+    def _pending_responses(self, notice_ids: Sequence[str]) -> list[PendingResponse]:
+        if self._responses is None:
+            return []
+        return self._responses.pending_for(frozenset(notice_ids))
+
+    def _write_responses(self, responses: list[PendingResponse]) -> None:
+        with self._pool.write() as conn:
+            conn.executemany(
+                """INSERT INTO notice_responses (notice_id, user_id, response_type, responded_at)
+                   VALUES (?, ?, ?, ?)
+                   ON CONFLICT (notice_id, user_id)
+                   DO UPDATE SET response_type = excluded.response_type, responded_at = excluded.responded_at""",
+                [(r.notice_id, r.user_id, r.response_type, r.responded_at) for r in responses],
+            )
+        self._log_rows += len(responses)
+        # Not inside transaction(): interned ids are published before that one commits.
+        if self._compact and self._log_rows >= self._compact_threshold and self._touched is None:
+            self._fold_response_log()
 
     def add_remind_exclude(self, user_id: str) -> None:
-        self._conn.execute(
-            "INSERT OR IGNORE INTO remind_excludes (user_id) VALUES (?)",
-            (user_id,),
-        )
-        self._conn.commit()
+        with self._pool.write() as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO remind_excludes (user_id) VALUES (?)",
+                (user_id,),
+            )
 
     def remove_remind_exclude(self, user_id: str) -> None:
-        self._conn.execute("DELETE FROM remind_excludes WHERE user_id = ?", (user_id,))
-        self._conn.commit()
+        with self._pool.write() as conn:
+            conn.execute("DELETE FROM remind_excludes WHERE user_id = ?", (user_id,))
 
     def list_remind_excludes(self) -> list[str]:
-        rows = self._conn.execute("SELECT user_id FROM remind_excludes").fetchall()
+        with self._pool.read() as conn:
+            rows = conn.execute("SELECT user_id FROM remind_excludes").fetchall()
         return [row["user_id"] for row in rows]
 
+    def create_reminder_job(
+        self,
+        *,
+        notice_id: str,
+        kind: ReminderKind,
+        text: str,
+        requested_by: str,
+        feedback_channel_id: str,
+        user_ids: Sequence[str],
+    ) -> ReminderJob:
+        """Persist a reminder job and one pending delivery per recipient in a single transaction."""
+        user_ids = list(dict.fromkeys(user_ids))
+        created_at = time.time()
+        with self._pool.write() as conn:
+            cursor = conn.execute(
+                """INSERT INTO reminder_jobs
+                   (notice_id, kind, text, requested_by, feedback_channel_id, status, total, created_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                (
+                    notice_id,
+                    kind.value,
+                    text,
+                    requested_by,
+                    feedback_channel_id,
+                    ReminderJobStatus.PENDING.value,
+                    len(user_ids),
+                    created_at,
+                ),
+            )
+            job_id = int(cursor.lastrowid or 0)
+            conn.executemany(
+                "INSERT OR IGNORE INTO reminder_deliveries (job_id, user_id) VALUES (?, ?)",
+                [(job_id, user_id) for user_id in user_ids],
+            )
+        return ReminderJob(
+            job_id=job_id,
+            notice_id=notice_id,
+            kind=kind,
+            text=text,
+            requested_by=requested_by,
+            feedback_channel_id=feedback_channel_id,
+            status=ReminderJobStatus.PENDING,
+            total=len(user_ids),
+            created_at=created_at,
+        )
+
+    def claim_reminder_deliveries(self, limit: int) -> list[ReminderDelivery]:
+        """Mark up to ``limit`` pending deliveries as claimed and return them, oldest job first."""
+        with self._pool.write() as conn:
+            rows = conn.execute(
+                """SELECT d.job_id, d.user_id, j.text
+                   FROM reminder_deliveries d JOIN reminder_jobs j ON j.id = d.job_id
+                   WHERE d.status = 'pending'
+                   ORDER BY d.job_id
+                   LIMIT ?""",
+                (limit,),
+            ).fetchall()
+            if not rows:
+                return []
+            now = time.time()
+            conn.executemany(
+                "UPDATE reminder_deliveries SET status = 'claimed', claimed_at = ? WHERE job_id = ? AND user_id = ?",
+                [(now, row["job_id"], row["user_id"]) for row in rows],
+            )
+            conn.executemany(
+                "UPDATE reminder_jobs SET status = ? WHERE id = ? AND status = ?",
+                [
+                    (ReminderJobStatus.RUNNING.value, job_id, ReminderJobStatus.PENDING.value)
+                    for job_id in {row["job_id"] for row in rows}
+                ],
+            )
+        return [ReminderDelivery(job_id=row["job_id"], user_id=row["user_id"], text=row["text"]) for row in rows]
+
+    def complete_reminder_delivery(self, job_id: int, user_id: str, *, sent: bool) -> None:
+        """Checkpoint the outcome of one claimed delivery."""
+        column = "sent" if sent else "failed"
+        with self._pool.write() as conn:
+            cursor = conn.execute(
+                "UPDATE reminder_deliveries SET status = ? WHERE job_id = ? AND user_id = ? AND status = 'claimed'",
+                (column, job_id, user_id),
+            )
+            if cursor.rowcount:
+                conn.execute(
+                    f"UPDATE reminder_jobs SET {column} = {column} + 1 WHERE id = ?",
+                    (job_id,),
+                )
+
+    def finish_reminder_jobs(self) -> list[ReminderJob]:
+        """Mark jobs with no outstanding deliveries as done and return them."""
+        with self._pool.write() as conn:
+            rows = conn.execute(
+                """SELECT * FROM reminder_jobs j
+                   WHERE j.status IN (?, ?)
+                     AND NOT EXISTS (
+                       SELECT 1 FROM reminder_deliveries d
+                       WHERE d.job_id = j.id AND d.status IN ('pending', 'claimed')
+                     )""",
+                (ReminderJobStatus.PENDING.value, ReminderJobStatus.RUNNING.value),
+            ).fetchall()
+            conn.executemany(
+                "UPDATE reminder_jobs SET status = ?, finished_at = ? WHERE id = ?",
+                [(ReminderJobStatus.DONE.value, time.time(), row["id"]) for row in rows],
+            )
+        jobs = [self._build_reminder_job(row) for row in rows]
+        for job in jobs:
+            job.status = ReminderJobStatus.DONE
+        return jobs
+
+    def requeue_claimed_reminder_deliveries(self, claimed_before: float | None = None) -> int:
+        """Return deliveries left claimed by a crashed worker to the pending queue.
+
+        With ``claimed_before`` only claims older than that timestamp are requeued, so a
+        batch another worker is still sending is left alone.
+        """
+        with self._pool.write() as conn:
+            if claimed_before is None:
+                cursor = conn.execute(
+                    "UPDATE reminder_deliveries SET status = 'pending', claimed_at = NULL WHERE status = 'claimed'"
+                )
+            else:
+                cursor = conn.execute(
+                    """UPDATE reminder_deliveries SET status = 'pending', claimed_at = NULL
+                       WHERE status = 'claimed' AND claimed_at < ?""",
+                    (claimed_before,),
+                )
+        return cursor.rowcount
+
+    def get_reminder_job(self, job_id: int) -> ReminderJob | None:
+        with self._pool.read() as conn:
+            row = conn.execute("SELECT * FROM reminder_jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._build_reminder_job(row) if row is not None else None
+
+    def list_active_reminder_jobs(self) -> list[ReminderJob]:
+        with self._pool.read() as conn:
+            rows = conn.execute(
+                "SELECT * FROM reminder_jobs WHERE status IN (?, ?) ORDER BY id",
+                (ReminderJobStatus.PENDING.value, ReminderJobStatus.RUNNING.value),
+            ).fetchall()
+        return [self._build_reminder_job(row) for row in rows]
+
+    @staticmethod
+    def _build_reminder_job(row: sqlite3.Row) -> ReminderJob:
+        return ReminderJob(
+            job_id=row["id"],
+            notice_id=row["notice_id"],
+            kind=ReminderKind(row["kind"]),
+            text=row["text"],
+            requested_by=row["requested_by"],
+            feedback_channel_id=row["feedback_channel_id"],
+            status=ReminderJobStatus(row["status"]),
+            total=row["total"],
+            created_at=row["created_at"],
+            sent=row["sent"],
+            failed=row["failed"],
+        )
+
     def close(self) -> None:
-        self._conn.close()
+        if self._responses is not None:
+            self._responses.close()
+        if self._owns_pool:
+            self._pool.close()
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+
+_RESOLVE_CHUNK = 500
+
+
+class ResponseBitmap:
+    """Set of interned user ids stored as the bits of a Python int.
+
+    Bit ``n`` stands for the user interned as ``n``. Serialized as little-endian bytes, so
+    a notice with a few thousand responders costs a few hundred bytes in one BLOB.
+    """
+
+    __slots__ = ("_bits",)
+
+    def __init__(self, bits: int = 0) -> None:
+        self._bits = bits
+
+    @classmethod
+    def from_ids(cls, ids: Iterable[int]) -> ResponseBitmap:
+        bits = 0
+        for i in ids:
+            bits |= 1 << i
+        return cls(bits)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> ResponseBitmap:
+        return cls(int.from_bytes(data, "little"))
+
+    def to_bytes(self) -> bytes:
+        return self._bits.to_bytes((self._bits.bit_length() + 7) // 8, "little")
+
+    def add(self, i: int) -> None:
+        self._bits |= 1 << i
+
+    def discard(self, i: int) -> None:
+        self._bits &= ~(1 << i)
+
+    def ids(self) -> Iterator[int]:
+        bits = self._bits
+        while bits:
+            low = bits & -bits
+            yield low.bit_length() - 1
+            bits ^= low
+
+    def __contains__(self, i: object) -> bool:
+        return isinstance(i, int) and i >= 0 and bool(self._bits >> i & 1)
+
+    def __len__(self) -> int:
+        return self._bits.bit_count()
+
+    def __or__(self, other: ResponseBitmap) -> ResponseBitmap:
+        return ResponseBitmap(self._bits | other._bits)
+
+    def __and__(self, other: ResponseBitmap) -> ResponseBitmap:
+        return ResponseBitmap(self._bits & other._bits)
+
+    def __sub__(self, other: ResponseBitmap) -> ResponseBitmap:
+        return ResponseBitmap(self._bits & ~other._bits)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, ResponseBitmap) and self._bits == other._bits
+
+    def __hash__(self) -> int:
+        return hash(self._bits)
+
+    def __repr__(self) -> str:
+        return f"ResponseBitmap({sorted(self.ids())})"
+
+
+class UserInterner:
+    """Workspace-wide mapping between Slack user ids and small integers (the ``user_ids`` table).
+
+    The mapping only grows. It is loaded once and then kept in memory; new ids are
+    assigned inside the caller's write transaction and published with :meth:`publish`
+    after that transaction commits.
+    """
+
+    def __init__(self) -> None:
+        self._ids: dict[str, int] = {}
+        self._users: dict[int, str] = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def load(self, conn: sqlite3.Connection) -> None:
+        with self._lock:
+            if self._loaded:
+                return
+            for row in conn.execute("SELECT id, user_id FROM user_ids"):
+                self._ids[row["user_id"]] = row["id"]
+                self._users[row["id"]] = row["user_id"]
+            self._loaded = True
+
+    def resolve(self, conn: sqlite3.Connection, user_ids: Iterable[str]) -> dict[str, int]:
+        """Return the numbers of the interned users among ``user_ids``; others are left out.
+
+        Ids unknown to this process are looked up once in case another connection has
+        interned them since :meth:`load`.
+        """
+        known: dict[str, int] = {}
+        unknown: list[str] = []
+        for user_id in user_ids:
+            i = self._ids.get(user_id)
+            if i is None:
+                unknown.append(user_id)
+            else:
+                known[user_id] = i
+        for start in range(0, len(unknown), _RESOLVE_CHUNK):
+            chunk = unknown[start : start + _RESOLVE_CHUNK]
+            placeholders = ", ".join("?" for _ in chunk)
+            found = {
+                row["user_id"]: row["id"]
+                for row in conn.execute(f"SELECT id, user_id FROM user_ids WHERE user_id IN ({placeholders})", chunk)
+            }
+            if found:
+                self.publish(found)
+                known.update(found)
+        return known
+
+    def user(self, conn: sqlite3.Connection, i: int) -> str:
+        """Return the user interned as ``i``, reading ids committed by another connection if needed."""
+        user_id = self._users.get(i)
+        if user_id is None:
+            row = conn.execute("SELECT user_id FROM user_ids WHERE id = ?", (i,)).fetchone()
+            user_id = str(row["user_id"])
+            self.publish({user_id: i})
+        return user_id
+
+    def assign(self, conn: sqlite3.Connection, user_ids: Iterable[str]) -> dict[str, int]:
+        """Intern ids unknown to this process and return their numbers (unpublished).
+
+        Another process sharing the database may have interned some of them already, so
+        an existing row is reused rather than inserted twice.
+        """
+        assigned: dict[str, int] = {}
+        for user_id in user_ids:
+            if user_id in self._ids or user_id in assigned:
+                continue
+            conn.execute("INSERT OR IGNORE INTO user_ids (user_id) VALUES (?)", (user_id,))
+            row = conn.execute("SELECT id FROM user_ids WHERE user_id = ?", (user_id,)).fetchone()
+            assigned[user_id] = int(row["id"])
+        return assigned
+
+    def publish(self, assigned: dict[str, int]) -> None:
+        with self._lock:
+            for user_id, i in assigned.items():
+                self._ids[user_id] = i
+                self._users[i] = user_id
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Collection
+from dataclasses import dataclass
+
+import structlog
+
+logger = structlog.get_logger()
+
+DEFAULT_FLUSH_INTERVAL = 0.05
+DEFAULT_MAX_BATCH = 256
+
+
+@dataclass(frozen=True)
+class PendingResponse:
+    notice_id: str
+    user_id: str
+    response_type: str
+    responded_at: float
+
+
+class ResponseWriteBuffer:
+    """Write-behind buffer for notice response upserts.
+
+    :meth:`put` only records the response in memory; a background thread writes the
+    buffered rows in one transaction every ``flush_interval`` seconds, or as soon as
+    ``max_batch`` rows are waiting. Rows stay visible through :meth:`pending_for` until
+    their transaction has committed, which lets the store give read-your-writes.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[list[PendingResponse]], None],
+        *,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_batch: int = DEFAULT_MAX_BATCH,
+    ) -> None:
+        self._write = write
+        self._flush_interval = flush_interval
+        self._max_batch = max_batch
+        self._pending: dict[tuple[str, str], PendingResponse] = {}
+        self._cond = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._closed = False
+        self._thread: threading.Thread | None = None
+
+    def put(self, response: PendingResponse) -> None:
+        with self._cond:
+            if self._closed:
+                msg = "Response buffer is closed"
+                raise RuntimeError(msg)
+            self._pending[(response.notice_id, response.user_id)] = response
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True, name="response-flusher")
+                self._thread.start()
+            self._cond.notify()
+
+    def pending_for(self, notice_ids: Collection[str]) -> list[PendingResponse]:
+        """Return buffered responses for ``notice_ids`` that are not committed yet."""
+        with self._cond:
+            if not self._pending:
+                return []
+            return [r for r in self._pending.values() if r.notice_id in notice_ids]
+
+    def flush(self) -> int:
+        """Write every buffered response now and return how many rows were written."""
+        with self._flush_lock:
+            with self._cond:
+                batch = list(self._pending.values())
+            if not batch:
+                return 0
+            self._write(batch)
+            with self._cond:
+                for response in batch:
+                    key = (response.notice_id, response.user_id)
+                    # A newer click for the same user may have arrived while writing.
+                    if self._pending.get(key) is response:
+                        del self._pending[key]
+            logger.debug("responses_flushed", rows=len(batch))
+            return len(batch)
+
+    def close(self) -> None:
+        """Stop the flusher thread and write whatever is still buffered."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+        self.flush()
+
+    def __len__(self) -> int:
+        with self._cond:
+            return len(self._pending)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                deadline = time.monotonic() + self._flush_interval
+                while len(self._pending) < self._max_batch and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("response_flush_failed", pending=len(self))
+                with self._cond:
+                    self._cond.wait(self._flush_interval)
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from slack_bolt.context.ack import Ack
+
+
+def ack_only(ack: Ack) -> None:
+    """Acknowledge the request right away and leave the work to the lazy listeners.
+
+    Register slow handlers as ``app.action(...)(ack=ack_only, lazy=[handler])``: Bolt
+    acknowledges first and runs ``handler`` on its executor afterwards, so Slack and
+    SQLite latency never count against the 3 second acknowledgement window.
+    """
+    ack()
+
+
+def action_id(body: dict[str, object]) -> str:
+    """Return the ``action_id`` of the first action in a ``block_actions`` payload."""
+    actions: list[dict[str, str]] = body.get("actions", [])  # type: ignore[assignment]
+    return actions[0].get("action_id", "") if actions else ""
+
+
+def action_value(body: dict[str, object]) -> str:
+    """Return the ``value`` of the first action in a ``block_actions`` payload."""
+    actions: list[dict[str, str]] = body.get("actions", [])  # type: ignore[assignment]
+    return (actions[0].get("value") or "") if actions else ""
+
+
+def body_user_id(body: dict[str, object]) -> str:
+    user: dict[str, str] = body.get("user") or {}  # type: ignore[assignment]
+    return user.get("id", "")
+
+
+def body_channel_id(body: dict[str, object]) -> str:
+    """Return the channel the action came from, or ``""`` for the home tab and modals."""
+    channel: dict[str, str] = body.get("channel") or {}  # type: ignore[assignment]
+    return channel.get("id", "")
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import datetime
+import json
+from dataclasses import dataclass
 from typing import Any
 
-from src.store.models import AttendanceStatus, MeetingNotice, Notice, NoticeType
+from src.store.models import AttendanceStatus, MeetingNotice, Notice, NoticeType, ReminderJob, ReminderKind
 
 
 _KST = datetime.timezone(datetime.timedelta(hours=9))
@@ -13,6 +15,11 @@ def _format_ts(ts: float, fmt: str = "%Y-%m-%d %H:%M") -> str:
     return datetime.datetime.fromtimestamp(ts, tz=_KST).strftime(fmt)
 
 
+def _escape_mrkdwn(text: str) -> str:
+    """Escape user input so Slack shows it as typed instead of as mentions or links."""
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
 def build_notice_create_modal(channel_id: str = "") -> dict[str, Any]:
     channel_element: dict[str, Any] = {
         "type": "channels_select",
@@ -258,8 +265,8 @@ def build_notice_list_message(notices: list[Notice | MeetingNotice]) -> dict[str
 
 
 def build_notice_status_message(notice: Notice, members: list[str]) -> dict[str, Any]:
-    read_users = notice.read_by
-    unread_users = [m for m in members if m not in read_users]
+    read_users = list(notice.read_by)
+    unread_users = notice.unread_members(members)
 
     read_text = ", ".join(f"<@{u}>" for u in read_users) if read_users else "없음"
     unread_text = ", ".join(f"<@{u}>" for u in unread_users) if unread_users else "없음"
@@ -323,7 +330,7 @@ def build_meeting_status_message(notice: MeetingNotice, members: list[str]) -> d
     online = [u for u, s in notice.attendance.items() if s == AttendanceStatus.ONLINE]
     offline = [u for u, s in notice.attendance.items() if s == AttendanceStatus.OFFLINE]
     absent = [u for u, s in notice.attendance.items() if s == AttendanceStatus.ABSENT]
-    no_response = [m for m in members if m not in notice.attendance]
+    no_response = notice.non_responders(members)
 
     def _user_list(users: list[str]) -> str:
         return ", ".join(f"<@{u}>" for u in users) if users else "없음"
@@ -392,6 +399,26 @@ def build_meeting_status_modal(notice: MeetingNotice, members: list[str]) -> dic
     }
 
 
+def build_status_modal(notice: Notice | MeetingNotice, members: list[str]) -> dict[str, Any]:
+    if isinstance(notice, MeetingNotice):
+        return build_meeting_status_modal(notice, members)
+    return build_notice_status_modal(notice, members)
+
+
+def build_message_modal(title: str, text: str) -> dict[str, Any]:
+    return {
+        "type": "modal",
+        "title": {"type": "plain_text", "text": title},
+        "close": {"type": "plain_text", "text": "닫기"},
+        "blocks": [{"type": "section", "text": {"type": "mrkdwn", "text": text}}],
+    }
+
+
+def build_loading_modal(title: str) -> dict[str, Any]:
+    """Placeholder opened right away while the real content is built; replaced with ``views_update``."""
+    return build_message_modal(title, ":hourglass_flowing_sand: 불러오는 중입니다...")
+
+
 def build_notice_edit_modal(notice: Notice) -> dict[str, Any]:
     return {
         "type": "modal",
@@ -482,6 +509,93 @@ def build_meeting_notice_edit_modal(notice: MeetingNotice) -> dict[str, Any]:
     }
 
 
+def build_edit_modal(notice: Notice | MeetingNotice) -> dict[str, Any]:
+    if isinstance(notice, MeetingNotice):
+        return build_meeting_notice_edit_modal(notice)
+    return build_notice_edit_modal(notice)
+
+
+def _page_button_value(cursor: str, offset: int, query: str = "") -> str:
+    data: dict[str, object] = {"cursor": cursor, "offset": offset}
+    if query:
+        data["query"] = query
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+def parse_dashboard_page_value(value: str) -> tuple[str | None, int]:
+    """Return ``(cursor, offset)`` from a dashboard pagination button value."""
+    try:
+        data = json.loads(value)
+        return str(data["cursor"]), int(data["offset"])
+    except (ValueError, TypeError, KeyError):
+        return None, 0
+
+
+def parse_search_page_value(value: str) -> tuple[str, str | None, int]:
+    """Return ``(query, cursor, offset)`` from a search result pagination button value."""
+    try:
+        query = str(json.loads(value).get("query", ""))
+    except (ValueError, TypeError, AttributeError):
+        query = ""
+    cursor, offset = parse_dashboard_page_value(value)
+    return query, cursor, offset
+
+
+@dataclass(frozen=True)
+class NoticeForm:
+    title: str
+    content: str
+    channel_id: str
+
+
+@dataclass(frozen=True)
+class MeetingNoticeForm:
+    title: str
+    meeting_datetime: str
+    location: str
+    agenda: str
+    channel_id: str
+
+
+def _form_values(view: dict[str, object]) -> dict[str, dict[str, dict[str, Any]]]:
+    state: dict[str, object] = view.get("state") or {}  # type: ignore[assignment]
+    return state.get("values") or {}  # type: ignore[return-value]
+
+
+def _form_value(values: dict[str, dict[str, dict[str, Any]]], block_id: str, action_id: str, key: str = "value") -> str:
+    return str(values.get(block_id, {}).get(action_id, {}).get(key) or "")
+
+
+def parse_notice_form(view: dict[str, object]) -> NoticeForm:
+    """Read a submitted create or edit notice modal; the edit modal has no channel input."""
+    values = _form_values(view)
+    return NoticeForm(
+        title=_form_value(values, "title_block", "title_input"),
+        content=_form_value(values, "content_block", "content_input"),
+        channel_id=_form_value(values, "channel_block", "channel_input", "selected_channel"),
+    )
+
+
+def parse_meeting_notice_form(view: dict[str, object]) -> MeetingNoticeForm:
+    """Read a submitted create or edit meeting notice modal; the edit modal has no channel input."""
+    values = _form_values(view)
+    return MeetingNoticeForm(
+        title=_form_value(values, "title_block", "title_input"),
+        meeting_datetime=_form_value(values, "datetime_block", "datetime_input", "selected_date_time"),
+        location=_form_value(values, "location_block", "location_input"),
+        agenda=_form_value(values, "agenda_block", "agenda_input"),
+        channel_id=_form_value(values, "channel_block", "channel_input", "selected_channel"),
+    )
+
+
+def parse_remind_exclude_form(view: dict[str, object]) -> list[str]:
+    """Return the users selected in a submitted remind exclude modal."""
+    selected: list[str] = (
+        _form_values(view).get("exclude_block", {}).get("remind_exclude_users", {}).get("selected_users") or []
+    )
+    return selected
+
+
 def _build_dashboard_blocks(
     notices: list[Notice | MeetingNotice],
     *,
@@ -489,16 +603,23 @@ def _build_dashboard_blocks(
     total_count: int = 0,
     offset: int = 0,
     page_size: int = 5,
+    next_cursor: str | None = None,
+    prev_cursor: str | None = None,
     include_pagination: bool = False,
     viewer_id: str = "",
+    search_query: str = "",
 ) -> list[dict[str, Any]]:
     blocks: list[dict[str, Any]] = []
+    page_action = "notice_search_page" if search_query else "dashboard_page"
 
     if not notices:
         blocks.append(
             {
                 "type": "section",
-                "text": {"type": "mrkdwn", "text": "등록된 공지가 없습니다."},
+                "text": {
+                    "type": "mrkdwn",
+                    "text": "검색 결과가 없습니다." if search_query else "등록된 공지가 없습니다.",
+                },
             }
         )
     else:
@@ -556,19 +677,18 @@ def _build_dashboard_blocks(
             blocks.append({"type": "actions", "elements": buttons})
             blocks.append({"type": "divider"})
 
-    if include_pagination and total_count > page_size:
-        current_page = offset // page_size
-        total_pages = (total_count + page_size - 1) // page_size
+    if include_pagination and (prev_cursor or next_cursor):
         start = offset + 1
-        end = min(offset + page_size, total_count)
+        end = offset + len(notices)
 
         nav_buttons: list[dict[str, Any]] = []
-        if current_page > 0:
+        if prev_cursor:
             nav_buttons.append(
                 {
                     "type": "button",
                     "text": {"type": "plain_text", "text": "◀ 이전"},
-                    "action_id": f"dashboard_page_{(current_page - 1) * page_size}",
+                    "action_id": f"{page_action}_prev",
+                    "value": _page_button_value(prev_cursor, max(offset - page_size, 0), search_query),
                 }
             )
         nav_buttons.append(
@@ -578,15 +698,16 @@ def _build_dashboard_blocks(
                     "type": "plain_text",
                     "text": f"{start}-{end} / {total_count}건",
                 },
-                "action_id": "dashboard_page_noop",
+                "action_id": f"{page_action}_noop",
             }
         )
-        if current_page < total_pages - 1:
+        if next_cursor:
             nav_buttons.append(
                 {
                     "type": "button",
                     "text": {"type": "plain_text", "text": "다음 ▶"},
-                    "action_id": f"dashboard_page_{(current_page + 1) * page_size}",
+                    "action_id": f"{page_action}_next",
+                    "value": _page_button_value(next_cursor, offset + page_size, search_query),
                 }
             )
         blocks.append({"type": "actions", "elements": nav_buttons})
@@ -594,6 +715,20 @@ def _build_dashboard_blocks(
     return blocks
 
 
+def _build_reminder_job_blocks(jobs: list[ReminderJob]) -> list[dict[str, Any]]:
+    lines = []
+    for job in jobs:
+        label = "참석 여부" if job.kind == ReminderKind.NON_RESPONDERS else "읽음 확인"
+        lines.append(f"• {label} 리마인드 `{job.notice_id}`: {job.total - job.remaining}/{job.total}명 처리")
+    return [
+        {
+            "type": "section",
+            "text": {"type": "mrkdwn", "text": "*리마인드 발송 중*\n" + "\n".join(lines)},
+        },
+        {"type": "divider"},
+    ]
+
+
 def build_home_tab_view(
     notices: list[Notice | MeetingNotice],
     *,
@@ -601,7 +736,11 @@ def build_home_tab_view(
     total_count: int = 0,
     offset: int = 0,
     page_size: int = 5,
+    next_cursor: str | None = None,
+    prev_cursor: str | None = None,
     viewer_id: str = "",
+    reminder_jobs: list[ReminderJob] | None = None,
+    search_query: str = "",
 ) -> dict[str, Any]:
     blocks: list[dict[str, Any]] = [
         {
@@ -629,8 +768,23 @@ def build_home_tab_view(
                 },
             ],
         },
+        _build_search_input_block(search_query),
         {"type": "divider"},
     ]
+    if reminder_jobs:
+        blocks.extend(_build_reminder_job_blocks(reminder_jobs))
+    if search_query:
+        blocks.append(
+            {
+                "type": "section",
+                "text": {"type": "mrkdwn", "text": f"*'{_escape_mrkdwn(search_query)}'* 검색 결과 {total_count}건"},
+                "accessory": {
+                    "type": "button",
+                    "text": {"type": "plain_text", "text": "검색 초기화"},
+                    "action_id": "home_notice_search_clear",
+                },
+            }
+        )
     blocks.extend(
         _build_dashboard_blocks(
             notices,
@@ -638,8 +792,11 @@ def build_home_tab_view(
             total_count=total_count,
             offset=offset,
             page_size=page_size,
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
             include_pagination=True,
             viewer_id=viewer_id,
+            search_query=search_query,
         )
     )
     return {
@@ -648,6 +805,65 @@ def build_home_tab_view(
     }
 
 
+def _build_search_input_block(search_query: str) -> dict[str, Any]:
+    element: dict[str, Any] = {
+        "type": "plain_text_input",
+        "action_id": "home_notice_search",
+        "placeholder": {"type": "plain_text", "text": "제목, 내용, 안건, 장소로 검색"},
+        "dispatch_action_config": {"trigger_actions_on": ["on_enter_pressed"]},
+    }
+    if search_query:
+        element["initial_value"] = search_query
+    return {
+        "type": "input",
+        # Slack keeps typed text per block_id; switching ids empties the box after a reset.
+        "block_id": "home_notice_search_active" if search_query else "home_notice_search",
+        "dispatch_action": True,
+        "optional": True,
+        "label": {"type": "plain_text", "text": "공지 검색"},
+        "element": element,
+    }
+
+
+def build_notice_search_modal(
+    query: str,
+    notices: list[Notice | MeetingNotice],
+    *,
+    response_rates: dict[str, str] | None = None,
+    total_count: int = 0,
+    offset: int = 0,
+    page_size: int = 5,
+    next_cursor: str | None = None,
+    prev_cursor: str | None = None,
+    viewer_id: str = "",
+) -> dict[str, Any]:
+    return {
+        "type": "modal",
+        "callback_id": "notice_search_modal",
+        "title": {"type": "plain_text", "text": "공지 검색"},
+        "close": {"type": "plain_text", "text": "닫기"},
+        "blocks": [
+            {
+                "type": "section",
+                "text": {"type": "mrkdwn", "text": f"*'{_escape_mrkdwn(query)}'* 검색 결과 {total_count}건"},
+            },
+            {"type": "divider"},
+            *_build_dashboard_blocks(
+                notices,
+                response_rates=response_rates,
+                total_count=total_count,
+                offset=offset,
+                page_size=page_size,
+                next_cursor=next_cursor,
+                prev_cursor=prev_cursor,
+                include_pagination=True,
+                viewer_id=viewer_id,
+                search_query=query,
+            ),
+        ],
+    }
+
+
 def build_notice_delete_confirm_modal(notice: Notice | MeetingNotice) -> dict[str, Any]:
     type_label = "회의" if notice.notice_type == NoticeType.MEETING else "일반"
     return {
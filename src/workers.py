@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import multiprocessing
+import queue
+import signal
+import threading
+import time
+from collections.abc import Callable
+from multiprocessing.process import BaseProcess
+from multiprocessing.queues import Queue
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from src.config import Settings
+from src.healthcheck import collect_stats, register_stats, start_healthcheck_server
+from src.logging_config import setup_logging
+from src.services.leader_election import LEADER_LEASE
+from src.store.lease_store import LeaseStore
+
+logger = structlog.get_logger()
+
+RESTART_DELAY = 1.0
+MAX_RESTART_DELAY = 60.0
+# A worker that ran at least this long before exiting is restarted without backoff.
+HEALTHY_UPTIME = 60.0
+STOP_TIMEOUT = 10.0
+# How often each worker sends its /stats counters to the supervisor.
+STATS_REPORT_INTERVAL = 5.0
+
+Serve = Callable[[Settings], None]
+StatsReport = tuple[int, dict[str, Any]]
+
+
+def _report_stats(index: int, reports: Queue[StatsReport], interval: float) -> None:
+    while True:
+        time.sleep(interval)
+        try:
+            reports.put((index, collect_stats()))
+        except Exception:
+            logger.exception("worker_stats_report_failed", worker=index)
+
+
+def _worker_main(serve: Serve, settings: Settings, index: int, reports: Queue[StatsReport], interval: float) -> None:
+    setup_logging(log_level=settings.log_level, json_output=settings.log_json)
+    logger.info("worker_process_started", worker=index)
+    # Reports are snapshots; exiting must not wait for an unread one to be flushed.
+    reports.cancel_join_thread()
+    threading.Thread(target=_report_stats, args=(index, reports, interval), daemon=True, name="worker-stats").start()
+    serve(settings)
+
+
+class WorkerSupervisor:
+    """Keeps ``settings.workers`` Socket Mode worker processes running on this host.
+
+    Every worker runs ``serve`` and so holds its own Socket Mode connection; Slack spreads
+    envelopes across all open connections of the app, so handler throughput grows with the
+    number of cores. Workers share the SQLite files in ``DATA_DIR`` (WAL), and background
+    jobs run only in the worker holding the leader lease. A worker that exits is restarted,
+    with exponential backoff while it keeps crashing right after start. Each worker sends
+    the counters it registers for ``/stats`` every ``stats_interval`` seconds, and
+    :meth:`worker_stats` serves the latest ones from the supervisor.
+    """
+
+    def __init__(self, settings: Settings, serve: Serve, *, stats_interval: float = STATS_REPORT_INTERVAL) -> None:
+        self._settings = settings
+        self._serve = serve
+        self._stats_interval = stats_interval
+        # Spawned, not forked: the parent may already run threads (e.g. the healthcheck).
+        self._context = multiprocessing.get_context("spawn")
+        self._reports: Queue[StatsReport] = self._context.Queue()
+        self._worker_stats: dict[int, dict[str, Any]] = {}
+        self._processes: dict[int, BaseProcess] = {}
+        self._started_at: dict[int, float] = {}
+        self._delays: dict[int, float] = {}
+        self._restart_at: dict[int, float] = {}
+        self._restarts = 0
+        self._lock = threading.Lock()
+        data_dir = Path(settings.data_dir)
+        data_dir.mkdir(parents=True, exist_ok=True)
+        self._leases = LeaseStore(data_dir / "leases.db")
+
+    def start(self) -> None:
+        for index in range(self._settings.workers):
+            self._spawn(index)
+
+    def supervise_once(self) -> None:
+        """Collect stats reports and restart workers that have exited, once their backoff delay has passed."""
+        now = time.monotonic()
+        with self._lock:
+            self._drain_reports()
+            for index, process in list(self._processes.items()):
+                if process.is_alive():
+                    continue
+                self._worker_stats.pop(index, None)
+                if index not in self._restart_at:
+                    uptime = now - self._started_at[index]
+                    delay = RESTART_DELAY if uptime >= HEALTHY_UPTIME else self._delays.get(index, RESTART_DELAY)
+                    self._delays[index] = min(delay * 2, MAX_RESTART_DELAY)
+                    self._restart_at[index] = now + delay
+                    logger.warning("worker_process_exited", worker=index, exitcode=process.exitcode, restart_in=delay)
+                if now >= self._restart_at[index]:
+                    del self._restart_at[index]
+                    self._restarts += 1
+                    self._spawn(index)
+
+    def stop(self, timeout: float = STOP_TIMEOUT) -> None:
+        """Send SIGTERM to every worker so it can flush and hand over its lease, then reap it."""
+        with self._lock:
+            processes = list(self._processes.values())
+            self._processes.clear()
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        deadline = time.monotonic() + timeout
+        for process in processes:
+            process.join(max(deadline - time.monotonic(), 0.0))
+            if process.is_alive():
+                logger.warning("worker_process_killed", pid=process.pid)
+                process.kill()
+                process.join()
+        self._reports.close()
+        self._leases.close()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            alive = [p.pid for p in self._processes.values() if p.is_alive()]
+            restarts = self._restarts
+        return {
+            "workers": self._settings.workers,
+            "alive": len(alive),
+            "pids": alive,
+            "restarts": restarts,
+            "leader": self._leases.holder(LEADER_LEASE, time.time()),
+        }
+
+    def worker_stats(self) -> dict[str, Any]:
+        """The latest ``/stats`` counters each live worker reported, keyed by worker index."""
+        with self._lock:
+            return {str(index): stats for index, stats in sorted(self._worker_stats.items())}
+
+    def _drain_reports(self) -> None:
+        while True:
+            try:
+                index, stats = self._reports.get_nowait()
+            except queue.Empty:
+                return
+            self._worker_stats[index] = stats
+
+    def _spawn(self, index: int) -> None:
+        process = self._context.Process(
+            target=_worker_main,
+            args=(self._serve, self._settings, index, self._reports, self._stats_interval),
+            name=f"socket-worker-{index}",
+            daemon=False,
+        )
+        process.start()
+        self._processes[index] = process
+        self._started_at[index] = time.monotonic()
+
+
+def run_workers(settings: Settings, serve: Serve) -> None:
+    """Run ``settings.workers`` worker processes plus the healthcheck until SIGTERM or SIGINT."""
+    setup_logging(log_level=settings.log_level, json_output=settings.log_json)
+    stopping = threading.Event()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(signum, lambda *_: stopping.set())
+
+    supervisor = WorkerSupervisor(settings, serve)
+    supervisor.start()
+    register_stats("workers", supervisor.stats)
+    register_stats("worker_stats", supervisor.worker_stats)
+    start_healthcheck_server(port=settings.healthcheck_port)
+    logger.info("worker_supervisor_started", workers=settings.workers)
+    try:
+        while not stopping.wait(1.0):
+            supervisor.supervise_once()
+    finally:
+        supervisor.stop()
+        logger.info("worker_supervisor_stopped")
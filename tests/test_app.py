@@ -1,13 +1,23 @@
 from __future__ import annotations
 
 import json
+import time
+from collections.abc import Sequence
+from dataclasses import replace
+from pathlib import Path
 from unittest.mock import patch
 
-from slack_bolt import App, BoltRequest
+import pytest
+from slack_bolt import App, BoltRequest, BoltResponse
 from slack_sdk.web import SlackResponse
 
 from src.app import create_app
+from src.bootstrap import open_notice_store
 from src.config import Settings
+from src.healthcheck import health_response
+from src.middleware import DedupeMiddleware
+from src.services.event_dedupe import EventDeduplicator, delivery_key
+from src.store.event_store import ProcessedEventStore
 
 _MOCK_AUTH_RESPONSE = SlackResponse(
     client=None,  # type: ignore[arg-type]
@@ -28,11 +38,12 @@ def _make_settings() -> Settings:
     )
 
 
-def _create_test_app() -> App:
+def _create_test_app(deduplicator: EventDeduplicator | None = None) -> App:
     with patch("slack_sdk.web.client.WebClient.auth_test", return_value=_MOCK_AUTH_RESPONSE):
         return create_app(
             _make_settings(),
             request_verification_enabled=False,
+            event_deduplicator=deduplicator if deduplicator is not None else EventDeduplicator(),
         )
 
 
@@ -81,3 +92,101 @@ class TestAppMention:
         response = app.dispatch(request)
 
         assert response.status == 200
+
+
+class TestStatsProviders:
+    def test_channel_member_cache_counters_on_stats(self) -> None:
+        _create_test_app()
+        stats = health_response("/stats")
+        assert stats is not None
+        assert stats["channel_members"] == {"hits": 0, "misses": 0, "revalidations": 0, "evictions": 0, "size": 0}
+
+    def test_notice_cache_counters_on_stats(self, tmp_path: Path) -> None:
+        open_notice_store(replace(_make_settings(), data_dir=str(tmp_path)), None)
+        stats = health_response("/stats")
+        assert stats is not None
+        assert set(stats["notice_cache"]) == {"hits", "misses", "evictions", "size"}
+
+
+def _mention_request(event_id: str = "Ev1234", retry_num: str | None = None) -> BoltRequest:
+    payload = {
+        "token": "test-token",
+        "team_id": "T1234",
+        "event": {"type": "app_mention", "user": "U5678", "text": "<@U0000> hi", "ts": "1.2", "channel": "C1234"},
+        "type": "event_callback",
+        "event_id": event_id,
+        "event_time": 1234567890,
+    }
+    headers: dict[str, str | Sequence[str]] = {"content-type": ["application/json"]}
+    if retry_num is not None:
+        headers["x-slack-retry-num"] = [retry_num]
+        headers["x-slack-retry-reason"] = ["http_timeout"]
+    return BoltRequest(body=json.dumps(payload), headers=headers)
+
+
+class TestEventDedupe:
+    def test_delivery_key(self) -> None:
+        assert delivery_key({"event_id": "Ev1", "trigger_id": "T1"}) == "event:Ev1"
+        assert delivery_key({"trigger_id": "T1"}) == "trigger:T1"
+        assert delivery_key({"type": "url_verification"}) is None
+
+    def test_retried_event_is_dropped_before_handlers(self) -> None:
+        deduplicator = EventDeduplicator()
+        app = _create_test_app(deduplicator)
+
+        with patch("slack_sdk.web.client.WebClient.chat_postMessage") as mock_post:
+            assert app.dispatch(_mention_request()).status == 200
+            assert app.dispatch(_mention_request(retry_num="1")).status == 200
+            assert app.dispatch(_mention_request(event_id="Ev5678")).status == 200
+            time.sleep(0.5)
+
+        assert mock_post.call_count == 2
+        stats = deduplicator.stats()
+        assert (stats.checked, stats.dropped) == (3, 1)
+
+    def test_key_expires_after_ttl(self) -> None:
+        now = [0.0]
+        deduplicator = EventDeduplicator(ttl_seconds=60.0, clock=lambda: now[0])
+
+        assert deduplicator.claim("event:Ev1")
+        now[0] = 59.0
+        assert not deduplicator.claim("event:Ev1")
+        now[0] = 120.0
+        assert deduplicator.claim("event:Ev1")
+        assert deduplicator.stats().size == 1
+
+    def test_memory_is_bounded(self) -> None:
+        deduplicator = EventDeduplicator(max_entries=2)
+        for key in ("a", "b", "c"):
+            deduplicator.claim(key)
+
+        assert deduplicator.stats().size == 2
+        assert deduplicator.claim("a")
+
+    def test_store_survives_restart(self, tmp_path: Path) -> None:
+        first = EventDeduplicator(store=ProcessedEventStore(tmp_path / "events.db"))
+        assert first.claim("event:Ev1")
+
+        restarted = EventDeduplicator(store=ProcessedEventStore(tmp_path / "events.db"))
+        assert not restarted.claim("event:Ev1")
+        assert restarted.stats().dropped == 1
+        assert restarted.claim("event:Ev2")
+
+    def test_store_prunes_expired_keys(self) -> None:
+        store = ProcessedEventStore()
+        assert store.claim("event:Ev1", 100.0, expires_before=0.0)
+        assert not store.claim("event:Ev1", 150.0, expires_before=50.0)
+        assert store.claim("event:Ev1", 300.0, expires_before=200.0)
+        assert store.prune(400.0) == 1
+
+    def test_failed_chain_releases_key(self) -> None:
+        deduplicator = EventDeduplicator()
+        middleware = DedupeMiddleware(deduplicator)
+
+        def fail() -> BoltResponse:
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            middleware.process(req=_mention_request(), resp=BoltResponse(status=200), next=fail)
+        # The retry of a failed delivery is handled again.
+        assert deduplicator.claim("event:Ev1234")
@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from slack_bolt.async_app import AsyncApp
+from slack_bolt.request.async_request import AsyncBoltRequest
+from slack_sdk.web.async_slack_response import AsyncSlackResponse
+
+from src.async_app import create_async_app
+from src.clients.dooray_client import BASE_URL, AsyncDoorayClient, DoorayApiError
+from src.config import RUNTIME_ASYNC, Settings
+from src.services.event_dedupe import EventDeduplicator
+from src.store.async_notice_store import AsyncNoticeStore
+from src.store.notice_store import NoticeStore
+from tests.test_notice import _make_meeting_notice, _make_notice
+
+_ASYNC_CLIENT = "slack_sdk.web.async_client.AsyncWebClient"
+
+_MOCK_AUTH_RESPONSE = AsyncSlackResponse(
+    client=None,
+    http_verb="POST",
+    api_url="https://slack.com/api/auth.test",
+    req_args={},
+    data={"ok": True, "user_id": "U1234", "bot_id": "B1234", "team_id": "T1234"},
+    headers={},
+    status_code=200,
+)
+
+
+def _make_settings() -> Settings:
+    return Settings(
+        slack_bot_token="xoxb-test",
+        slack_app_token="xapp-test",
+        slack_signing_secret="test-secret",
+        runtime=RUNTIME_ASYNC,
+    )
+
+
+def _create_test_app(store: NoticeStore | None = None) -> AsyncApp:
+    return create_async_app(
+        _make_settings(),
+        request_verification_enabled=False,
+        notice_store=store if store is not None else NoticeStore(),
+        event_deduplicator=EventDeduplicator(),
+    )
+
+
+@pytest.fixture(autouse=True)
+def _mock_auth_test() -> Iterator[None]:
+    with patch(f"{_ASYNC_CLIENT}.auth_test", new=AsyncMock(return_value=_MOCK_AUTH_RESPONSE)):
+        yield
+
+
+def _dispatch(app: AsyncApp, payload: dict[str, object]) -> int:
+    async def run() -> int:
+        request = AsyncBoltRequest(body=json.dumps(payload), headers={"content-type": ["application/json"]})
+        response = await app.async_dispatch(request)
+        # Let the listener finish; AsyncApp runs it as a task after acking.
+        for _ in range(50):
+            pending = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            if not pending:
+                break
+            await asyncio.sleep(0.01)
+        return response.status
+
+    return asyncio.run(run())
+
+
+def _action_payload(action_id: str) -> dict[str, object]:
+    return {
+        "type": "block_actions",
+        "user": {"id": "U999"},
+        "channel": {"id": "C1234"},
+        "actions": [{"type": "button", "action_id": action_id}],
+        "trigger_id": "T123",
+        "token": "test-token",
+        "team": {"id": "T1234"},
+    }
+
+
+class TestAsyncRuntime:
+    def test_ping_responds_with_pong(self) -> None:
+        app = _create_test_app()
+
+        async def run() -> str:
+            request = AsyncBoltRequest(
+                body="command=%2Fping&text=&user_id=U1234",
+                headers={"content-type": ["application/x-www-form-urlencoded"]},
+            )
+            response = await app.async_dispatch(request)
+            return response.body
+
+        assert "pong" in asyncio.run(run())
+
+    def test_notice_confirm_marks_read(self) -> None:
+        store = NoticeStore()
+        notice = _make_notice()
+        store.create_notice(notice)
+        app = _create_test_app(store)
+
+        with patch(f"{_ASYNC_CLIENT}.chat_postEphemeral", new=AsyncMock()) as mock_ephemeral:
+            assert _dispatch(app, _action_payload(f"notice_confirm_{notice.notice_id}")) == 200
+            mock_ephemeral.assert_awaited_once()
+
+        retrieved = store.get_notice(notice.notice_id)
+        assert retrieved is not None
+        assert retrieved.is_read_by("U999")
+
+    def test_notice_status_opens_loading_modal_then_updates(self) -> None:
+        store = NoticeStore()
+        notice = _make_meeting_notice()
+        store.create_meeting_notice(notice)
+        app = _create_test_app(store)
+
+        with (
+            patch(f"{_ASYNC_CLIENT}.conversations_members", new=AsyncMock()) as mock_members,
+            patch(f"{_ASYNC_CLIENT}.users_list", new=AsyncMock()) as mock_users_list,
+            patch(f"{_ASYNC_CLIENT}.views_open", new=AsyncMock()) as mock_views_open,
+            patch(f"{_ASYNC_CLIENT}.views_update", new=AsyncMock()) as mock_views_update,
+        ):
+            mock_views_open.return_value = {"view": {"id": "V123", "hash": "h1"}}
+            mock_members.return_value = {"members": ["U001", "UBOT"]}
+            mock_users_list.return_value = {
+                "members": [{"id": "U001", "is_bot": False}, {"id": "UBOT", "is_bot": True}]
+            }
+            assert _dispatch(app, _action_payload(f"notice_status_{notice.notice_id}")) == 200
+
+            loading = mock_views_open.call_args.kwargs["view"]
+            assert "불러오는 중" in loading["blocks"][0]["text"]["text"]
+            call_kwargs = mock_views_update.call_args.kwargs
+            assert call_kwargs["view_id"] == "V123"
+            assert call_kwargs["hash"] == "h1"
+            assert call_kwargs["view"]["title"]["text"] == "참석 현황"
+            assert "UBOT" not in json.dumps(call_kwargs["view"])
+
+    def test_notice_edit_non_author_opens_loading_modal_then_updates(self) -> None:
+        store = NoticeStore()
+        notice = _make_notice()
+        store.create_notice(notice)
+        app = _create_test_app(store)
+
+        with (
+            patch(f"{_ASYNC_CLIENT}.chat_postEphemeral", new=AsyncMock()) as mock_ephemeral,
+            patch(f"{_ASYNC_CLIENT}.views_open", new=AsyncMock()) as mock_views_open,
+            patch(f"{_ASYNC_CLIENT}.views_update", new=AsyncMock()) as mock_views_update,
+        ):
+            mock_views_open.return_value = {"view": {"id": "V123", "hash": "h1"}}
+            assert _dispatch(app, _action_payload(f"notice_edit_{notice.notice_id}")) == 200
+
+            mock_ephemeral.assert_not_awaited()
+            loading = mock_views_open.call_args.kwargs["view"]
+            assert "불러오는 중" in loading["blocks"][0]["text"]["text"]
+            view = mock_views_update.call_args.kwargs["view"]
+            assert "작성자만" in view["blocks"][0]["text"]["text"]
+
+    def test_app_home_opened_publishes_dashboard(self) -> None:
+        store = NoticeStore()
+        store.create_notice(_make_notice())
+        app = _create_test_app(store)
+
+        payload = {
+            "token": "test-token",
+            "team_id": "T1234",
+            "event": {"type": "app_home_opened", "user": "U999", "tab": "home"},
+            "type": "event_callback",
+            "event_id": "Ev1234",
+            "event_time": 1234567890,
+        }
+        with (
+            patch(f"{_ASYNC_CLIENT}.conversations_members", new=AsyncMock(return_value={"members": []})),
+            patch(f"{_ASYNC_CLIENT}.views_publish", new=AsyncMock()) as mock_publish,
+        ):
+            assert _dispatch(app, payload) == 200
+            mock_publish.assert_awaited_once()
+            assert mock_publish.call_args.kwargs["user_id"] == "U999"
+            assert mock_publish.call_args.kwargs["view"]["type"] == "home"
+
+    def test_redelivered_action_is_dropped(self) -> None:
+        store = NoticeStore()
+        notice = _make_notice()
+        store.create_notice(notice)
+        app = _create_test_app(store)
+
+        with patch(f"{_ASYNC_CLIENT}.chat_postEphemeral", new=AsyncMock()) as mock_ephemeral:
+            assert _dispatch(app, _action_payload(f"notice_confirm_{notice.notice_id}")) == 200
+            assert _dispatch(app, _action_payload(f"notice_confirm_{notice.notice_id}")) == 200
+            mock_ephemeral.assert_awaited_once()
+
+
+class TestAsyncNoticeStore:
+    def test_calls_run_on_one_db_thread(self) -> None:
+        store = NoticeStore()
+        async_store = AsyncNoticeStore(store)
+        threads: set[str] = set()
+        original = store.get_notice
+
+        def recording_get_notice(notice_id: str) -> object:
+            threads.add(threading.current_thread().name)
+            return original(notice_id)
+
+        store.get_notice = recording_get_notice  # type: ignore[method-assign,assignment]
+
+        async def run() -> None:
+            await async_store.create_notice(_make_notice())
+            await asyncio.gather(*(async_store.get_notice("notice_123_abcd") for _ in range(10)))
+            await async_store.close()
+
+        asyncio.run(run())
+        assert len(threads) == 1
+        assert next(iter(threads)).startswith("notice-db")
+        assert threading.current_thread().name not in threads
+
+    def test_set_remind_excludes_replaces_list(self) -> None:
+        async_store = AsyncNoticeStore(NoticeStore())
+
+        async def run() -> list[str]:
+            await async_store.set_remind_excludes(["U1", "U2"])
+            await async_store.set_remind_excludes(["U2", "U3"])
+            return sorted(await async_store.list_remind_excludes())
+
+        assert asyncio.run(run()) == ["U2", "U3"]
+
+
+class TestAsyncDoorayClient:
+    def test_list_my_tasks_parses_response(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.path == "/project/v1/projects/P1/posts"
+            return httpx.Response(
+                200, json={"result": [{"id": "TASK_1", "subject": "업무", "workflowClass": "working"}]}
+            )
+
+        async def run() -> list[str]:
+            client = AsyncDoorayClient(
+                "token", http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url=BASE_URL)
+            )
+            try:
+                tasks = await client.list_my_tasks("M1", "P1")
+            finally:
+                await client.close()
+            return [task.id for task in tasks]
+
+        assert asyncio.run(run()) == ["TASK_1"]
+
+    def test_error_status_raises(self) -> None:
+        transport = httpx.MockTransport(lambda request: httpx.Response(500, text="boom"))
+
+        async def run() -> None:
+            client = AsyncDoorayClient("token", http_client=httpx.AsyncClient(transport=transport, base_url=BASE_URL))
+            await client.search_members("홍길동")
+
+        with pytest.raises(DoorayApiError):
+            asyncio.run(run())
+
+
+class TestRuntimeSetting:
+    def test_runtime_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("SLACK_BOT_TOKEN", "xoxb-test")
+        monkeypatch.setenv("SLACK_APP_TOKEN", "xapp-test")
+        monkeypatch.setenv("SLACK_SIGNING_SECRET", "test-secret")
+        monkeypatch.setenv("RUNTIME", "ASYNC")
+        assert Settings.from_env().runtime == RUNTIME_ASYNC
+
+    def test_invalid_runtime(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("SLACK_BOT_TOKEN", "xoxb-test")
+        monkeypatch.setenv("SLACK_APP_TOKEN", "xapp-test")
+        monkeypatch.setenv("SLACK_SIGNING_SECRET", "test-secret")
+        monkeypatch.setenv("RUNTIME", "gevent")
+        with pytest.raises(ValueError, match="RUNTIME"):
+            Settings.from_env()
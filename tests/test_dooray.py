@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import json
+import sqlite3
 import time
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import httpx
+import pytest
 from slack_bolt import App, BoltRequest
 from slack_sdk.web import SlackResponse
 
@@ -18,7 +21,10 @@ from src.clients.dooray_client import (
 )
 from src.config import Settings
 from src.services.dooray_service import DoorayService, DoorayServiceError, UserNotLinkedError
+from src.services.event_dedupe import EventDeduplicator
+from src.store.connection import ConnectionPool
 from src.store.dooray_store import DoorayStore
+from src.store.notice_store import NoticeStore
 from src.views.dooray_views import (
     build_dooray_create_task_modal,
     build_dooray_error_modal,
@@ -28,6 +34,7 @@ from src.views.dooray_views import (
     build_dooray_setup_select_modal,
     build_dooray_task_list_modal,
 )
+from tests.test_notice import _make_notice
 
 _SAMPLE_MEMBERS = [
     DoorayMember(id="M1", name="홍길동", email="hong@test.com"),
@@ -78,6 +85,7 @@ def _create_test_app(
             request_verification_enabled=False,
             dooray_client=dooray_client,
             dooray_store=dooray_store,
+            event_deduplicator=EventDeduplicator(),
         )
 
 
@@ -239,6 +247,84 @@ class TestDoorayStore:
         assert store.get_dooray_member_id("U1234") is None
         store.close()
 
+    def test_file_database_reads_through_pool(self, tmp_path: Path) -> None:
+        store = DoorayStore(tmp_path / "dooray.db")
+        assert store._pool.writer.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        store.set_user_mapping("U1234", "M5678")
+        assert store.get_dooray_member_id("U1234") == "M5678"
+        store.close()
+
+
+class TestUnifiedStorage:
+    def test_stores_share_attached_pool(self, tmp_path: Path) -> None:
+        pool = ConnectionPool(tmp_path / "notices.db", attach={"dooray": tmp_path / "dooray.db"})
+        notices = NoticeStore(pool=pool)
+        dooray = DoorayStore(pool=pool, schema="dooray")
+        dooray.set_user_mapping("U1234", "M5678")
+        assert dooray.get_dooray_member_id("U1234") == "M5678"
+
+        tables = {row[0] for row in pool.writer.execute("SELECT name FROM dooray.sqlite_master WHERE type = 'table'")}
+        assert "dooray_user_mapping" in tables
+        for schema in pool.schemas:
+            assert pool.writer.execute(f"PRAGMA {schema}.journal_mode").fetchone()[0] == "wal"
+
+        notices.close()
+        dooray.close()
+        # Neither store owns the pool, so it is still usable.
+        assert pool.writer.execute("SELECT 1").fetchone()[0] == 1
+        pool.close()
+
+    def test_cross_schema_join(self, tmp_path: Path) -> None:
+        pool = ConnectionPool(tmp_path / "notices.db", attach={"dooray": tmp_path / "dooray.db"})
+        notices = NoticeStore(pool=pool)
+        dooray = DoorayStore(pool=pool, schema="dooray")
+        notices.create_notice(_make_notice())
+        notices.mark_read("notice_123_abcd", "U1234")
+        dooray.set_user_mapping("U1234", "M5678")
+
+        with pool.read() as conn:
+            rows = conn.execute(
+                "SELECT m.dooray_member_id FROM notice_responses r "
+                "JOIN dooray.dooray_user_mapping m ON m.slack_user_id = r.user_id WHERE r.notice_id = ?",
+                ("notice_123_abcd",),
+            ).fetchall()
+        assert [row[0] for row in rows] == ["M5678"]
+        pool.close()
+
+    def test_backup_copies_every_schema(self, tmp_path: Path) -> None:
+        pool = ConnectionPool(tmp_path / "notices.db", attach={"dooray": tmp_path / "dooray.db"})
+        NoticeStore(pool=pool).create_notice(_make_notice())
+        DoorayStore(pool=pool, schema="dooray").set_user_mapping("U1234", "M5678")
+
+        files = pool.backup(tmp_path / "backup")
+        assert [f.name for f in files] == ["notices.db", "dooray.db"]
+        restored = DoorayStore(tmp_path / "backup" / "dooray.db")
+        assert restored.get_dooray_member_id("U1234") == "M5678"
+        restored.close()
+        pool.close()
+
+    def test_memory_attach_requires_memory_main(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError):
+            ConnectionPool(tmp_path / "notices.db", attach={"dooray": ":memory:"})
+
+    def test_create_app_unified_mode(self, tmp_path: Path) -> None:
+        settings = _make_settings(data_dir=str(tmp_path), storage_mode="unified")
+        dooray_client = DoorayClient("test-token", http_client=MagicMock(spec=httpx.Client))
+        with patch("slack_sdk.web.client.WebClient.auth_test", return_value=_MOCK_AUTH_RESPONSE):
+            create_app(settings, request_verification_enabled=False, dooray_client=dooray_client)
+        conn = sqlite3.connect(tmp_path / "dooray.db")
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        conn.close()
+        assert "dooray_user_mapping" in tables
+
+    def test_invalid_storage_mode(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("SLACK_BOT_TOKEN", "xoxb-test")
+        monkeypatch.setenv("SLACK_APP_TOKEN", "xapp-test")
+        monkeypatch.setenv("SLACK_SIGNING_SECRET", "test-secret")
+        monkeypatch.setenv("STORAGE_MODE", "shared")
+        with pytest.raises(ValueError, match="STORAGE_MODE"):
+            Settings.from_env()
+
 
 # --- DoorayViews Tests ---
 
@@ -770,7 +856,7 @@ class TestDoorayDisabled:
     def test_dooray_disabled_when_no_token(self) -> None:
         settings = _make_settings(dooray_api_token="", dooray_project_id="")
         with patch("slack_sdk.web.client.WebClient.auth_test", return_value=_MOCK_AUTH_RESPONSE):
-            app = create_app(settings, request_verification_enabled=False)
+            app = create_app(settings, request_verification_enabled=False, event_deduplicator=EventDeduplicator())
         request = BoltRequest(
             body="command=%2F%EB%82%B4%EC%97%85%EB%AC%B4&text=&user_id=U1234&trigger_id=T123&channel_id=C1234",
             headers={"content-type": ["application/x-www-form-urlencoded"]},
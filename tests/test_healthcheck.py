@@ -3,7 +3,7 @@ from __future__ import annotations
 import json
 import urllib.request
 
-from src.healthcheck import start_healthcheck_server
+from src.healthcheck import register_stats, start_healthcheck_server
 
 
 def test_healthz_returns_ok() -> None:
@@ -33,6 +33,20 @@ def test_readyz_returns_ready() -> None:
         server.shutdown()
 
 
+def test_stats_returns_registered_counters() -> None:
+    """GET /stats should return every registered provider's counters."""
+    register_stats("event_dedupe", lambda: {"checked": 3, "dropped": 1})
+    server = start_healthcheck_server(port=0)
+    try:
+        port = server.server_address[1]
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/stats") as resp:
+            assert resp.status == 200
+            data = json.loads(resp.read())
+            assert data["event_dedupe"] == {"checked": 3, "dropped": 1}
+    finally:
+        server.shutdown()
+
+
 def test_unknown_path_returns_404() -> None:
     """GET on an unknown path should return 404."""
     server = start_healthcheck_server(port=0)
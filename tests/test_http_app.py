@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import hashlib
+import hmac
+import io
+import json
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+from urllib.parse import urlencode
+
+import pytest
+from slack_sdk.web import SlackResponse
+
+from src.app import create_app
+from src.config import Settings
+from src.http_app import SLACK_EVENTS_PATH, SlackHTTPServer, create_wsgi_app
+from src.services.event_dedupe import EventDeduplicator
+from src.store.notice_store import NoticeStore
+
+_SIGNING_SECRET = "test-secret"
+
+_MOCK_AUTH_RESPONSE = SlackResponse(
+    client=None,
+    http_verb="POST",
+    api_url="https://slack.com/api/auth.test",
+    req_args={},
+    data={"ok": True, "user_id": "U1234", "bot_id": "B1234", "team_id": "T1234"},
+    headers={},
+    status_code=200,
+)
+
+
+def _make_settings(tmp_path: Path, workers: int = 1) -> Settings:
+    return Settings(
+        slack_bot_token="xoxb-test",
+        slack_app_token="",
+        slack_signing_secret=_SIGNING_SECRET,
+        data_dir=str(tmp_path),
+        workers=workers,
+        transport="http",
+    )
+
+
+def _create_wsgi_app(tmp_path: Path) -> Any:
+    with patch("slack_sdk.web.client.WebClient.auth_test", return_value=_MOCK_AUTH_RESPONSE):
+        app = create_app(
+            _make_settings(tmp_path),
+            notice_store=NoticeStore(),
+            event_deduplicator=EventDeduplicator(),
+        )
+    return create_wsgi_app(app)
+
+
+def _sign(body: str, timestamp: str, secret: str = _SIGNING_SECRET) -> str:
+    digest = hmac.new(secret.encode(), f"v0:{timestamp}:{body}".encode(), hashlib.sha256).hexdigest()
+    return f"v0={digest}"
+
+
+def _call(
+    wsgi_app: Any, method: str, path: str, body: str = "", headers: dict[str, str] | None = None
+) -> tuple[int, bytes]:
+    raw = body.encode()
+    environ: dict[str, Any] = {
+        "REQUEST_METHOD": method,
+        "PATH_INFO": path,
+        "QUERY_STRING": "",
+        "SERVER_PROTOCOL": "HTTP/1.1",
+        "CONTENT_TYPE": "application/x-www-form-urlencoded",
+        "CONTENT_LENGTH": str(len(raw)),
+        "wsgi.input": io.BytesIO(raw),
+    }
+    for name, value in (headers or {}).items():
+        environ[f"HTTP_{name.upper().replace('-', '_')}"] = value
+    status: list[str] = []
+
+    def start_response(status_line: str, response_headers: list[tuple[str, str]]) -> None:
+        status.append(status_line)
+
+    payload = b"".join(wsgi_app(environ, start_response))
+    return int(status[0].split()[0]), payload
+
+
+def _ping_body() -> str:
+    return urlencode(
+        {
+            "command": "/ping",
+            "text": "",
+            "user_id": "U5678",
+            "channel_id": "C1234",
+            "team_id": "T1234",
+            "trigger_id": "trigger-http",
+            "response_url": "https://hooks.slack.com/commands/T1234/1/x",
+        }
+    )
+
+
+class TestHTTPTransport:
+    def test_health_routes_on_same_app(self, tmp_path: Path) -> None:
+        wsgi_app = _create_wsgi_app(tmp_path)
+
+        status, body = _call(wsgi_app, "GET", "/healthz")
+        assert status == 200
+        assert json.loads(body)["status"] == "ok"
+        status, body = _call(wsgi_app, "GET", "/readyz")
+        assert (status, json.loads(body)) == (200, {"status": "ready"})
+        status, _ = _call(wsgi_app, "GET", "/unknown")
+        assert status == 404
+        status, _ = _call(wsgi_app, "GET", SLACK_EVENTS_PATH)
+        assert status == 405
+
+    def test_signed_command_is_acked(self, tmp_path: Path) -> None:
+        wsgi_app = _create_wsgi_app(tmp_path)
+        body = _ping_body()
+        timestamp = str(int(time.time()))
+
+        status, payload = _call(
+            wsgi_app,
+            "POST",
+            SLACK_EVENTS_PATH,
+            body,
+            {"X-Slack-Request-Timestamp": timestamp, "X-Slack-Signature": _sign(body, timestamp)},
+        )
+
+        assert status == 200
+        assert payload.startswith(b"pong")
+
+    def test_unsigned_or_forged_request_is_rejected(self, tmp_path: Path) -> None:
+        wsgi_app = _create_wsgi_app(tmp_path)
+        body = _ping_body()
+        timestamp = str(int(time.time()))
+
+        status, _ = _call(wsgi_app, "POST", SLACK_EVENTS_PATH, body)
+        assert status == 401
+        forged = {"X-Slack-Request-Timestamp": timestamp, "X-Slack-Signature": _sign(body, timestamp, "wrong")}
+        status, _ = _call(wsgi_app, "POST", SLACK_EVENTS_PATH, body, forged)
+        assert status == 401
+
+    def test_server_config(self, tmp_path: Path) -> None:
+        server = SlackHTTPServer(_make_settings(tmp_path, workers=3), create_app)
+
+        assert server.cfg.bind == ["0.0.0.0:8080"]
+        assert server.cfg.workers == 3
+        assert server.cfg.worker_class_str == "gthread"
+        assert server.cfg.preload_app is False
+
+
+class TestTransportSetting:
+    def test_http_transport_does_not_need_app_token(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("SLACK_BOT_TOKEN", "xoxb-test")
+        monkeypatch.delenv("SLACK_APP_TOKEN", raising=False)
+        monkeypatch.setenv("SLACK_SIGNING_SECRET", "test-secret")
+        monkeypatch.setenv("TRANSPORT", "HTTP")
+        assert Settings.from_env().transport == "http"
+
+    def test_invalid_transport(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("SLACK_BOT_TOKEN", "xoxb-test")
+        monkeypatch.setenv("SLACK_APP_TOKEN", "xapp-test")
+        monkeypatch.setenv("SLACK_SIGNING_SECRET", "test-secret")
+        monkeypatch.setenv("TRANSPORT", "grpc")
+        with pytest.raises(ValueError, match="TRANSPORT"):
+            Settings.from_env()
+
+    def test_http_transport_requires_sync_runtime(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("SLACK_BOT_TOKEN", "xoxb-test")
+        monkeypatch.setenv("SLACK_SIGNING_SECRET", "test-secret")
+        monkeypatch.setenv("TRANSPORT", "http")
+        monkeypatch.setenv("RUNTIME", "async")
+        with pytest.raises(ValueError, match="RUNTIME"):
+            Settings.from_env()
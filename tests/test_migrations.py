@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from src.store import notice_store
+from src.store.connection import ConnectionPool
+from src.store.dooray_store import DoorayStore
+from src.store.migrations import Migration, migrate, schema_version
+from src.store.notice_store import NoticeStore
+
+_BASE = Migration(1, "items", "CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT NOT NULL);")
+_ADD_UPPER = Migration(
+    2,
+    "items.upper_name",
+    "ALTER TABLE {schema}.items ADD COLUMN upper_name TEXT;",
+    backfill=(
+        "UPDATE {schema}.items SET upper_name = upper(name) "
+        "WHERE id IN (SELECT id FROM {schema}.items WHERE upper_name IS NULL LIMIT :batch_size)"
+    ),
+)
+
+
+def _pool_with_items(count: int) -> ConnectionPool:
+    pool = ConnectionPool()
+    migrate(pool, [_BASE])
+    with pool.write() as conn:
+        conn.executemany("INSERT INTO items (name) VALUES (?)", [(f"item{i}",) for i in range(count)])
+    return pool
+
+
+class TestMigrations:
+    def test_new_store_is_at_latest_version(self, tmp_path: Path) -> None:
+        store = NoticeStore(tmp_path / "notices.db")
+        assert schema_version(store._pool.writer) == len(notice_store._MIGRATIONS)
+        store.close()
+
+    def test_current_schema_only_reads(self) -> None:
+        pool = ConnectionPool()
+        migrate(pool, [_BASE])
+        statements: list[str] = []
+        pool.writer.set_trace_callback(statements.append)
+        assert migrate(pool, [_BASE]) == 1
+        pool.writer.set_trace_callback(None)
+        assert all(s.split()[0].upper() in {"PRAGMA", "SELECT"} for s in statements)
+        pool.close()
+
+    def test_backfill_runs_in_batches(self) -> None:
+        pool = _pool_with_items(1200)
+        updates: list[str] = []
+        pool.writer.set_trace_callback(lambda s: updates.append(s) if s.upper().startswith("UPDATE") else None)
+        assert migrate(pool, [_BASE, _ADD_UPPER], batch_size=500) == 2
+        pool.writer.set_trace_callback(None)
+
+        assert len(updates) == 3
+        assert pool.writer.execute("SELECT COUNT(*) FROM items WHERE upper_name IS NULL").fetchone()[0] == 0
+        assert pool.writer.execute("SELECT upper_name FROM items WHERE id = 1").fetchone()[0] == "ITEM0"
+        assert pool.writer.execute("SELECT COUNT(*) FROM schema_backfills").fetchone()[0] == 0
+        pool.close()
+
+    def test_interrupted_backfill_resumes(self) -> None:
+        pool = _pool_with_items(30)
+        calls = 0
+
+        def step(conn: sqlite3.Connection, batch_size: int) -> int:
+            nonlocal calls
+            calls += 1
+            if calls == 2:
+                msg = "stopped"
+                raise RuntimeError(msg)
+            return conn.execute(
+                "UPDATE items SET upper_name = upper(name) "
+                "WHERE id IN (SELECT id FROM items WHERE upper_name IS NULL LIMIT ?)",
+                (batch_size,),
+            ).rowcount
+
+        add_upper = Migration(2, "items.upper_name", "ALTER TABLE items ADD COLUMN upper_name TEXT;", backfill=step)
+        with pytest.raises(RuntimeError):
+            migrate(pool, [_BASE, add_upper], batch_size=10)
+        assert schema_version(pool.writer) == 2
+        assert pool.writer.execute("SELECT COUNT(*) FROM items WHERE upper_name IS NULL").fetchone()[0] == 20
+
+        migrate(pool, [_BASE, add_upper], batch_size=10)
+        assert pool.writer.execute("SELECT COUNT(*) FROM items WHERE upper_name IS NULL").fetchone()[0] == 0
+        assert pool.writer.execute("SELECT COUNT(*) FROM schema_backfills").fetchone()[0] == 0
+        pool.close()
+
+    def test_failed_script_rolls_back(self) -> None:
+        pool = ConnectionPool()
+        migrate(pool, [_BASE])
+        broken = Migration(2, "broken", "CREATE TABLE other (id INTEGER);\nCREATE TABLE items (id INTEGER);")
+        with pytest.raises(sqlite3.OperationalError):
+            migrate(pool, [_BASE, broken])
+        assert schema_version(pool.writer) == 1
+        tables = {row[0] for row in pool.writer.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        assert "other" not in tables
+        pool.close()
+
+    def test_migrations_must_be_numbered(self) -> None:
+        pool = ConnectionPool()
+        with pytest.raises(ValueError):
+            migrate(pool, [_ADD_UPPER])
+        pool.close()
+
+    def test_newer_database_is_left_alone(self) -> None:
+        pool = ConnectionPool()
+        migrate(pool, [_BASE, Migration(2, "noop")])
+        assert migrate(pool, [_BASE]) == 2
+        pool.close()
+
+    def test_attached_schema_has_own_version(self, tmp_path: Path) -> None:
+        pool = ConnectionPool(tmp_path / "notices.db", attach={"dooray": tmp_path / "dooray.db"})
+        DoorayStore(pool=pool, schema="dooray")
+        assert schema_version(pool.writer, "dooray") == 1
+        assert schema_version(pool.writer) == 0
+        pool.close()
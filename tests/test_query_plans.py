@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import re
+import sqlite3
+import time
+from pathlib import Path
+
+import pytest
+
+from src.store.models import AttendanceStatus, ReminderKind
+from src.store.notice_store import NoticeStore
+from tests.test_notice import _make_meeting_notice, _make_notice
+
+# Tables whose queries read every row by design (e.g. listing the whole exclude list).
+_FULL_READ_TABLES = {"remind_excludes"}
+
+
+def _exercise_store(store: NoticeStore) -> list[str]:
+    """Call every store query once and return the statements SQLite executed."""
+    statements: list[str] = []
+    store._pool.writer.set_trace_callback(statements.append)
+
+    store.create_notice(_make_notice("notice_001_aaaa"))
+    store.create_meeting_notice(_make_meeting_notice("notice_002_bbbb", created_at=1707350500.0))
+    store.update_notice("notice_001_aaaa", "제목", "내용")
+    store.update_meeting_notice("notice_002_bbbb", "제목", "1707440000", "회의실", "안건")
+    store.update_message_ts("notice_001_aaaa", "1707350400.000009")
+    store.mark_read("notice_001_aaaa", "U001")
+    store.set_attendance("notice_002_bbbb", "U001", AttendanceStatus.ONLINE)
+
+    store.get_notice("notice_001_aaaa")
+    store.get_notices(["notice_001_aaaa", "notice_002_bbbb"])
+    store.list_notices()
+    store.list_notices(channel_id="C1234", offset=1)
+    page = store.list_notices_page(limit=1)
+    store.list_notices_page(limit=1, cursor=page.next_cursor)
+    store.list_notices_page(limit=1, channel_id="C1234", cursor=page.next_cursor, with_responses=False)
+    store.count_responses(["notice_001_aaaa", "notice_002_bbbb"])
+    store.count_notices()
+    store.count_notices(channel_id="C1234")
+    search = store.search_notices("테스트", limit=1)
+    store.search_notices("테스트", limit=1, cursor=search.next_cursor)
+    store.count_search_results("테스트")
+
+    store.add_remind_exclude("U009")
+    store.list_remind_excludes()
+    store.remove_remind_exclude("U009")
+
+    job = store.create_reminder_job(
+        notice_id="notice_001_aaaa",
+        kind=ReminderKind.UNREAD,
+        text="리마인드",
+        requested_by="U1234",
+        feedback_channel_id="",
+        user_ids=["U001", "U002"],
+    )
+    store.claim_reminder_deliveries(1)
+    store.complete_reminder_delivery(job.job_id, "U001", sent=True)
+    store.requeue_claimed_reminder_deliveries(time.time() - 300)
+    store.requeue_claimed_reminder_deliveries()
+    store.finish_reminder_jobs()
+    store.get_reminder_job(job.job_id)
+    store.list_active_reminder_jobs()
+
+    store._pool.writer.set_trace_callback(None)
+    return [" ".join(s.split()) for s in statements if s.split()[0].upper() in {"SELECT", "UPDATE", "DELETE"}]
+
+
+def _plan(store: NoticeStore, statement: str) -> list[str]:
+    return [str(row[3]) for row in store._pool.writer.execute(f"EXPLAIN QUERY PLAN {statement}")]
+
+
+@pytest.fixture
+def store() -> NoticeStore:
+    # Keep responses buffered so reads also take the pending-response overlay path.
+    store = NoticeStore(response_flush_interval=60.0)
+    yield store  # type: ignore[misc]
+    store.close()
+
+
+@pytest.fixture
+def plans(store: NoticeStore) -> dict[str, list[str]]:
+    return {statement: _plan(store, statement) for statement in _exercise_store(store)}
+
+
+def _plan_for(plans: dict[str, list[str]], pattern: str) -> list[str]:
+    matches = [plan for statement, plan in plans.items() if re.search(pattern, statement)]
+    assert matches, f"no executed statement matches {pattern!r}"
+    return matches[0]
+
+
+class TestQueryPlans:
+    def test_no_full_table_scans(self, plans: dict[str, list[str]]) -> None:
+        for statement, plan in plans.items():
+            for line in plan:
+                match = re.fullmatch(r"SCAN (\w+)", line)
+                assert match is None or match.group(1) in _FULL_READ_TABLES, f"{statement}\n  -> {plan}"
+
+    def test_notice_listings_never_sort_in_memory(self, plans: dict[str, list[str]]) -> None:
+        for statement, plan in plans.items():
+            # bm25 ranking over notices_fts has to sort its matches, so only the table itself is checked.
+            if re.search(r"FROM notices\b", statement) and "ORDER BY" in statement:
+                assert "USE TEMP B-TREE FOR ORDER BY" not in plan, f"{statement}\n  -> {plan}"
+
+    def test_keyset_page_uses_created_at_index(self, plans: dict[str, list[str]]) -> None:
+        plan = _plan_for(plans, r"FROM notices WHERE \(created_at, id\) <")
+        assert any("idx_notices_created_at" in line for line in plan)
+
+    def test_channel_keyset_page_uses_channel_index(self, plans: dict[str, list[str]]) -> None:
+        plan = _plan_for(plans, r"FROM notices WHERE channel_id = 'C1234' AND \(created_at, id\) <")
+        assert any("idx_notices_channel_created_at (channel_id=? AND (created_at,id)<(?,?))" in line for line in plan)
+
+    def test_response_queries_use_covering_index(self, plans: dict[str, list[str]]) -> None:
+        plan = _plan_for(plans, r"SELECT notice_id, user_id, response_type")
+        assert plan == ["SEARCH notice_responses USING COVERING INDEX idx_notice_responses_type (notice_id=?)"]
+
+    def test_response_counts_read_counter_rows(self, plans: dict[str, list[str]]) -> None:
+        plan = _plan_for(plans, r"FROM notice_response_counts")
+        assert plan == ["SEARCH notice_response_counts USING PRIMARY KEY (notice_id=?)"]
+
+    def test_reminder_claim_uses_status_index(self, plans: dict[str, list[str]]) -> None:
+        plan = _plan_for(plans, r"FROM reminder_deliveries d JOIN reminder_jobs")
+        assert any("idx_reminder_deliveries_status" in line for line in plan)
+
+
+class TestIndexCreation:
+    def test_indexes_added_to_existing_database(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "notices.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            """CREATE TABLE notices (
+                id TEXT PRIMARY KEY, type TEXT NOT NULL, title TEXT NOT NULL, content TEXT NOT NULL,
+                channel_id TEXT NOT NULL, message_ts TEXT NOT NULL DEFAULT '', author_id TEXT NOT NULL,
+                created_at REAL NOT NULL, meeting_datetime TEXT, location TEXT, agenda TEXT
+            )"""
+        )
+        conn.close()
+
+        NoticeStore(db_path).close()
+        store = NoticeStore(db_path)
+        names = {
+            row["name"]
+            for row in store._pool.writer.execute("SELECT name FROM sqlite_master WHERE type = 'index'").fetchall()
+        }
+        assert {
+            "idx_notices_created_at",
+            "idx_notices_channel_created_at",
+            "idx_notice_responses_type",
+        } <= names
+        store.close()
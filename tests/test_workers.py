@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from slack_sdk.web import SlackResponse
+
+from src.app import create_app
+from src.config import Settings
+from src.healthcheck import register_stats
+from src.services.event_dedupe import EventDeduplicator
+from src.services.leader_election import LEADER_LEASE, LeaderElector, default_holder
+from src.services.reminder_dispatcher import ReminderDispatcher
+from src.services.reminder_worker import ReminderWorker
+from src.store.lease_store import LeaseStore
+from src.store.notice_store import NoticeStore
+from src.workers import WorkerSupervisor
+
+_MOCK_AUTH_RESPONSE = SlackResponse(
+    client=None,
+    http_verb="POST",
+    api_url="https://slack.com/api/auth.test",
+    req_args={},
+    data={"ok": True, "user_id": "U1234", "bot_id": "B1234", "team_id": "T1234"},
+    headers={},
+    status_code=200,
+)
+
+
+def _make_settings(tmp_path: Path, workers: int = 2) -> Settings:
+    return Settings(
+        slack_bot_token="xoxb-test",
+        slack_app_token="xapp-test",
+        slack_signing_secret="test-secret",
+        data_dir=str(tmp_path),
+        workers=workers,
+    )
+
+
+def _exit_immediately(settings: Settings) -> None:
+    return
+
+
+def _serve_with_stats(settings: Settings) -> None:
+    register_stats("probe", lambda: {"pid": os.getpid()})
+    time.sleep(30)
+
+
+class TestLeaseStore:
+    def test_only_one_holder_until_expiry(self, tmp_path: Path) -> None:
+        first = LeaseStore(tmp_path / "leases.db")
+        second = LeaseStore(tmp_path / "leases.db")
+
+        assert first.try_acquire("jobs", "a", now=100.0, ttl=10.0)
+        assert not second.try_acquire("jobs", "b", now=105.0, ttl=10.0)
+        assert first.try_acquire("jobs", "a", now=105.0, ttl=10.0)
+        assert not second.try_acquire("jobs", "b", now=114.0, ttl=10.0)
+        assert second.try_acquire("jobs", "b", now=115.0, ttl=10.0)
+        assert first.holder("jobs", now=116.0) == "b"
+
+    def test_release_frees_lease_for_its_holder_only(self) -> None:
+        store = LeaseStore()
+        store.try_acquire("jobs", "a", now=100.0, ttl=10.0)
+        store.release("jobs", "b")
+        assert store.holder("jobs", now=101.0) == "a"
+        store.release("jobs", "a")
+        assert store.holder("jobs", now=101.0) is None
+        assert store.try_acquire("jobs", "b", now=101.0, ttl=10.0)
+
+
+class TestLeaderElector:
+    def test_single_leader_runs_jobs_and_hands_over(self, tmp_path: Path) -> None:
+        jobs_a, jobs_b = MagicMock(), MagicMock()
+        a = LeaderElector(LeaseStore(tmp_path / "leases.db"), [jobs_a], holder="a")
+        b = LeaderElector(LeaseStore(tmp_path / "leases.db"), [jobs_b], holder="b")
+
+        assert a.campaign_once()
+        assert not b.campaign_once()
+        jobs_a.start.assert_called_once()
+        jobs_b.start.assert_not_called()
+
+        a.stop()
+        jobs_a.stop.assert_called_once()
+        assert b.campaign_once()
+        jobs_b.start.assert_called_once()
+
+    def test_leader_that_loses_lease_stops_jobs(self) -> None:
+        store = LeaseStore()
+        jobs = MagicMock()
+        elector = LeaderElector(store, [jobs], holder="a", ttl=0.2, renew_interval=0.1)
+
+        assert elector.campaign_once()
+        time.sleep(0.25)
+        assert store.try_acquire(LEADER_LEASE, "b", now=time.time(), ttl=10.0)
+        assert not elector.campaign_once()
+        jobs.stop.assert_called_once()
+
+    def test_leader_retries_job_start_on_renewal(self) -> None:
+        jobs = MagicMock()
+        jobs.start.side_effect = [RuntimeError("still stopping"), None]
+        elector = LeaderElector(LeaseStore(), [jobs], holder="a")
+
+        assert elector.campaign_once()
+        assert elector.campaign_once()
+        assert jobs.start.call_count == 2
+
+    def test_renew_interval_must_be_shorter_than_ttl(self) -> None:
+        with pytest.raises(ValueError, match="renew_interval"):
+            LeaderElector(LeaseStore(), [], ttl=5.0, renew_interval=5.0)
+
+
+class TestLeaderOnlyReminderWorker:
+    def test_notify_does_not_start_follower_worker(self) -> None:
+        worker = ReminderWorker(NoticeStore(), MagicMock(), ReminderDispatcher(), start_on_notify=False)
+        worker.notify()
+        assert worker._thread is None
+
+    def test_worker_restarts_after_stop(self) -> None:
+        worker = ReminderWorker(NoticeStore(), MagicMock(), ReminderDispatcher(), poll_interval=0.05)
+        worker.start()
+        worker.stop(1.0)
+        assert worker._thread is None
+        worker.start()
+        assert worker._thread is not None and worker._thread.is_alive()
+        worker.stop(1.0)
+
+    def test_create_app_campaigns_for_leader_lease(self, tmp_path: Path) -> None:
+        with patch("slack_sdk.web.client.WebClient.auth_test", return_value=_MOCK_AUTH_RESPONSE):
+            create_app(
+                _make_settings(tmp_path),
+                request_verification_enabled=False,
+                notice_store=NoticeStore(),
+                event_deduplicator=EventDeduplicator(),
+            )
+        leases = LeaseStore(tmp_path / "leases.db")
+        deadline = time.monotonic() + 2.0
+        while leases.holder(LEADER_LEASE, time.time()) is None and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert leases.holder(LEADER_LEASE, time.time()) == default_holder()
+
+
+class TestWorkerSupervisor:
+    def test_restarts_exited_workers(self, tmp_path: Path) -> None:
+        supervisor = WorkerSupervisor(_make_settings(tmp_path), _exit_immediately)
+        with patch("src.workers.RESTART_DELAY", 0.0):
+            supervisor.start()
+            try:
+                deadline = time.monotonic() + 20.0
+                while supervisor.stats()["restarts"] < 2 and time.monotonic() < deadline:
+                    supervisor.supervise_once()
+                    time.sleep(0.05)
+                stats = supervisor.stats()
+            finally:
+                supervisor.stop()
+
+        assert stats["workers"] == 2
+        assert stats["restarts"] >= 2
+        assert stats["leader"] is None
+
+    def test_serves_worker_stats_from_supervisor(self, tmp_path: Path) -> None:
+        supervisor = WorkerSupervisor(_make_settings(tmp_path), _serve_with_stats, stats_interval=0.1)
+        supervisor.start()
+        try:
+            deadline = time.monotonic() + 20.0
+            while len(supervisor.worker_stats()) < 2 and time.monotonic() < deadline:
+                supervisor.supervise_once()
+                time.sleep(0.05)
+            reported = supervisor.worker_stats()
+            pids = supervisor.stats()["pids"]
+        finally:
+            supervisor.stop()
+
+        assert sorted(reported) == ["0", "1"]
+        assert sorted(stats["probe"]["pid"] for stats in reported.values()) == sorted(pids)
+
+
+class TestWorkersSetting:
+    def test_invalid_workers(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("SLACK_BOT_TOKEN", "xoxb-test")
+        monkeypatch.setenv("SLACK_APP_TOKEN", "xapp-test")
+        monkeypatch.setenv("SLACK_SIGNING_SECRET", "test-secret")
+        monkeypatch.setenv("WORKERS", "0")
+        with pytest.raises(ValueError, match="WORKERS"):
+            Settings.from_env()